@@ -0,0 +1,37 @@
+/**
+ * On-demand bodies for collapsed reference sections.
+ *
+ * A `details.lazy-details` element carries its lines as a JSON array in
+ * `data-lines` and names its (initially empty) body div in
+ * `data-body-id`.  Opening the section renders one span per line into
+ * the body; closing it empties the body again, so the component tree
+ * only holds those nodes while they are visible.
+ */
+(function () {
+    "use strict";
+
+    function render(details) {
+        var dc = window.dash_clientside;
+        if (!dc || typeof dc.set_props !== "function") return;
+        var children = [];
+        if (details.open) {
+            var lines = JSON.parse(details.dataset.lines || "[]");
+            children = lines.map(function (line) {
+                return {
+                    type: "Span",
+                    namespace: "dash_html_components",
+                    props: { children: line },
+                };
+            });
+        }
+        dc.set_props(details.dataset.bodyId, { children: children });
+    }
+
+    // "toggle" does not bubble, so listen in the capture phase.
+    document.addEventListener("toggle", function (e) {
+        var el = e.target;
+        if (el && el.classList && el.classList.contains("lazy-details")) {
+            render(el);
+        }
+    }, true);
+})();
@@ -0,0 +1,83 @@
+/**
+ * Viewport-gated rendering for below-the-fold graphs.
+ *
+ * Graphs wrapped by `_lazy_graph()` in discovery_stats.py sit inside a
+ * `.lazy-graph` div carrying `data-graph-id`.  Their figure callbacks
+ * take the companion `visible-<graph id>` store as an Input and skip
+ * the figure while it is false, so Plotly never lays out charts the
+ * user has not scrolled to.
+ *
+ *   within 1 viewport of view   → store set to true (figure is built)
+ *   more than 4 viewports away  → store set to false (updates paused)
+ *
+ * Tab switches remount the wrappers, so new ones are picked up with a
+ * MutationObserver rather than once on page load, and removed ones are
+ * unobserved so the observers don't hold on to detached nodes.
+ */
+(function () {
+    "use strict";
+
+    if (!("IntersectionObserver" in window)) return;
+
+    function setVisible(el, visible) {
+        if (el.dataset.lazyVisible === String(visible)) return;
+        el.dataset.lazyVisible = String(visible);
+        var dc = window.dash_clientside;
+        if (dc && typeof dc.set_props === "function") {
+            dc.set_props("visible-" + el.dataset.graphId,
+                         { data: visible });
+        }
+    }
+
+    var enter = new IntersectionObserver(function (entries) {
+        entries.forEach(function (e) {
+            if (e.isIntersecting) setVisible(e.target, true);
+        });
+    }, { rootMargin: "100% 0px" });
+
+    var leave = new IntersectionObserver(function (entries) {
+        entries.forEach(function (e) {
+            if (!e.target.isConnected) {
+                unobserve(e.target);
+            } else if (!e.isIntersecting) {
+                setVisible(e.target, false);
+            }
+        });
+    }, { rootMargin: "400% 0px" });
+
+    var observed = [];
+
+    function unobserve(el) {
+        enter.unobserve(el);
+        leave.unobserve(el);
+    }
+
+    function scan() {
+        observed = observed.filter(function (el) {
+            if (el.isConnected) return true;
+            unobserve(el);
+            return false;
+        });
+        var els = document.querySelectorAll(".lazy-graph");
+        for (var i = 0; i < els.length; i++) {
+            var el = els[i];
+            if (el.dataset.lazyObserved === "1") continue;
+            el.dataset.lazyObserved = "1";
+            enter.observe(el);
+            leave.observe(el);
+            observed.push(el);
+        }
+    }
+
+    function start() {
+        scan();
+        new MutationObserver(scan).observe(document.body,
+            { childList: true, subtree: true });
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", start);
+    } else {
+        start();
+    }
+})();
@@ -0,0 +1,53 @@
+/**
+ * One page-level spinner for the graphs inside `.shared-loading` regions.
+ *
+ * Instead of a dcc.Loading wrapper per graph (each mounting its own
+ * spinner and re-rendering its subtree on every callback), components
+ * in those regions are watched for the `data-dash-is-loading` flag the
+ * renderer sets while a callback is updating them.  The single
+ * `#global-spinner` node gets the `active` class while any of them is
+ * loading, after a short delay so fast updates don't blink it.
+ */
+(function () {
+    "use strict";
+
+    var DELAY_MS = 600;
+    var SELECTOR = ".shared-loading [data-dash-is-loading]";
+    var timer = null;
+
+    function spinner() {
+        return document.getElementById("global-spinner");
+    }
+
+    function update() {
+        var el = spinner();
+        if (!el) return;
+        if (document.querySelector(SELECTOR) === null) {
+            clearTimeout(timer);
+            timer = null;
+            el.classList.remove("active");
+        } else if (timer === null && !el.classList.contains("active")) {
+            timer = setTimeout(function () {
+                timer = null;
+                if (document.querySelector(SELECTOR) !== null) {
+                    el.classList.add("active");
+                }
+            }, DELAY_MS);
+        }
+    }
+
+    function start() {
+        new MutationObserver(update).observe(document.body, {
+            subtree: true,
+            childList: true,
+            attributes: true,
+            attributeFilter: ["data-dash-is-loading"],
+        });
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", start);
+    } else {
+        start();
+    }
+})();
@@ -6,6 +6,9 @@
  *
  * Visual feedback: both thumbs show a highlight ring while Shift is
  * held on a focused thumb, indicating linked-movement mode.
+ *
+ * Held-key repeats are throttled so the server callbacks see at most
+ * one update per 150 ms.
  */
 (function () {
     "use strict";
@@ -67,9 +70,13 @@
         var info = getDashSlider(el);
         if (!info) return;
 
+        // While a held key is being throttled the props lag behind;
+        // step from the latest requested window instead.
+        var current = (_pending && _pending.wrapper === info.wrapper)
+            ? _pending.value : info.value;
         var delta = (e.key === "ArrowRight" ? 1 : -1) * info.step;
-        var newLow  = info.value[0] + delta;
-        var newHigh = info.value[1] + delta;
+        var newLow  = current[0] + delta;
+        var newHigh = current[1] + delta;
 
         // Respect slider bounds
         if (newLow < info.min || newHigh > info.max) return;
@@ -77,9 +84,54 @@
         e.preventDefault();
         e.stopImmediatePropagation();
 
-        info.setProps({ value: [newLow, newHigh] });
+        pushValue(info, [newLow, newHigh]);
     }, true);  // capture phase
 
+    // ── Throttle ────────────────────────────────────────────────────
+    // Holding Shift+Arrow auto-repeats ~30×/s, and every setProps
+    // fires the server callbacks bound to the slider.  Send the first
+    // step at once, then at most one update per THROTTLE_MS, always
+    // ending on the last requested window.  Pending state is keyed on
+    // the slider's DOM wrapper: Dash hands the component a new setProps
+    // closure on every render, so the newest one is kept for commits.
+
+    var THROTTLE_MS = 150;
+    var _pending = null;  // {wrapper, setProps, value, sent, timer}
+
+    function commit(st) {
+        if (st.value === st.sent) return;
+        st.sent = st.value;
+        st.setProps({ value: st.value });
+    }
+
+    function tick() {
+        var st = _pending;
+        if (!st) return;
+        if (st.value !== st.sent) {
+            commit(st);
+            st.timer = setTimeout(tick, THROTTLE_MS);
+        } else {
+            _pending = null;
+        }
+    }
+
+    function pushValue(info, value) {
+        if (_pending && _pending.wrapper !== info.wrapper) {
+            clearTimeout(_pending.timer);
+            commit(_pending);
+            _pending = null;
+        }
+        if (_pending) {
+            _pending.setProps = info.setProps;
+            _pending.value = value;
+            return;
+        }
+        _pending = { wrapper: info.wrapper, setProps: info.setProps,
+                     value: value, sent: null };
+        commit(_pending);
+        _pending.timer = setTimeout(tick, THROTTLE_MS);
+    }
+
     // ── Visual feedback: linked-mode highlight ──────────────────────
     // Adds a CSS class to the slider wrapper so both thumbs can be
     // styled together (e.g. a subtle glow ring).
@@ -13,11 +13,15 @@ Then open http://127.0.0.1:8050/ in a browser.
 """
 
 import hashlib
+import json
 import os
 import re
 import sys
 import threading
 import time
+import zlib
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -30,13 +34,14 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
 import dash
-from dash import (ALL, Dash, Input, Output, State, ctx, dash_table, dcc,
-                  html, no_update)
+from dash import (ALL, Dash, Input, Output, Patch, State, ctx, dash_table,
+                  dcc, html, no_update)
 from dash.dcc import send_data_frame
 from dash.exceptions import PreventUpdate
+from flask import Response, request
 from plotly.subplots import make_subplots
 
-from lib.db import connect, timed_query
+from lib.db import connect, timed_copy_query
 from lib.mpec_parser import (fetch_recent_mpecs, fetch_mpec_detail,
                               mpec_id_to_url, lookup_mpecs_by_designation)
 from mpc_designation import pack as pack_designation, unpack as unpack_designation
@@ -221,10 +226,12 @@ STATION_TO_PROJECT = {
 }
 # Any station not in STATION_TO_PROJECT falls into "Other Follow-up"
 
-# Reverse mapping: project -> list of station codes
+# Reverse mapping: project -> sorted list of station codes
 PROJECT_STATIONS = {}
 for _stn, _proj in STATION_TO_PROJECT.items():
     PROJECT_STATIONS.setdefault(_proj, []).append(_stn)
+for _stns in PROJECT_STATIONS.values():
+    _stns.sort()
 
 # Station-level color: inherit from parent project
 STATION_COLORS = {stn: None for stn in STATION_TO_PROJECT}  # placeholder
@@ -252,6 +259,13 @@ PROJECT_ORDER = [
     "Other Follow-up",
 ]
 
+# "Project: codes" lines for the Survey group MPC codes reference
+_MPC_CODE_LINES = tuple(
+    f"{proj}: {', '.join(PROJECT_STATIONS[proj])}"
+    for proj in PROJECT_ORDER if proj in PROJECT_STATIONS
+)
+_MPC_CODE_LINES_JSON = json.dumps(_MPC_CODE_LINES)
+
 # Colors match CNEOS site_all.json exactly for core groups.
 # Extended groups use distinguishable muted tones.
 PROJECT_COLORS = {
@@ -285,7 +299,7 @@ for _proj in ["LINEAR", "NEAT", "Spacewatch", "LONEOS",
               "Catalina Survey", "Pan-STARRS", "NEOWISE",
               "ATLAS", "Bok NEO Survey", "Rubin/LSST", "Other-US",
               "Palomar Mountain", "Independent Surveys"]:
-    for _stn in sorted(PROJECT_STATIONS.get(_proj, [])):
+    for _stn in PROJECT_STATIONS.get(_proj, []):
         _SURVEY_STATIONS.append(_stn)
 
 # H magnitude size classes (standard p_v = 0.14 boundaries)
@@ -296,6 +310,10 @@ H_BINS = [
     ("24.25 \u2264 H < 27.75 (~10\u201350 m)", 24.25, 27.75),
     ("H \u2265 27.75 (< 10 m)", 27.75, None),
 ]
+H_BIN_LABELS = [label for label, _, _ in H_BINS]
+# Left-closed pd.cut edges equivalent to the (lo, hi) bounds above
+_SIZE_CLASS_EDGES = ([-np.inf] + [hi for _, _, hi in H_BINS[:-1]]
+                     + [np.inf])
 
 # Colors for size-class stacking (viridis palette, matching size histogram)
 SIZE_COLORS = ["#440154", "#31688e", "#35b779", "#90d743", "#fde725"]
@@ -307,13 +325,12 @@ SIZE_COLORS = ["#440154", "#31688e", "#35b779", "#90d743", "#fde725"]
 # Ecliptic plane: parametric (RA, Dec) from ecliptic longitude 0→360°
 _ECL_LON = np.linspace(0, 360, 361)
 _OBLIQUITY = 23.44  # degrees
+_ECL_LON_RAD = np.radians(_ECL_LON)
+_sin_lon = np.sin(_ECL_LON_RAD)
 _ECL_RA_360 = np.degrees(np.arctan2(
-    np.sin(np.radians(_ECL_LON)) * np.cos(np.radians(_OBLIQUITY)),
-    np.cos(np.radians(_ECL_LON)),
+    _sin_lon * np.cos(np.radians(_OBLIQUITY)), np.cos(_ECL_LON_RAD),
 )) % 360
-_ECL_DEC = np.degrees(np.arcsin(
-    np.sin(np.radians(_ECL_LON)) * np.sin(np.radians(_OBLIQUITY))
-))
+_ECL_DEC = np.degrees(np.arcsin(_sin_lon * np.sin(np.radians(_OBLIQUITY))))
 
 # Galactic plane (b=0): standard J2000 rotation matrix (Hipparcos/IAU).
 # Columns are galactic x̂, ŷ, ẑ (=NGP) basis vectors in equatorial coords.
@@ -341,14 +358,10 @@ def _ra_to_centered(ra):
 
 def _split_at_wraparound(ra, dec, threshold=90):
     """Insert NaN where RA jumps by more than threshold degrees."""
-    out_ra, out_dec = [ra[0]], [dec[0]]
-    for i in range(1, len(ra)):
-        if abs(ra[i] - ra[i - 1]) > threshold:
-            out_ra.append(np.nan)
-            out_dec.append(np.nan)
-        out_ra.append(ra[i])
-        out_dec.append(dec[i])
-    return np.array(out_ra), np.array(out_dec)
+    ra = np.asarray(ra, dtype=float)
+    dec = np.asarray(dec, dtype=float)
+    breaks = np.flatnonzero(np.abs(np.diff(ra)) > threshold) + 1
+    return np.insert(ra, breaks, np.nan), np.insert(dec, breaks, np.nan)
 
 
 ECL_RA, ECL_DEC = _split_at_wraparound(
@@ -400,11 +413,45 @@ NEOMOD3_DF["h_center"] = (NEOMOD3_DF["h1"] + NEOMOD3_DF["h2"]) / 2
 NEOMOD3_DF["bin_label"] = NEOMOD3_DF.apply(
     lambda r: f"{r['h1']:.2f}\u2013{r['h2']:.2f}", axis=1
 )
+# NEOMOD3 columns as arrays, for binary-search lookups by H
+_NM_H1 = NEOMOD3_DF["h1"].to_numpy()
+_NM_H2 = NEOMOD3_DF["h2"].to_numpy()
+_NM_NCUMUL = NEOMOD3_DF["n_cumul"].to_numpy()
+_NM_DN = NEOMOD3_DF["dn_model"].to_numpy()
+
+# Columns of the NEOMOD3 comparison table (rows come from the
+# update_neomod3_table callback)
+_NEOMOD3_TABLE_COLUMNS = [
+    {"name": "H bin",           "id": "bin"},
+    {"name": "Model dN",        "id": "dn_model"},
+    {"name": "Model N(<H)",     "id": "n_cumul"},
+    {"name": "N 1\u03C3 range", "id": "n_range"},
+    {"name": "Discovered",      "id": "disc"},
+    {"name": "Disc. cumul.",    "id": "disc_cumul"},
+    {"name": "Compl. (bin)",    "id": "comp_diff"},
+    {"name": "Compl. (cumul.)", "id": "comp_cumul"},
+]
+
+# Column definitions for the discovery tab's top-stations DataTable
+_TOP_STATIONS_COLUMNS = [
+    {"name": "Station",     "id": "station"},
+    {"name": "Project",     "id": "project"},
+    {"name": "Discoveries", "id": "discoveries"},
+]
 
 # Half-magnitude bin edges for digitizing discovered NEO H values
 H_BIN_EDGES = np.arange(15.25, 28.25, 0.5)
 H_BIN_CENTERS = (H_BIN_EDGES[:-1] + H_BIN_EDGES[1:]) / 2
 
+# Each NEOMOD3 row's index into H_BIN_CENTERS (-1 off the grid), and the
+# NEOMOD3 row position per bin index, so callbacks index by integer bin
+# instead of matching float centers
+_nm_bin = np.round((NEOMOD3_DF["h_center"].to_numpy() - H_BIN_CENTERS[0])
+                   / 0.5).astype(np.intp)
+NEOMOD3_DF["bin_idx"] = np.where(
+    (_nm_bin >= 0) & (_nm_bin < len(H_BIN_CENTERS)), _nm_bin, -1)
+_H_TO_NM = {int(b): i for i, b in enumerate(NEOMOD3_DF["bin_idx"]) if b >= 0}
+
 # ---------------------------------------------------------------------------
 # Size reference lines: H magnitude for selected diameter thresholds
 # Standard uses fixed p_v = 0.14 (Harris & Chodas 2021).
@@ -443,8 +490,29 @@ _140M_IDX = 4
 # Theme helpers
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True, slots=True)
+class Theme:
+    """Colors and Plotly template for one UI theme (read as ``t.paper``
+    etc. by the figure builders)."""
+    template: str
+    paper: str
+    plot: str
+    page: str
+    text: str
+    subtext: str
+    control_text: str
+    input_text: str
+    mark_color: str
+    table_header: str
+    table_cell: str
+    table_font: str
+    model_outline: str
+    hr_color: str
+    row_hover: str
+
+
 THEMES = {
-    "dark": dict(
+    "dark": Theme(
         template="plotly_dark",
         paper="#1e1e1e",
         plot="#1e1e1e",
@@ -461,7 +529,7 @@ THEMES = {
         hr_color="#444444",
         row_hover="#2a2a2a",
     ),
-    "light": dict(
+    "light": Theme(
         template="plotly_white",
         paper="white",
         plot="white",
@@ -500,6 +568,28 @@ pio.templates["plotly_white"].layout.update(
 )
 
 
+@lru_cache(maxsize=None)
+def _template_json(name):
+    """Plotly template *name* as plain JSON, for figures built as dicts.
+
+    Small fixed-shape figures are returned as dicts rather than
+    go.Figure objects to skip property validation; the named template
+    still has to be inlined because plotly.js cannot resolve it.
+    """
+    return pio.templates[name].to_plotly_json()
+
+
+def _theme_layouts(**static):
+    """Base layout dict per Theme for a figure built as a dict: the
+    *static* keys plus the inlined template and background colors.
+    Built once at import and indexed by theme(), so callbacks only add
+    their data-dependent keys on top."""
+    return {t: {"template": _template_json(t.template),
+                "paper_bgcolor": t.paper, "plot_bgcolor": t.plot,
+                **static}
+            for t in THEMES.values()}
+
+
 # Plotly modebar config — enable PNG download with 2x resolution
 GRAPH_CONFIG = {
     "toImageButtonOptions": {
@@ -823,14 +913,21 @@ CROSS JOIN LATERAL (
 _df_lifetime = None
 
 
+def _days_between(later, earlier):
+    """Elapsed days from *earlier* to *later* (datetime Series) as a
+    float64 array; NaT on either side gives NaN."""
+    return ((later.to_numpy(dtype="datetime64[ns]")
+             - earlier.to_numpy(dtype="datetime64[ns]"))
+            / np.timedelta64(1, "D"))
+
+
 def _postprocess_lifetime(df_raw):
     df_raw = df_raw.copy()
     df_raw["disc_obstime"] = pd.to_datetime(df_raw["disc_obstime"])
     df_raw["first_obs"] = pd.to_datetime(df_raw["first_obs"])
     df_raw["last_obs"] = pd.to_datetime(df_raw["last_obs"])
-    df_raw["days_to_last_obs"] = (
-        (df_raw["last_obs"] - df_raw["disc_obstime"])
-        .dt.total_seconds() / 86400)
+    df_raw["days_to_last_obs"] = _days_between(
+        df_raw["last_obs"], df_raw["disc_obstime"])
     return df_raw
 
 
@@ -1047,6 +1144,12 @@ if _DEV_TABS:
 _WAITRESS = "--waitress" in sys.argv
 if _WAITRESS:
     sys.argv.remove("--waitress")
+# --cdn serves the Dash/Plotly JS bundles from the public CDN instead
+# of this process. Off by default so the dashboard keeps working on
+# hosts without outbound access.
+_SERVE_CDN = "--cdn" in sys.argv
+if _SERVE_CDN:
+    sys.argv.remove("--cdn")
 # Number of waitress threads (no effect without --waitress).
 _WAITRESS_THREADS = 4
 if "--waitress-threads" in sys.argv:
@@ -1096,18 +1199,111 @@ def _cache_refresh_label():
     return f"Caches refreshed {stamp.strftime('%Y-%m-%d %H:%M UTC')}"
 
 
-def _load_cached_query(sql, prefix, label):
+def _write_parquet_cache(frame, cache_file, categories=()):
+    """Write a query result as a zstd-compressed Parquet cache.
+
+    Columns named in `categories` (highly repetitive strings such as
+    station codes) are cast to category in place first: Parquet stores
+    them dictionary-encoded and they come back as categoricals on read,
+    so a fresh query and a cache hit hand back identical dtypes.
+    The file is written under a temporary name and renamed into place,
+    so a concurrently starting process never reads a partial cache.
+    """
+    for col in categories:
+        if (col in frame.columns
+                and not isinstance(frame[col].dtype, pd.CategoricalDtype)):
+            frame[col] = frame[col].astype("category")
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    frame.to_parquet(tmp_file, index=False, engine="pyarrow",
+                     compression="zstd")
+    os.replace(tmp_file, cache_file)
+    return frame
+
+
+def _write_cache_meta(meta_file, query_time):
+    """Atomically record a cache's query timestamp next to it."""
+    tmp_file = f"{meta_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as f:
+        f.write(query_time.strftime("%Y-%m-%d %H:%M UTC"))
+    os.replace(tmp_file, meta_file)
+
+
+def _align_categories(frames, col):
+    """Give categorical `col` one shared category set across `frames`
+    (in place), so cross-frame comparisons stay valid."""
+    present = [f for f in frames
+               if f is not None and col in f.columns
+               and isinstance(f[col].dtype, pd.CategoricalDtype)]
+    if len(present) < 2:
+        return
+    cats = present[0][col].cat.categories
+    for f in present[1:]:
+        cats = cats.union(f[col].cat.categories)
+    for f in present:
+        f[col] = f[col].cat.set_categories(cats)
+
+
+def _attach_designation_ids(df_main, df_app):
+    """Give both frames a shared int32 `desig_id` column (in place), so
+    per-NEO membership tests compare integer codes instead of hashing
+    designation strings."""
+    codes, _ = pd.factorize(pd.concat(
+        [df_main["designation"], df_app["designation"]],
+        ignore_index=True))
+    n_main = len(df_main)
+    df_main["desig_id"] = codes[:n_main].astype(np.int32)
+    df_app["desig_id"] = codes[n_main:].astype(np.int32)
+
+
+def _station_categorical(stn, mapping, default=None):
+    """Map station codes through `mapping` as a categorical Series.
+
+    The dict lookup runs once per distinct station (category) and the
+    result is gathered onto the rows by category code.  Unmapped codes
+    fall back to `default`, or to the code itself when `default` is
+    None; a missing code maps to `default` (NaN when None).
+    Categories come out sorted, as with ``astype("category")``.
+    """
+    if not isinstance(stn.dtype, pd.CategoricalDtype):
+        stn = stn.astype("category")
+    labels = [mapping.get(s, s if default is None else default)
+              for s in stn.cat.categories]
+    labels.append(default)  # code -1 (missing) indexes the last slot
+    cats = sorted({lab for lab in labels if lab is not None})
+    pos = {lab: i for i, lab in enumerate(cats)}
+    lut = np.array([pos.get(lab, -1) for lab in labels], dtype=np.int32)
+    codes = lut[stn.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=cats),
+        index=stn.index).cat.remove_unused_categories()
+
+
+def _sql_hash(sql):
+    """Short fingerprint of a query string, used to tag cache files."""
+    return hashlib.blake2b(sql.encode(), digest_size=4).hexdigest()
+
+
+def _legacy_sql_hash(sql):
+    """Tag of legacy CSV caches, which predate _sql_hash() and were only
+    ever written under the first 8 hex digits of the query's MD5."""
+    return hashlib.md5(sql.encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+def _load_cached_query(sql, prefix, label, categories=()):
     """Load query result from cache file or database.
 
     Returns (DataFrame, meta_file_path).
-    Uses Parquet format for compact storage and fast loads.
+    Uses Parquet format for compact storage and fast loads; `categories`
+    lists string columns stored as categoricals (see
+    _write_parquet_cache).
     Falls back to legacy CSV cache if Parquet not yet generated.
     """
-    sql_hash = hashlib.md5(sql.encode()).hexdigest()[:8]
+    sql_hash = _sql_hash(sql)
     cache_file = os.path.join(_APP_DIR, f".{prefix}_{sql_hash}.parquet")
     meta_file = os.path.join(
         _APP_DIR, f".{prefix}_{sql_hash}.meta")
-    legacy_csv = os.path.join(_APP_DIR, f".{prefix}_{sql_hash}.csv")
+    legacy_csv = os.path.join(
+        _APP_DIR, f".{prefix}_{_legacy_sql_hash(sql)}.csv")
 
     use_cache = False
     if _SERVE_ONLY:
@@ -1152,16 +1348,15 @@ def _load_cached_query(sql, prefix, label):
     if use_cache:
         if cache_file.endswith(".parquet"):
             return pd.read_parquet(cache_file), meta_file
-        return pd.read_csv(cache_file), meta_file
+        return pd.read_csv(cache_file, engine="pyarrow"), meta_file
 
     print(f"Querying database for {label}...")
     from datetime import datetime, timezone
     query_time = datetime.now(timezone.utc)
     with connect() as conn:
-        result = timed_query(conn, sql, label=label)
-    result.to_parquet(cache_file, index=False)
-    with open(meta_file, "w") as f:
-        f.write(query_time.strftime("%Y-%m-%d %H:%M UTC"))
+        result = timed_copy_query(conn, sql, label=label)
+    result = _write_parquet_cache(result, cache_file, categories)
+    _write_cache_meta(meta_file, query_time)
     print(f"Cached {len(result):,} rows to {cache_file}")
     return result, meta_file
 
@@ -1169,7 +1364,8 @@ def _load_cached_query(sql, prefix, label):
 def load_data():
     """Load NEO discovery data from DB or cache (refreshed daily)."""
     raw, meta_file = _load_cached_query(
-        LOAD_SQL, "neo_cache", "NEO discoveries")
+        LOAD_SQL, "neo_cache", "NEO discoveries",
+        categories=("station_code", "stn_type"))
 
     # Sanitize H magnitude: sentinel values (0, -9.99) in mpc_orbits
     # represent missing data, not real measurements.  Treat as unknown.
@@ -1221,20 +1417,15 @@ def load_data():
         print(f"Warning: NEA.txt H override skipped: {e}")
 
     # Derived columns
-    raw["station_name"] = (raw["station_code"].map(STATION_NAMES)
-                           .fillna(raw["station_code"]))
-    raw["project"] = (raw["station_code"].map(STATION_TO_PROJECT)
-                      .fillna("Other Follow-up"))
+    raw["station_name"] = _station_categorical(
+        raw["station_code"], STATION_NAMES)
+    raw["project"] = _station_categorical(
+        raw["station_code"], STATION_TO_PROJECT, "Other Follow-up")
 
-    def h_bin(h):
-        if pd.isna(h):
-            return "Unknown H"
-        for label, lo, hi in H_BINS:
-            if (lo is None or h >= lo) and (hi is None or h < hi):
-                return label
-        return "Unknown H"
-
-    raw["size_class"] = raw["h"].apply(h_bin)
+    raw["size_class"] = (
+        pd.cut(raw["h"], bins=_SIZE_CLASS_EDGES, labels=H_BIN_LABELS,
+               right=False)
+        .astype(object).where(raw["h"].notna(), "Unknown H"))
 
     # Compute signed solar elongation at discovery
     if "disc_date" in raw.columns and "avg_ra_deg" in raw.columns:
@@ -1272,14 +1463,27 @@ def load_data():
         alt = sun_altitude(raw["disc_obstime"], lon, lat)
         raw["sun_alt_deg"] = np.where(is_sat, np.nan,
                                       np.round(alt, 2))
-        raw["twilight_class"] = classify_twilight(alt, is_sat)
+        raw["twilight_class"] = pd.Categorical(
+            classify_twilight(alt, is_sat))
 
     # Pre-compute half-magnitude bin index
-    raw["h_bin_idx"] = np.where(
-        raw["h"].notna(),
-        np.digitize(raw["h"], H_BIN_EDGES) - 1,
-        -1,
-    ).astype(int)
+    h_vals = raw["h"].to_numpy(dtype=float)
+    h_bin_idx = np.searchsorted(H_BIN_EDGES, h_vals, side="right") - 1
+    h_bin_idx[np.isnan(h_vals)] = -1
+    raw["h_bin_idx"] = h_bin_idx.astype(np.int8)
+
+    # Compact dtypes: small ints for the calendar fields and categoricals
+    # for the heavily repeated labels
+    raw = raw.astype({
+        "disc_year": np.int16,
+        "disc_month": np.int8,
+        "size_class": pd.CategoricalDtype(H_BIN_LABELS + ["Unknown H"]),
+    })
+
+    # Keep rows in discovery-year order (stable, so the query's obstime
+    # order holds within a year): year-range filters then take a
+    # positional slice via _year_slice() instead of masking every row
+    raw = raw.sort_values("disc_year", kind="stable", ignore_index=True)
 
     # Read query timestamp
     if os.path.exists(meta_file):
@@ -1301,35 +1505,66 @@ def _postprocess_apparition(df_raw):
     df_raw["disc_obstime"] = pd.to_datetime(df_raw["disc_obstime"])
     df_raw["first_obs"] = pd.to_datetime(df_raw["first_obs"])
     df_raw["first_post_disc"] = pd.to_datetime(df_raw["first_post_disc"])
-    df_raw["project"] = (df_raw["station_code"].map(STATION_TO_PROJECT)
-                         .fillna("Other Follow-up"))
-    df_raw["days_from_disc"] = (
-        (df_raw["first_obs"] - df_raw["disc_obstime"])
-        .dt.total_seconds() / 86400
-    )
-    df_raw["post_disc_days"] = (
-        (df_raw["first_post_disc"] - df_raw["disc_obstime"])
-        .dt.total_seconds() / 86400
-    )
-    return df_raw
+    df_raw["station_code"] = df_raw["station_code"].astype("category")
+    df_raw["project"] = _station_categorical(
+        df_raw["station_code"], STATION_TO_PROJECT, "Other Follow-up")
+    df_raw["days_from_disc"] = _days_between(
+        df_raw["first_obs"], df_raw["disc_obstime"])
+    df_raw["post_disc_days"] = _days_between(
+        df_raw["first_post_disc"], df_raw["disc_obstime"])
+    return _narrow_window_counts(df_raw)
+
+
+def _narrow_window_counts(frame):
+    """Store the per-window tracklet/observation counts (n_trk_*,
+    n_obs_*) as int32 instead of int64, in place.  They are small
+    non-negative tallies; sums over them still accumulate in int64."""
+    cols = [c for c in frame.columns
+            if c.startswith(("n_trk_", "n_obs_"))
+            and frame[c].dtype == np.int64]
+    if cols:
+        frame[cols] = frame[cols].astype(np.int32)
+    return frame
 
 
 _df_apparition = None
+_df_apparition_lock = threading.Lock()
 
 
 def load_apparition_data():
-    """Lazy-load apparition station data (cache or query)."""
+    """Lazy-load apparition station data (cache or query).
+
+    Safe to call from several threads: callers arriving while a load is
+    in flight wait for it instead of issuing a second query.
+    """
+    if _df_apparition is not None:
+        return _df_apparition
+    with _df_apparition_lock:
+        return _load_apparition_data()
+
+
+def _prefetch_apparition():
+    """Background warm-up for load_apparition_data.  Failures are left
+    for the foreground call to retry and report."""
+    try:
+        load_apparition_data()
+    except Exception:
+        pass
+
+
+def _load_apparition_data():
+    """Body of load_apparition_data; call with _df_apparition_lock held."""
     global _df_apparition
     if _df_apparition is not None:
         return _df_apparition
 
-    sql_hash = hashlib.md5(APPARITION_SQL.encode()).hexdigest()[:8]
+    sql_hash = _sql_hash(APPARITION_SQL)
     cache_file = os.path.join(
         _APP_DIR, f".apparition_cache_{sql_hash}.parquet")
     meta_file = os.path.join(
         _APP_DIR, f".apparition_cache_{sql_hash}.meta")
     legacy_csv = os.path.join(
-        _APP_DIR, f".apparition_cache_{sql_hash}.csv")
+        _APP_DIR, f".apparition_cache_{_legacy_sql_hash(APPARITION_SQL)}.csv")
 
     use_cache = False
     if _SERVE_ONLY:
@@ -1376,9 +1611,11 @@ def load_apparition_data():
             _df_apparition = pd.read_parquet(cache_file)
         else:
             _df_apparition = pd.read_csv(
-                cache_file,
+                cache_file, engine="pyarrow",
                 parse_dates=["first_obs", "disc_obstime",
                              "first_post_disc"])
+        # Caches written before the counts were narrowed hold int64
+        _narrow_window_counts(_df_apparition)
         print(f"Loaded {len(_df_apparition):,} cached station rows")
         return _df_apparition
 
@@ -1387,14 +1624,14 @@ def load_apparition_data():
     from datetime import datetime, timezone
     query_time = datetime.now(timezone.utc)
     with connect() as conn:
-        raw = timed_query(conn, APPARITION_SQL,
-                          label="apparition observations")
+        raw = timed_copy_query(conn, APPARITION_SQL,
+                               label="apparition observations")
     print(f"Got {len(raw):,} station-level rows")
 
     _df_apparition = _postprocess_apparition(raw)
-    _df_apparition.to_parquet(cache_file, index=False)
-    with open(meta_file, "w") as f:
-        f.write(query_time.strftime("%Y-%m-%d %H:%M UTC"))
+    _df_apparition = _write_parquet_cache(
+        _df_apparition, cache_file, categories=("station_code", "project"))
+    _write_cache_meta(meta_file, query_time)
     print(f"Cached {len(_df_apparition):,} rows to {cache_file}")
 
     return _df_apparition
@@ -1476,6 +1713,14 @@ _NEO_SOURCE_FILTER_OPTIONS = [
 _NEO_SOURCE_FILTER_VALID = {opt["value"] for opt in _NEO_SOURCE_FILTER_OPTIONS}
 
 
+# Source-filtered views keyed by (id(frame), source), each stored with
+# its frame so a recycled id can't return a stale view.  Every tab asks
+# for the same few views, so each is built once rather than copied out
+# of the full frame on every callback.  Callers must not mutate them.
+_source_views = {}
+_SOURCE_VIEWS_MAX = 32
+
+
 def _apply_source_filter(df_in, source):
     """Slice a NEO DataFrame by the banner source filter. Whitelist-
     validated; falls through to the unfiltered df for unknown values
@@ -1484,18 +1729,21 @@ def _apply_source_filter(df_in, source):
         return df_in
     if source not in _NEO_SOURCE_FILTER_VALID or source == "any":
         return df_in
-    if source == "all_six":
-        if "all_six_agree" not in df_in.columns:
-            return df_in
-        return df_in[df_in["all_six_agree"]]
-    if source == "disagreements":
-        if "all_six_agree" not in df_in.columns:
-            return df_in
-        return df_in[~df_in["all_six_agree"]]
-    col = f"in_{source}"
+    if source in ("all_six", "disagreements"):
+        col = "all_six_agree"
+    else:
+        col = f"in_{source}"
     if col not in df_in.columns:
         return df_in
-    return df_in[df_in[col]]
+    hit = _source_views.get((id(df_in), source))
+    if hit is not None and hit[0] is df_in:
+        return hit[1]
+    keep = df_in[col]
+    view = df_in[~keep if source == "disagreements" else keep]
+    if len(_source_views) >= _SOURCE_VIEWS_MAX:
+        _source_views.clear()
+    _source_views[(id(df_in), source)] = (df_in, view)
+    return view
 
 
 # ---------------------------------------------------------------------------
@@ -1666,6 +1914,89 @@ def load_boxscore_data():
 # Multi-survey comparison helpers
 # ---------------------------------------------------------------------------
 
+_disc_info_cache = (None, None)
+
+
+def _disc_info_index(df_main):
+    """Discovery station, project and year per NEO, indexed by designation.
+
+    Built once per *df_main* object (the frame is replaced wholesale on
+    reload) so callbacks can slice it with a row mask instead of
+    rebuilding the designation index on every slider move.  Rows keep
+    df_main's order, so a boolean mask over df_main applies directly.
+    """
+    global _disc_info_cache
+    src, info = _disc_info_cache
+    if src is not df_main:
+        info = df_main.set_index("designation")[
+            ["station_code", "project", "disc_year"]]
+        _disc_info_cache = (df_main, info)
+    return info
+
+
+_eligible_mask_cache = (None, {})
+
+
+def _year_slice(frame, y0, y1):
+    """Rows of *frame* with y0 <= disc_year <= y1.
+
+    *frame* must be sorted by disc_year, as load_data() leaves df (and
+    so every row subset of it) and as a groupby keyed first on disc_year
+    returns; two binary searches bound the range and the result is a
+    positional slice rather than a boolean mask.
+    """
+    lo, hi = np.searchsorted(frame["disc_year"].to_numpy(), (y0, y1 + 1))
+    return frame.iloc[lo:hi]
+
+
+def _eligible_mask(df_main, year_range, size_filter="all"):
+    """Boolean mask of df_main rows in *year_range* and *size_filter*.
+
+    Masks are memoized per *df_main* object: one slider state drives
+    several callbacks (comparison, follow-up, contribution map), which
+    then share a single read-only mask.
+    """
+    global _eligible_mask_cache
+    src, masks = _eligible_mask_cache
+    if src is not df_main or len(masks) >= 64:
+        masks = {}
+        _eligible_mask_cache = (df_main, masks)
+    y0, y1 = year_range
+    key = (y0, y1, size_filter)
+    mask = masks.get(key)
+    if mask is None:
+        # df_main is sorted by disc_year (see _year_slice), so only the
+        # rows inside the year range are read at all
+        lo, hi = np.searchsorted(df_main["disc_year"].to_numpy(), (y0, y1 + 1))
+        mask = np.zeros(len(df_main), dtype=bool)
+        if size_filter != "all":
+            mask[lo:hi] = (df_main["size_class"].iloc[lo:hi]
+                           == size_filter).to_numpy()
+        else:
+            mask[lo:hi] = True
+        mask.flags.writeable = False
+        masks[key] = mask
+    return mask
+
+
+def _designation_mask(df_app, df_main, mask=None):
+    """Boolean mask of df_app rows whose NEO is among df_main's rows
+    (restricted to boolean *mask* over df_main when given).
+
+    Uses the shared desig_id codes when both frames carry them and
+    falls back to matching designation strings otherwise.
+    """
+    if "desig_id" in df_app.columns and "desig_id" in df_main.columns:
+        ids = df_main["desig_id"].to_numpy()
+        if mask is not None:
+            ids = ids[mask]
+        return np.isin(df_app["desig_id"].to_numpy(), ids)
+    desigs = df_main["designation"]
+    if mask is not None:
+        desigs = desigs[mask]
+    return df_app["designation"].isin(set(desigs)).to_numpy()
+
+
 def build_survey_sets(df_main, df_app, year_range, size_filter,
                       exclude_precovery, window_days=200,
                       group_col="project"):
@@ -1677,14 +2008,12 @@ def build_survey_sets(df_main, df_app, year_range, size_filter,
 
     Returns (dict[group \u2192 set[designation]], set[designation] eligible).
     """
-    y0, y1 = year_range
-    eligible = df_main[
-        (df_main["disc_year"] >= y0) & (df_main["disc_year"] <= y1)]
-    if size_filter != "all":
-        eligible = eligible[eligible["size_class"] == size_filter]
-    desig_set = set(eligible["designation"])
+    mask = _eligible_mask(df_main, year_range, size_filter)
+    if not mask.any():
+        return {}, set()
+    desig_set = set(_disc_info_index(df_main).index[mask])
 
-    tkl = df_app[df_app["designation"].isin(desig_set)]
+    tkl = df_app[_designation_mask(df_app, df_main, mask)]
 
     # Apply apparition window filter
     if exclude_precovery:
@@ -1699,7 +2028,7 @@ def build_survey_sets(df_main, df_app, year_range, size_filter,
     # Group by station or project
     if group_col == "station_code":
         survey_sets = {}
-        for stn, grp in tkl.groupby("station_code"):
+        for stn, grp in tkl.groupby("station_code", observed=True):
             proj = STATION_TO_PROJECT.get(stn)
             if proj is None:
                 key = "Other Follow-up"
@@ -1710,7 +2039,7 @@ def build_survey_sets(df_main, df_app, year_range, size_filter,
         return survey_sets, desig_set
 
     survey_sets = {}
-    for proj, grp in tkl.groupby("project"):
+    for proj, grp in tkl.groupby("project", observed=True):
         survey_sets[proj] = set(grp["designation"])
     return survey_sets, desig_set
 
@@ -1730,14 +2059,10 @@ def build_survey_metric_totals(df_main, df_app, year_range, size_filter,
     Returns {} if the requested column isn't in df_app (cache
     pre-Phase-2A); callers should treat that as "fall back to NEO
     counts derived from build_survey_sets"."""
-    y0, y1 = year_range
-    eligible = df_main[
-        (df_main["disc_year"] >= y0) & (df_main["disc_year"] <= y1)]
-    if size_filter != "all":
-        eligible = eligible[eligible["size_class"] == size_filter]
-    desig_set = set(eligible["designation"])
+    mask = _eligible_mask(df_main, year_range, size_filter)
+    desig_set = set(_disc_info_index(df_main).index[mask])
 
-    tkl = df_app[df_app["designation"].isin(desig_set)]
+    tkl = df_app[_designation_mask(df_app, df_main, mask)]
 
     mode = "post" if exclude_precovery else "any"
     prefix = "n_trk" if metric == "tracklets" else "n_obs"
@@ -1747,7 +2072,7 @@ def build_survey_metric_totals(df_main, df_app, year_range, size_filter,
 
     if group_col == "station_code":
         totals = {}
-        for stn, grp in tkl.groupby("station_code"):
+        for stn, grp in tkl.groupby("station_code", observed=True):
             proj = STATION_TO_PROJECT.get(stn)
             if proj is None:
                 totals["Other Follow-up"] = (
@@ -1758,13 +2083,20 @@ def build_survey_metric_totals(df_main, df_app, year_range, size_filter,
         return totals
 
     return {proj: int(grp[col].sum())
-            for proj, grp in tkl.groupby("project")}
+            for proj, grp in tkl.groupby("project", observed=True)}
 
 
 # ---------------------------------------------------------------------------
 # Follow-up timing helpers
 # ---------------------------------------------------------------------------
 
+# Shared result for selections with no follow-up rows; callers must not
+# mutate it.
+_EMPTY_FU_DF = pd.DataFrame(columns=[
+    "designation", "project", "disc_project", "disc_year",
+    "days_to_followup", "fu_rank"])
+
+
 def build_followup_data(df_main, df_app, year_range, size_filter):
     """Compute per-survey follow-up timing from apparition data.
 
@@ -1777,51 +2109,50 @@ def build_followup_data(df_main, df_app, year_range, size_filter):
         disc_year, days_to_followup, fu_rank.
     fu_rank = 1 means this project was the first outside survey to observe.
     """
-    y0, y1 = year_range
-    eligible = df_main[
-        (df_main["disc_year"] >= y0) & (df_main["disc_year"] <= y1)]
-    if size_filter != "all":
-        eligible = eligible[eligible["size_class"] == size_filter]
+    mask = _eligible_mask(df_main, year_range, size_filter)
+    n_eligible = int(mask.sum())
 
-    if len(eligible) == 0:
-        return pd.DataFrame(), 0
+    if n_eligible == 0:
+        return _EMPTY_FU_DF, 0
 
-    disc_info = eligible.set_index("designation")[
-        ["station_code", "project", "disc_year"]].rename(
-        columns={"station_code": "disc_station",
-                 "project": "disc_project"})
+    disc_info = _disc_info_index(df_main)[mask][
+        ["project", "disc_year"]].rename(columns={"project": "disc_project"})
 
-    app = df_app[
-        df_app["designation"].isin(disc_info.index)
-        & df_app["first_post_disc"].notna()
-    ].copy()
+    # Only the columns the timing table needs, so the join copies little
+    app = df_app.loc[
+        _designation_mask(df_app, df_main, mask)
+        & df_app["first_post_disc"].notna().to_numpy(),
+        ["designation", "project", "post_disc_days"]]
 
     if len(app) == 0:
-        return pd.DataFrame(), len(eligible)
+        return _EMPTY_FU_DF, n_eligible
 
-    app = app.join(disc_info, on="designation")
+    app = app.merge(disc_info, how="left", left_on="designation",
+                    right_index=True)
 
     # Exclude same survey project as the discoverer
     app = app[app["project"] != app["disc_project"]]
 
     if len(app) == 0:
-        return pd.DataFrame(), len(eligible)
+        return _EMPTY_FU_DF, n_eligible
 
-    app["days_to_followup"] = (
-        (app["first_post_disc"] - app["disc_obstime"])
-        .dt.total_seconds() / 86400
-    )
+    # Same first_post_disc - disc_obstime delta precomputed at load
+    app["days_to_followup"] = app["post_disc_days"]
 
-    # Aggregate to project level: fastest station per project per NEO
-    app = (app.groupby(["designation", "project", "disc_project",
-                        "disc_year"])
-           ["days_to_followup"].min().reset_index())
+    # Sort by follow-up speed within each NEO (project breaks ties), so
+    # the first row per (designation, project) is the fastest station of
+    # that project and the survivors are already in fu_rank order.
+    # disc_project/disc_year are per-designation and carry through.
+    app = (app.sort_values(["designation", "days_to_followup", "project"])
+           .drop_duplicates(["designation", "project"])
+           [["designation", "project", "disc_project", "disc_year",
+             "days_to_followup"]])
 
     # Rank projects by follow-up speed within each NEO
-    app = app.sort_values(["designation", "days_to_followup"])
-    app["fu_rank"] = app.groupby("designation").cumcount() + 1
+    app["fu_rank"] = (app.groupby("designation").cumcount() + 1).astype(
+        np.int8)
 
-    return app, len(eligible)
+    return app, n_eligible
 
 
 def _make_response_curve(fu_data, total_neos, max_days, t, height):
@@ -1831,10 +2162,11 @@ def _make_response_curve(fu_data, total_neos, max_days, t, height):
     colors = ["#4363d8", "#f58231", "#3cb44b"]
     labels = ["1st follow-up survey", "2nd survey", "3rd survey"]
 
+    ranks = fu_data["fu_rank"].to_numpy()
+    all_days = fu_data["days_to_followup"].to_numpy(dtype=float)
+    in_window = all_days <= max_days
     for rank in [1, 2, 3]:
-        days = (fu_data[fu_data["fu_rank"] == rank]["days_to_followup"]
-                .sort_values().values)
-        days = days[days <= max_days]
+        days = np.sort(all_days[in_window & (ranks == rank)])
         if len(days) == 0:
             continue
         y = np.arange(1, len(days) + 1) / total_neos * 100
@@ -1850,8 +2182,8 @@ def _make_response_curve(fu_data, total_neos, max_days, t, height):
         ))
 
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Follow-up response curve",
         xaxis=dict(title="Days from discovery", range=[0, max_days]),
@@ -1869,18 +2201,24 @@ def _make_survey_response_box(fu_data, max_days, t, height):
 
     proj_data = fu_data[fu_data["days_to_followup"] <= max_days]
 
-    stats = (proj_data.groupby("project")["days_to_followup"]
-             .agg(["median", "count"]).reset_index())
+    # One grouping pass gives each project's row positions; the median,
+    # count and box samples are all sliced from the same days array.
+    days = proj_data["days_to_followup"].to_numpy()
+    rows = proj_data.groupby("project", observed=True).indices
+    stats = pd.DataFrame({
+        "project": list(rows),
+        "median": [np.median(days[idx]) for idx in rows.values()],
+        "count": [len(idx) for idx in rows.values()],
+    })
     stats = stats[stats["count"] >= 10].sort_values("median",
                                                      ascending=False)
 
     fig = go.Figure()
     for _, row in stats.iterrows():
         proj = row["project"]
-        subset = proj_data[proj_data["project"] == proj]
         color = PROJECT_COLORS.get(proj, "#a9a9a9")
         fig.add_trace(go.Box(
-            x=subset["days_to_followup"],
+            x=days[rows[proj]],
             name=proj,
             marker_color=color,
             line_color=color,
@@ -1889,8 +2227,8 @@ def _make_survey_response_box(fu_data, max_days, t, height):
         ))
 
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Follow-up response time by survey",
         xaxis=dict(title="Days from discovery", range=[0, max_days]),
@@ -1900,44 +2238,40 @@ def _make_survey_response_box(fu_data, max_days, t, height):
     return fig
 
 
-def _make_followup_network(fu_data, t, height):
-    """Heatmap: discovery survey -> first follow-up survey."""
-    if len(fu_data) == 0:
-        return _empty_figure("No follow-up data", t, height)
-
-    first_fu = fu_data[fu_data["fu_rank"] == 1]
+def _make_followup_network(first_fu, t, height):
+    """Heatmap: discovery survey -> first follow-up survey.
 
-    pairs = (first_fu.groupby(["disc_project", "project"])
-             .agg(count=("days_to_followup", "size"),
-                  median_days=("days_to_followup", "median"))
-             .reset_index())
+    *first_fu* is the fu_rank == 1 subset of build_followup_data's frame.
+    """
+    if len(first_fu) == 0:
+        return _empty_figure("No follow-up data", t, height)
 
-    disc_surveys = (first_fu["disc_project"].value_counts()
-                    .head(8).index.tolist())
-    fu_surveys = (first_fu["project"].value_counts()
-                  .head(8).index.tolist())
+    # Categorical columns report unobserved categories with zero counts
+    disc_counts = first_fu["disc_project"].value_counts()
+    fu_counts = first_fu["project"].value_counts()
+    disc_surveys = disc_counts[disc_counts > 0].head(8).index.tolist()
+    fu_surveys = fu_counts[fu_counts > 0].head(8).index.tolist()
 
     if len(disc_surveys) < 2 or len(fu_surveys) < 2:
         return _empty_figure(
             "Not enough survey pairs for heatmap", t, height)
 
-    n_d, n_f = len(disc_surveys), len(fu_surveys)
-    matrix = np.zeros((n_d, n_f))
-    text_matrix = [[""] * n_f for _ in range(n_d)]
-    hover_matrix = [[""] * n_f for _ in range(n_d)]
-
-    for _, row in pairs.iterrows():
-        if (row["disc_project"] in disc_surveys
-                and row["project"] in fu_surveys):
-            i = disc_surveys.index(row["disc_project"])
-            j = fu_surveys.index(row["project"])
-            matrix[i][j] = row["count"]
-            text_matrix[i][j] = f"{int(row['count']):,}"
-            hover_matrix[i][j] = (
-                f"{row['disc_project']} \u2192 {row['project']}<br>"
-                f"{int(row['count']):,} NEOs<br>"
-                f"Median: {row['median_days']:.0f} days"
-            )
+    pairs = (first_fu.groupby(["disc_project", "project"], observed=True)
+             ["days_to_followup"].agg(["size", "median"]))
+    matrix = (pairs["size"].unstack()
+              .reindex(index=disc_surveys, columns=fu_surveys)
+              .fillna(0).to_numpy())
+    medians = (pairs["median"].unstack()
+               .reindex(index=disc_surveys, columns=fu_surveys)
+               .to_numpy())
+
+    text_matrix = [[f"{int(c):,}" if c else "" for c in row]
+                   for row in matrix]
+    hover_matrix = [
+        [(f"{d} \u2192 {f}<br>{int(c):,} NEOs<br>"
+          f"Median: {m:.0f} days") if c else ""
+         for f, c, m in zip(fu_surveys, c_row, m_row)]
+        for d, c_row, m_row in zip(disc_surveys, matrix, medians)]
 
     fig = go.Figure(go.Heatmap(
         z=matrix, x=fu_surveys, y=disc_surveys,
@@ -1951,8 +2285,8 @@ def _make_followup_network(fu_data, t, height):
         hovertemplate="%{hovertext}<extra></extra>",
     ))
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
+        template=t.template,
+        paper_bgcolor=t.paper,
         height=height,
         title="First follow-up survey network",
         xaxis=dict(title="First follow-up by", side="bottom"),
@@ -1962,20 +2296,20 @@ def _make_followup_network(fu_data, t, height):
     return fig
 
 
-def _make_followup_trend(fu_data, t, height):
-    """Median days to first follow-up by discovery year."""
-    if len(fu_data) == 0:
-        return _empty_figure("No follow-up data", t, height)
+def _make_followup_trend(first_fu, t, height):
+    """Median days to first follow-up by discovery year.
 
-    first_fu = fu_data[fu_data["fu_rank"] == 1]
+    *first_fu* is the fu_rank == 1 subset of build_followup_data's frame.
+    """
+    if len(first_fu) == 0:
+        return _empty_figure("No follow-up data", t, height)
 
-    by_year = first_fu.groupby("disc_year")["days_to_followup"].agg(
-        ["median", "count"]).reset_index()
-    q25 = first_fu.groupby("disc_year")["days_to_followup"].quantile(
-        0.25).reset_index(name="q25")
-    q75 = first_fu.groupby("disc_year")["days_to_followup"].quantile(
-        0.75).reset_index(name="q75")
-    by_year = by_year.merge(q25, on="disc_year").merge(q75, on="disc_year")
+    by_year = (first_fu.groupby("disc_year")["days_to_followup"]
+               .describe(percentiles=[0.25, 0.5, 0.75])
+               [["50%", "count", "25%", "75%"]]
+               .rename(columns={"50%": "median", "25%": "q25",
+                                "75%": "q75"})
+               .reset_index())
     by_year = by_year[by_year["count"] >= 5]
 
     if len(by_year) == 0:
@@ -1984,9 +2318,11 @@ def _make_followup_trend(fu_data, t, height):
     fig = go.Figure()
 
     # IQR band
+    years = by_year["disc_year"].to_numpy()
     fig.add_trace(go.Scatter(
-        x=list(by_year["disc_year"]) + list(by_year["disc_year"])[::-1],
-        y=list(by_year["q75"]) + list(by_year["q25"])[::-1],
+        x=np.concatenate([years, years[::-1]]),
+        y=np.concatenate([by_year["q75"].to_numpy(),
+                          by_year["q25"].to_numpy()[::-1]]),
         fill="toself",
         fillcolor="rgba(67, 99, 216, 0.15)",
         line=dict(width=0),
@@ -2015,8 +2351,8 @@ def _make_followup_trend(fu_data, t, height):
     ))
 
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Median days to first follow-up by year",
         xaxis=dict(title="Discovery year", dtick=5),
@@ -2038,8 +2374,8 @@ def _empty_figure(message, t, height):
     """Return a blank figure with a centered message."""
     fig = go.Figure()
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["paper"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.paper,
         height=height,
         xaxis=dict(visible=False),
         yaxis=dict(visible=False),
@@ -2047,153 +2383,150 @@ def _empty_figure(message, t, height):
             text=message, x=0.5, y=0.5,
             xref="paper", yref="paper",
             showarrow=False,
-            font=dict(size=16, color=t["subtext"]),
+            font=dict(size=16, color=t.subtext),
         )],
     )
     return fig
 
 
 def _venn_label(count, eligible_total, label_mode):
-    """Format a Venn region label based on the selected mode."""
+    """Venn region label lines, as (text, bold) pairs, for the selected
+    mode."""
     if label_mode == "pct":
         pct = count / eligible_total * 100 if eligible_total else 0
-        return f"<b>{pct:.1f}%</b>"
+        return [(f"{pct:.1f}%", True)]
     elif label_mode == "both":
         pct = count / eligible_total * 100 if eligible_total else 0
-        return f"<b>{count:,}</b><br>({pct:.1f}%)"
+        return [(f"{count:,}", True), (f"({pct:.1f}%)", False)]
     else:  # "counts"
-        return f"<b>{count:,}</b>"
+        return [(f"{count:,}", True)]
 
 
-def _circle_trace(cx, cy, r, color, name):
-    """Return a go.Scatter trace drawing a filled circle."""
-    theta = np.linspace(0, 2 * np.pi, 80)
-    return go.Scatter(
-        x=cx + r * np.cos(theta),
-        y=cy + r * np.sin(theta),
-        mode="lines",
-        fill="toself",
-        fillcolor=_hex_to_rgba(color, 0.25),
-        line=dict(color=color, width=2.5),
-        name=name,
-        showlegend=False,
-        hoverinfo="skip",
+# The Venn panels are static drawings, so they are rendered as inline
+# SVG rather than through Plotly: no figure layout pass and a handful of
+# DOM nodes.  Geometry is in the old figure's data units (y up); text
+# sizes are given in pixels at this nominal scale.
+_VENN_PX_PER_UNIT = 40
+_VENN_FONT = '"Open Sans", verdana, arial, sans-serif'
+
+
+def _venn_text(x, y, lines, size_px, color):
+    """SVG <text> centred on (x, y); `lines` are (text, bold) pairs."""
+    from html import escape as _escape
+
+    size = size_px / _VENN_PX_PER_UNIT
+    spans = []
+    for i, (text, bold) in enumerate(lines):
+        ty = -y + size * 1.2 * (i - (len(lines) - 1) / 2)
+        weight = ' font-weight="bold"' if bold else ""
+        spans.append(f'<tspan x="{x:g}" y="{ty:.3f}"{weight}>'
+                     f'{_escape(text)}</tspan>')
+    return (f'<text font-size="{size:.3f}" fill="{color}">'
+            f'{"".join(spans)}</text>')
+
+
+def _venn_svg(circles, texts, x_range, y_range, t, height, title):
+    """Venn panel: `circles` are (cx, cy, r, color), `texts` are
+    _venn_text() strings, ranges are the visible data extent."""
+    from urllib.parse import quote as _urlquote
+
+    x0, x1 = x_range
+    y0, y1 = y_range
+    stroke = 2.5 / _VENN_PX_PER_UNIT
+    shapes = "".join(
+        f'<circle cx="{cx:g}" cy="{-cy:g}" r="{r:g}" fill="{color}" '
+        f'fill-opacity="0.25" stroke="{color}" stroke-width="{stroke:g}"/>'
+        for cx, cy, r, color in circles)
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" '
+           f'viewBox="{x0:g} {-y1:g} {x1 - x0:g} {y1 - y0:g}" '
+           f"font-family='{_VENN_FONT}' text-anchor=\"middle\" "
+           f'dominant-baseline="central">{shapes}{"".join(texts)}</svg>')
+    return html.Div(
+        style={"height": f"{height}px", "backgroundColor": t.paper,
+               "position": "relative", "boxSizing": "border-box",
+               "padding": "60px 20px 40px"},
+        children=[
+            html.Div(title, style={
+                "position": "absolute", "top": "18px", "left": "20px",
+                "fontFamily": _VENN_FONT, "fontSize": "17px",
+                "color": t.text}),
+            html.Img(
+                src="data:image/svg+xml;charset=utf-8," + _urlquote(svg),
+                alt=title,
+                style={"width": "100%", "height": "100%",
+                       "display": "block"}),
+        ],
     )
 
 
+def _venn_message(message, t, height):
+    """Blank Venn panel with a centered message."""
+    return html.Div(
+        message,
+        style={"height": f"{height}px", "backgroundColor": t.paper,
+               "display": "flex", "alignItems": "center",
+               "justifyContent": "center", "fontFamily": _VENN_FONT,
+               "fontSize": "16px", "color": t.subtext})
+
+
 def _make_venn1(s, name, color, t, height, label_mode="counts",
                 eligible_total=0, yr_tag=""):
     """Create a single-set diagram showing one circle with its count."""
-    fig = go.Figure()
     cx, cy, r = 5.0, 3.5, 2.5
-    fig.add_trace(_circle_trace(cx, cy, r, color, name))
-    fig.add_annotation(
-        x=cx, y=cy,
-        text=_venn_label(len(s), eligible_total, label_mode),
-        showarrow=False, font=dict(size=24, color=t["text"]))
-    fig.add_annotation(
-        x=cx, y=cy + r + 0.5,
-        text=f"<b>{name}</b>",
-        showarrow=False, font=dict(size=14, color=color))
-    fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["paper"],
-        height=height,
-        title=f"NEOs detected during discovery apparition {yr_tag}",
-        xaxis=dict(range=[0, 10], showgrid=False, zeroline=False,
-                   showticklabels=False, visible=False),
-        yaxis=dict(range=[-0.5, 7.5], showgrid=False, zeroline=False,
-                   showticklabels=False, visible=False,
-                   scaleanchor="x"),
-        margin=dict(l=20, r=20, t=60, b=40),
-    )
-    return fig
+    texts = [
+        _venn_text(cx, cy, _venn_label(len(s), eligible_total, label_mode),
+                   24, t.text),
+        _venn_text(cx, cy + r + 0.5, [(name, True)], 14, color),
+    ]
+    return _venn_svg(
+        [(cx, cy, r, color)], texts, (0, 10), (-0.5, 7.5), t, height,
+        f"NEOs detected during discovery apparition {yr_tag}")
 
 
 def _make_venn2(sets, names, colors, t, height, label_mode="counts",
                 eligible_total=0, yr_tag=""):
-    """Create a 2-set Venn diagram using filled scatter circles."""
-    A, B = sets
-    a_only = len(A - B)
-    b_only = len(B - A)
-    both = len(A & B)
-
-    fig = go.Figure()
+    """Create a 2-set Venn diagram as inline SVG."""
+    _, a_only, b_only, both = _venn_region_counts(sets)
 
     r = 2.3
     cx = [3.3, 6.7]
     cy = [3.5, 3.5]
-
-    for i in range(2):
-        fig.add_trace(_circle_trace(
-            cx[i], cy[i], r, colors[i], names[i]))
+    circles = [(cx[i], cy[i], r, colors[i]) for i in range(2)]
 
     # Region labels — positions are geometric centroids of each region
     fsz = 18 if label_mode == "both" else 20
-    fig.add_annotation(x=3.0, y=3.5,
-                       text=_venn_label(a_only, eligible_total, label_mode),
-                       showarrow=False,
-                       font=dict(size=fsz, color=t["text"]))
-    fig.add_annotation(x=5.0, y=3.5,
-                       text=_venn_label(both, eligible_total, label_mode),
-                       showarrow=False,
-                       font=dict(size=fsz, color=t["text"]))
-    fig.add_annotation(x=7.0, y=3.5,
-                       text=_venn_label(b_only, eligible_total, label_mode),
-                       showarrow=False,
-                       font=dict(size=fsz, color=t["text"]))
+    texts = [
+        _venn_text(x, 3.5, _venn_label(n, eligible_total, label_mode),
+                   fsz, t.text)
+        for x, n in ((3.0, a_only), (5.0, both), (7.0, b_only))]
 
     # Set labels above circles
     for i in range(2):
-        fig.add_annotation(
-            x=cx[i], y=cy[i] + r + 0.5,
-            text=f"<b>{names[i]}</b><br>({len(sets[i]):,} total)",
-            showarrow=False,
-            font=dict(size=13, color=colors[i]))
+        texts.append(_venn_text(
+            cx[i], cy[i] + r + 0.5,
+            [(names[i], True), (f"({len(sets[i]):,} total)", False)],
+            13, colors[i]))
 
-    fig.add_annotation(
-        x=5.0, y=0.3,
-        text="Circle sizes not proportional \u2014 see counts",
-        showarrow=False,
-        font=dict(size=10, color=t["subtext"]))
+    texts.append(_venn_text(
+        5.0, 0.3,
+        [("Circle sizes not proportional \u2014 see counts", False)],
+        10, t.subtext))
 
-    fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["paper"],
-        height=height,
-        title=f"NEOs co-detected during discovery apparition {yr_tag}",
-        xaxis=dict(range=[-0.5, 10.5], showgrid=False,
-                   zeroline=False, showticklabels=False,
-                   visible=False),
-        yaxis=dict(range=[-0.5, 7.5], showgrid=False,
-                   zeroline=False, showticklabels=False,
-                   visible=False, scaleanchor="x"),
-        margin=dict(l=20, r=20, t=60, b=40),
-    )
-    return fig
+    return _venn_svg(
+        circles, texts, (-0.5, 10.5), (-0.5, 7.5), t, height,
+        f"NEOs co-detected during discovery apparition {yr_tag}")
 
 
 def _make_venn3(sets, names, colors, t, height, label_mode="counts",
                 eligible_total=0, yr_tag=""):
-    """Create a 3-set Venn diagram using filled scatter circles."""
-    A, B, C = sets
-    abc = A & B & C
-    ab_only = (A & B) - C
-    ac_only = (A & C) - B
-    bc_only = (B & C) - A
-    a_only = A - B - C
-    b_only = B - A - C
-    c_only = C - A - B
-
-    fig = go.Figure()
+    """Create a 3-set Venn diagram as inline SVG."""
+    (_, a_only, b_only, ab_only,
+     c_only, ac_only, bc_only, abc) = _venn_region_counts(sets)
 
     r = 2.2
     cx = [3.5, 6.5, 5.0]
     cy = [4.8, 4.8, 2.2]
-
-    for i in range(3):
-        fig.add_trace(_circle_trace(
-            cx[i], cy[i], r, colors[i], names[i]))
+    circles = [(cx[i], cy[i], r, colors[i]) for i in range(3)]
 
     # Region annotations — positions are geometric centroids of each region
     regions = [
@@ -2206,41 +2539,27 @@ def _make_venn3(sets, names, colors, t, height, label_mode="counts",
         (5.0, 3.9, abc),
     ]
     fsz = 14 if label_mode == "both" else 16
-    for x, y, val in regions:
-        fig.add_annotation(
-            x=x, y=y,
-            text=_venn_label(len(val), eligible_total, label_mode),
-            showarrow=False, font=dict(size=fsz, color=t["text"]))
+    texts = [
+        _venn_text(x, y, _venn_label(val, eligible_total, label_mode),
+                   fsz, t.text)
+        for x, y, val in regions]
 
     # Set labels
     label_pos = [(3.5, 7.5), (6.5, 7.5), (5.0, -0.5)]
     for i in range(3):
-        fig.add_annotation(
-            x=label_pos[i][0], y=label_pos[i][1],
-            text=f"<b>{names[i]}</b><br>({len(sets[i]):,} total)",
-            showarrow=False,
-            font=dict(size=12, color=colors[i]))
+        texts.append(_venn_text(
+            label_pos[i][0], label_pos[i][1],
+            [(names[i], True), (f"({len(sets[i]):,} total)", False)],
+            12, colors[i]))
 
-    fig.add_annotation(
-        x=5.0, y=-1.0,
-        text="Circle sizes not proportional \u2014 see counts",
-        showarrow=False,
-        font=dict(size=10, color=t["subtext"]))
+    texts.append(_venn_text(
+        5.0, -1.0,
+        [("Circle sizes not proportional \u2014 see counts", False)],
+        10, t.subtext))
 
-    fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["paper"],
-        height=height,
-        title=f"NEOs co-detected during discovery apparition {yr_tag}",
-        xaxis=dict(range=[-0.5, 10.5], showgrid=False,
-                   zeroline=False, showticklabels=False,
-                   visible=False),
-        yaxis=dict(range=[-1.5, 8.5], showgrid=False,
-                   zeroline=False, showticklabels=False,
-                   visible=False, scaleanchor="x"),
-        margin=dict(l=20, r=20, t=60, b=40),
-    )
-    return fig
+    return _venn_svg(
+        circles, texts, (-0.5, 10.5), (-1.5, 8.5), t, height,
+        f"NEOs co-detected during discovery apparition {yr_tag}")
 
 
 _BOTTOM_SURVEYS = {"Other Follow-up", "Other Surveys", "Historical",
@@ -2289,7 +2608,7 @@ def _make_survey_reach(survey_sets, t, height, yr_tag="",
     hover_texts = []
     for name, desigs in items:
         v = _value(name, desigs)
-        stns = sorted(PROJECT_STATIONS.get(name, []))
+        stns = PROJECT_STATIONS.get(name, [])
         if stns and len(stns) > 15:
             hover_texts.append(
                 f"{name}: {v:,} {metric_label}"
@@ -2320,8 +2639,8 @@ def _make_survey_reach(survey_sets, t, height, yr_tag="",
     # Pad x-axis to prevent text clipping on the longest bar
     max_count = max(counts) if counts else 0
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         title=(f"Discovery apparition: {metric_label_cap} "
                f"per survey {yr_tag}"),
         xaxis_title=("Unique NEOs" if metric == "neos"
@@ -2333,6 +2652,27 @@ def _make_survey_reach(survey_sets, t, height, yr_tag="",
     return fig
 
 
+def _membership_matrix(sets):
+    """0/1 float32 matrix, one row per designation set in `sets` and one
+    column per distinct designation across them.  Products of it with
+    its transpose count pairwise overlaps exactly (well below 2**24)."""
+    sizes = [len(s) for s in sets]
+    desigs = np.fromiter(
+        (d for s in sets for d in s), dtype=object, count=sum(sizes))
+    codes, uniques = pd.factorize(desigs)
+    member = np.zeros((len(sets), len(uniques)), dtype=np.float32)
+    member[np.repeat(np.arange(len(sets)), sizes), codes] = 1
+    return member
+
+
+def _venn_region_counts(sets):
+    """Sizes of every Venn region of `sets`, indexed by membership
+    bitmask (bit i set = in sets[i]); entry 0 is always 0."""
+    member = _membership_matrix(sets).astype(np.intp)
+    weights = 1 << np.arange(len(sets))
+    return np.bincount(weights @ member, minlength=1 << len(sets))
+
+
 def _make_pairwise_heatmap(survey_sets, t, height, yr_tag=""):
     """Asymmetric co-detection percentage matrix."""
     names = sorted(survey_sets.keys(),
@@ -2343,21 +2683,14 @@ def _make_pairwise_heatmap(survey_sets, t, height, yr_tag=""):
         return _empty_figure(
             "Not enough surveys for heatmap", t, height)
 
-    n = len(names)
-    matrix = np.zeros((n, n))
-    text_matrix = [[""] * n for _ in range(n)]
-
-    for i, ni in enumerate(names):
-        si = survey_sets[ni]
-        for j, nj in enumerate(names):
-            sj = survey_sets[nj]
-            overlap = len(si & sj)
-            pct = overlap / len(si) * 100 if len(si) > 0 else 0
-            matrix[i][j] = pct
-            if i == j:
-                text_matrix[i][j] = f"{len(si):,}"
-            else:
-                text_matrix[i][j] = f"{pct:.0f}%"
+    member = _membership_matrix([survey_sets[n] for n in names])
+    overlap = (member @ member.T).astype(np.int64)
+    sizes = overlap.diagonal()
+    matrix = overlap / sizes[:, None] * 100
+    # Off-diagonal: rounded percentage; diagonal: the survey's NEO count
+    text_matrix = np.char.add(
+        np.rint(matrix).astype(np.int64).astype(str), "%").astype(object)
+    text_matrix[np.diag_indices(len(names))] = [f"{n:,}" for n in sizes]
 
     fig = go.Figure(go.Heatmap(
         z=matrix, x=names, y=names,
@@ -2371,8 +2704,8 @@ def _make_pairwise_heatmap(survey_sets, t, height, yr_tag=""):
             "%{y} \u2192 %{x}: %{text}<extra></extra>"),
     ))
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
+        template=t.template,
+        paper_bgcolor=t.paper,
         title=f"Pairwise co-detection (% of row survey's NEOs) {yr_tag}",
         height=height,
         xaxis=dict(title="Also detected by", side="bottom"),
@@ -2392,20 +2725,21 @@ def _make_comparison_summary(survey_sets, all_desigs, t, height,
         if proj in _BOTTOM_SURVEYS}
     survey_sets_filt = {k: v for k, v in survey_sets.items()
                         if k not in _exclude}
-    desig_survey_count = {}
-    for desig in all_desigs:
-        desig_survey_count[desig] = sum(
-            1 for s in survey_sets_filt.values() if desig in s)
+    # Surveys per detected NEO: each set holds eligible designations
+    # only, so counting occurrences across the sets is enough
+    codes, _ = pd.factorize(np.fromiter(
+        (d for v in survey_sets_filt.values() for d in v), dtype=object,
+        count=sum(len(v) for v in survey_sets_filt.values())))
+    survey_counts = np.bincount(codes)
+    hist = np.bincount(survey_counts, minlength=3)
 
     total = len(all_desigs)
-    detected_any = sum(
-        1 for n in desig_survey_count.values() if n > 0)
-    by_1 = sum(1 for n in desig_survey_count.values() if n == 1)
-    by_2 = sum(1 for n in desig_survey_count.values() if n == 2)
-    by_3plus = sum(1 for n in desig_survey_count.values() if n >= 3)
-    survey_counts = [n for n in desig_survey_count.values() if n > 0]
-    mean_s = np.mean(survey_counts) if survey_counts else 0
-    median_s = np.median(survey_counts) if survey_counts else 0
+    detected_any = len(survey_counts)
+    by_1 = int(hist[1])
+    by_2 = int(hist[2])
+    by_3plus = detected_any - by_1 - by_2
+    mean_s = survey_counts.mean() if detected_any else 0
+    median_s = np.median(survey_counts) if detected_any else 0
 
     def pct(n):
         return f" ({n / total * 100:.1f}%)" if total > 0 else ""
@@ -2432,20 +2766,20 @@ def _make_comparison_summary(survey_sets, all_desigs, t, height,
     fig = go.Figure(go.Table(
         header=dict(
             values=["Statistic", "Value"],
-            fill_color=t["table_header"],
-            font=dict(color=t["text"], size=13),
+            fill_color=t.table_header,
+            font=dict(color=t.text, size=13),
             align="left",
         ),
         cells=dict(
             values=[labels, values],
-            fill_color=t["table_cell"],
-            font=dict(color=t["table_font"], size=12),
+            fill_color=t.table_cell,
+            font=dict(color=t.table_font, size=12),
             align="left",
         ),
     ))
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
+        template=t.template,
+        paper_bgcolor=t.paper,
         title=f"Discovery apparition: Detection Summary (surveys only) {yr_tag}",
         height=height,
         margin=dict(l=10, r=10, t=60, b=10),
@@ -2473,8 +2807,7 @@ def _make_annual_overlap(df_main, df_app, survey_select, year_range,
             "Select surveys for annual chart", t, height)
 
     # --- per-year survey sets -------------------------------------------
-    eligible_main = df_main[
-        (df_main["disc_year"] >= y0) & (df_main["disc_year"] <= y1)]
+    eligible_main = _year_slice(df_main, y0, y1)
     if size_filter != "all":
         eligible_main = eligible_main[
             eligible_main["size_class"] == size_filter]
@@ -2486,8 +2819,7 @@ def _make_annual_overlap(df_main, df_app, survey_select, year_range,
     show_pct = label_mode == "pct"
 
     # Pre-filter apparition data once with window
-    app_filt = df_app[df_app["designation"].isin(
-        set(eligible_main["designation"]))]
+    app_filt = df_app[_designation_mask(df_app, eligible_main)]
     if exclude_precovery:
         app_filt = app_filt[app_filt["post_disc_days"].between(
             0, window_days)]
@@ -2501,8 +2833,9 @@ def _make_annual_overlap(df_main, df_app, survey_select, year_range,
     # Determine grouping column
     if group_col == "station_code":
         app_filt = app_filt.copy()
-        app_filt["_grp"] = app_filt["station_code"].where(
-            app_filt["station_code"].isin(STATION_TO_PROJECT),
+        stn = app_filt["station_code"].astype(object)
+        app_filt["_grp"] = stn.where(
+            stn.isin(STATION_TO_PROJECT),
             "Other Follow-up")
     else:
         app_filt = app_filt.copy()
@@ -2511,10 +2844,10 @@ def _make_annual_overlap(df_main, df_app, survey_select, year_range,
     # Build per-survey, per-year counts
     series = {sv: [] for sv in surveys}
     for yr in years:
-        desigs_yr = set(eligible_main.loc[
-            eligible_main["disc_year"] == yr, "designation"])
-        elig = len(desigs_yr)
-        app_yr = app_filt[app_filt["designation"].isin(desigs_yr)]
+        in_year = (eligible_main["disc_year"] == yr).to_numpy()
+        elig = int(in_year.sum())
+        app_yr = app_filt[
+            _designation_mask(app_filt, eligible_main, in_year)]
         for sv in surveys:
             n = app_yr.loc[
                 app_yr["_grp"] == sv, "designation"].nunique()
@@ -2551,8 +2884,8 @@ def _make_annual_overlap(df_main, df_app, survey_select, year_range,
     yaxis_title = ("% of eligible NEOs" if show_pct
                    else "NEOs detected (apparition)")
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         title="Annual detections during discovery apparition",
         xaxis_title="Discovery year",
         yaxis_title=yaxis_title,
@@ -2570,45 +2903,96 @@ def _make_annual_overlap(df_main, df_app, survey_select, year_range,
 # Discovery circumstances helpers
 # ---------------------------------------------------------------------------
 
-def _make_sky_map(dff, color_by, group_by, t, height):
-    """RA/Dec scatter of discovery positions with ecliptic/galactic planes.
+def _size_codes(frame):
+    """size_class of each row as its H_BINS index (-1 for unknown H).
 
-    Uses centered RA: 180° (E) on left, 0° center, -180° (W) on right.
+    size_class is categorical over H_BIN_LABELS + ["Unknown H"], so the
+    category codes already are the bin indices.
     """
-    fig = go.Figure()
+    codes = frame["size_class"].cat.codes.to_numpy()
+    return np.where(codes < len(H_BINS), codes, -1)
 
-    # Ecliptic plane
-    fig.add_trace(go.Scatter(
-        x=ECL_RA, y=ECL_DEC, mode="lines",
+
+def _group_rows(frame, col):
+    """Row positions of `frame` per observed value of `col`, from one
+    groupby pass (positions ascending, so ``frame.iloc[rows[v]]``
+    matches ``frame[frame[col] == v]``)."""
+    return frame.groupby(col, observed=True, sort=False).indices
+
+
+# Ecliptic and galactic plane overlays, identical on every sky map.
+# float32 is ample for line plotting and halves their encoded size.
+_SKY_PLANE_TRACES = [
+    go.Scatter(
+        x=ECL_RA.astype(np.float32), y=ECL_DEC.astype(np.float32),
+        mode="lines",
         line=dict(color="gold", width=1.5, dash="dash"),
         name="Ecliptic", hoverinfo="skip",
-    ))
-    # Galactic plane
-    fig.add_trace(go.Scatter(
-        x=GAL_RA, y=GAL_DEC, mode="lines",
+    ),
+    go.Scatter(
+        x=GAL_RA.astype(np.float32), y=GAL_DEC.astype(np.float32),
+        mode="lines",
         line=dict(color="gray", width=1.5, dash="dash"),
         name="Galactic plane", hoverinfo="skip",
-    ))
+    ),
+]
 
-    valid = dff[dff["avg_ra_deg"].notna() & dff["avg_dec_deg"].notna()].copy()
+# Above this many positions the sky map switches from one marker per
+# NEO to a binned density image (payload O(grid) instead of O(N)).
+_SKY_MAP_MAX_POINTS = 50_000
+_SKY_RA_EDGES = np.arange(-180, 181, 1.0)
+_SKY_DEC_EDGES = np.arange(-90, 91, 1.0)
+_SKY_RA_CENTERS = _SKY_RA_EDGES[:-1] + 0.5
+_SKY_DEC_CENTERS = _SKY_DEC_EDGES[:-1] + 0.5
+
+
+def _sky_density_trace(ra_c, dec):
+    """Heatmap of NEO counts per 1°×1° cell (centered RA), empty cells
+    left transparent."""
+    counts, _, _ = np.histogram2d(
+        dec, ra_c, bins=[_SKY_DEC_EDGES, _SKY_RA_EDGES])
+    return go.Heatmap(
+        z=np.where(counts > 0, counts, np.nan).astype(np.float32),
+        x=_SKY_RA_CENTERS, y=_SKY_DEC_CENTERS,
+        colorscale="Viridis", showscale=True,
+        colorbar=dict(title="NEOs"),
+        name="NEOs",
+        hovertemplate=(
+            "RA %{x:.1f}\u00b0  Dec %{y:.1f}\u00b0<br>"
+            "%{z:,.0f} NEOs<extra></extra>"
+        ),
+    )
+
+
+def _make_sky_map(dff, color_by, group_by, t, height):
+    """RA/Dec scatter of discovery positions with ecliptic/galactic planes.
+
+    Uses centered RA: 180° (E) on left, 0° center, -180° (W) on right.
+    """
+    fig = go.Figure()
+    fig.add_traces(_SKY_PLANE_TRACES)
+
+    valid = dff[dff["avg_ra_deg"].notna() & dff["avg_dec_deg"].notna()]
     if len(valid) == 0:
         fig.update_layout(
-            template=t["template"],
-            paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+            template=t.template,
+            paper_bgcolor=t.paper, plot_bgcolor=t.plot,
             height=height,
             title="Discovery sky positions (no data)",
         )
         return fig
 
     # Convert RA to centered coordinates for plotting
-    valid["ra_c"] = np.where(
-        valid["avg_ra_deg"] > 180,
-        valid["avg_ra_deg"] - 360,
-        valid["avg_ra_deg"])
-
-    if color_by == "year":
+    ra = valid["avg_ra_deg"].to_numpy()
+    ra_c = np.where(ra > 180, ra - 360, ra)
+
+    if len(valid) > _SKY_MAP_MAX_POINTS:
+        # Too many markers to ship: draw counts on a 1° grid instead
+        fig.add_trace(_sky_density_trace(
+            ra_c, valid["avg_dec_deg"].to_numpy()))
+    elif color_by == "year":
         fig.add_trace(go.Scattergl(
-            x=valid["ra_c"], y=valid["avg_dec_deg"],
+            x=ra_c, y=valid["avg_dec_deg"],
             mode="markers",
             marker=dict(size=3, opacity=0.3,
                         color=valid["disc_year"],
@@ -2623,12 +3007,15 @@ def _make_sky_map(dff, color_by, group_by, t, height):
             text=valid["designation"],
         ))
     elif color_by == "size":
+        codes = _size_codes(valid)
+        dec = valid["avg_dec_deg"].to_numpy()
+        desig = valid["designation"].to_numpy()
         for i, (label, _, _) in enumerate(H_BINS):
-            subset = valid[valid["size_class"] == label]
-            if len(subset) == 0:
+            idx = np.flatnonzero(codes == i)
+            if idx.size == 0:
                 continue
             fig.add_trace(go.Scattergl(
-                x=subset["ra_c"], y=subset["avg_dec_deg"],
+                x=ra_c[idx], y=dec[idx],
                 mode="markers",
                 marker=dict(size=3, opacity=0.3,
                             color=SIZE_COLORS[i]),
@@ -2637,25 +3024,26 @@ def _make_sky_map(dff, color_by, group_by, t, height):
                     "RA %{customdata:.1f}\u00b0  Dec %{y:.1f}\u00b0<br>"
                     "%{text}<extra></extra>"
                 ),
-                customdata=subset["avg_ra_deg"],
-                text=subset["designation"],
+                customdata=ra[idx],
+                text=desig[idx],
             ))
     else:
         # Color by survey project
         col = "project" if group_by != "station" else "station_name"
+        rows = _group_rows(valid, col)
         if col == "project":
-            groups = [p for p in PROJECT_ORDER
-                      if p in valid[col].unique()]
+            groups = [p for p in PROJECT_ORDER if p in rows]
             cmap = PROJECT_COLORS
         else:
             groups = valid[col].value_counts().head(10).index.tolist()
             cmap = {}
         for gname in groups:
-            subset = valid[valid[col] == gname]
-            if len(subset) == 0:
+            in_grp = rows.get(gname)
+            if in_grp is None:
                 continue
+            subset = valid.iloc[in_grp]
             fig.add_trace(go.Scattergl(
-                x=subset["ra_c"], y=subset["avg_dec_deg"],
+                x=ra_c[in_grp], y=subset["avg_dec_deg"],
                 mode="markers",
                 marker=dict(size=3, opacity=0.3,
                             color=cmap.get(gname)),
@@ -2669,8 +3057,8 @@ def _make_sky_map(dff, color_by, group_by, t, height):
             ))
 
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Discovery sky positions",
         xaxis=dict(
@@ -2685,6 +3073,30 @@ def _make_sky_map(dff, color_by, group_by, t, height):
     return fig
 
 
+# Discovery V-magnitude histogram bins: 0.5 mag wide over [10, 28)
+_MAG_BIN_EDGES = np.arange(10.0, 28.01, 0.5)
+_MAG_BIN_CENTERS = _MAG_BIN_EDGES[:-1] + 0.25
+
+
+def _mag_hist_bar(v_mag, name, color):
+    """Pre-binned stacked-histogram bar trace for `v_mag`.
+
+    Counts are taken server-side on left-closed bins (as Plotly's own
+    histogram bins them), so the figure carries 36 counts per trace
+    instead of every raw magnitude.
+    """
+    idx = np.searchsorted(_MAG_BIN_EDGES, v_mag.to_numpy(dtype=float),
+                          side="right") - 1
+    n_bins = len(_MAG_BIN_CENTERS)
+    counts = np.bincount(idx[(idx >= 0) & (idx < n_bins)],
+                         minlength=n_bins)
+    return go.Bar(
+        x=_MAG_BIN_CENTERS, y=counts, width=0.5,
+        name=name, marker_color=color,
+        hovertemplate="V=%{x:.2f}: %{y}<extra></extra>",
+    )
+
+
 def _make_mag_distribution(dff, color_by, group_by, t, height):
     """Histogram of apparent V magnitude at discovery."""
     valid = dff[dff["median_v_mag"].notna()]
@@ -2694,47 +3106,37 @@ def _make_mag_distribution(dff, color_by, group_by, t, height):
     fig = go.Figure()
 
     if color_by == "size":
+        codes = _size_codes(valid)
+        v_mag = valid["median_v_mag"]
         for i, (label, _, _) in enumerate(H_BINS):
-            subset = valid[valid["size_class"] == label]
-            if len(subset) == 0:
+            idx = np.flatnonzero(codes == i)
+            if idx.size == 0:
                 continue
-            fig.add_trace(go.Histogram(
-                x=subset["median_v_mag"], name=label,
-                marker_color=SIZE_COLORS[i],
-                xbins=dict(start=10, end=28, size=0.5),
-                hovertemplate="V=%{x:.1f}: %{y}<extra></extra>",
-            ))
+            fig.add_trace(_mag_hist_bar(
+                v_mag.iloc[idx], label, SIZE_COLORS[i]))
     elif color_by == "survey":
         col = "project" if group_by != "station" else "station_name"
+        rows = _group_rows(valid, col)
         if col == "project":
-            groups = [p for p in PROJECT_ORDER
-                      if p in valid[col].unique()]
+            groups = [p for p in PROJECT_ORDER if p in rows]
             cmap = PROJECT_COLORS
         else:
             groups = valid[col].value_counts().head(10).index.tolist()
             cmap = {}
         for gname in groups:
-            subset = valid[valid[col] == gname]
-            if len(subset) == 0:
+            if gname not in rows:
                 continue
-            fig.add_trace(go.Histogram(
-                x=subset["median_v_mag"], name=gname,
-                marker_color=cmap.get(gname),
-                xbins=dict(start=10, end=28, size=0.5),
-                hovertemplate="V=%{x:.1f}: %{y}<extra></extra>",
-            ))
+            subset = valid.iloc[rows[gname]]
+            fig.add_trace(_mag_hist_bar(
+                subset["median_v_mag"], gname, cmap.get(gname)))
     else:
-        fig.add_trace(go.Histogram(
-            x=valid["median_v_mag"], name="NEOs",
-            marker_color="#607D8B",
-            xbins=dict(start=10, end=28, size=0.5),
-            hovertemplate="V=%{x:.1f}: %{y}<extra></extra>",
-        ))
+        fig.add_trace(_mag_hist_bar(
+            valid["median_v_mag"], "NEOs", "#607D8B"))
 
     fig.update_layout(
         barmode="stack",
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Apparent V magnitude at discovery",
         xaxis=dict(title="Apparent V magnitude"),
@@ -2778,12 +3180,16 @@ def _make_rate_plot(dff, color_by, group_by, t, height):
             text=valid["designation"],
         ))
     elif color_by == "size":
+        codes = _size_codes(valid)
+        h = valid["h"].to_numpy()
+        rate = valid["rate_deg_per_day"].to_numpy()
+        desig = valid["designation"].to_numpy()
         for i, (label, _, _) in enumerate(H_BINS):
-            subset = valid[valid["size_class"] == label]
-            if len(subset) == 0:
+            idx = np.flatnonzero(codes == i)
+            if idx.size == 0:
                 continue
             fig.add_trace(go.Scattergl(
-                x=subset["h"], y=subset["rate_deg_per_day"],
+                x=h[idx], y=rate[idx],
                 mode="markers",
                 marker=dict(size=3, opacity=0.3,
                             color=SIZE_COLORS[i]),
@@ -2792,21 +3198,21 @@ def _make_rate_plot(dff, color_by, group_by, t, height):
                     "H=%{x:.1f}  Rate=%{y:.2f} \u00b0/day<br>"
                     "%{text}<extra></extra>"
                 ),
-                text=subset["designation"],
+                text=desig[idx],
             ))
     else:
         col = "project" if group_by != "station" else "station_name"
+        rows = _group_rows(valid, col)
         if col == "project":
-            groups = [p for p in PROJECT_ORDER
-                      if p in valid[col].unique()]
+            groups = [p for p in PROJECT_ORDER if p in rows]
             cmap = PROJECT_COLORS
         else:
             groups = valid[col].value_counts().head(10).index.tolist()
             cmap = {}
         for gname in groups:
-            subset = valid[valid[col] == gname]
-            if len(subset) == 0:
+            if gname not in rows:
                 continue
+            subset = valid.iloc[rows[gname]]
             fig.add_trace(go.Scattergl(
                 x=subset["h"], y=subset["rate_deg_per_day"],
                 mode="markers",
@@ -2821,8 +3227,8 @@ def _make_rate_plot(dff, color_by, group_by, t, height):
             ))
 
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Rate of motion vs. absolute magnitude",
         xaxis=dict(title="Absolute magnitude H",
@@ -2837,7 +3243,7 @@ def _make_rate_plot(dff, color_by, group_by, t, height):
             text=f"{n_excluded:,} single-obs tracklets excluded",
             xref="paper", yref="paper", x=0.98, y=0.02,
             showarrow=False,
-            font=dict(size=10, color=t["subtext"]),
+            font=dict(size=10, color=t.subtext),
             xanchor="right",
         )
     return fig
@@ -2853,20 +3259,24 @@ def _make_pa_rose(dff, t, height):
 
     bin_size = 15
     bins = np.arange(0, 360, bin_size)
-    counts, _ = np.histogram(valid["position_angle_deg"], bins=np.append(bins, 360))
+    pa = valid["position_angle_deg"].to_numpy(dtype=float)
+    in_range = (pa >= 0) & (pa <= 360)
+    # Uniform bins: index by integer division; 360° closes the last bin
+    idx = np.minimum(pa[in_range] // bin_size, len(bins) - 1)
+    counts = np.bincount(idx.astype(np.intp), minlength=len(bins))
 
     fig = go.Figure(go.Barpolar(
         r=counts, theta=bins + bin_size / 2,
         width=bin_size,
         marker_color="#607D8B",
-        marker_line_color=t["paper"],
+        marker_line_color=t.paper,
         marker_line_width=0.5,
         hovertemplate="PA %{theta:.0f}\u00b0: %{r:,}<extra></extra>",
     ))
 
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
+        template=t.template,
+        paper_bgcolor=t.paper,
         height=height,
         title="Position angle of motion",
         polar=dict(
@@ -2876,7 +3286,7 @@ def _make_pa_rose(dff, t, height):
                 tickvals=[0, 45, 90, 135, 180, 225, 270, 315],
                 ticktext=["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
             ),
-            bgcolor=t["plot"],
+            bgcolor=t.plot,
         ),
         margin=dict(l=40, r=40, t=60, b=40),
     )
@@ -2885,7 +3295,7 @@ def _make_pa_rose(dff, t, height):
             text=f"{n_excluded:,} single-obs excluded",
             xref="paper", yref="paper", x=0.98, y=0.02,
             showarrow=False,
-            font=dict(size=10, color=t["subtext"]),
+            font=dict(size=10, color=t.subtext),
             xanchor="right",
         )
     return fig
@@ -2915,8 +3325,9 @@ def _make_elongation_hist(dff, color_by, group_by, t, height):
         ))
 
     if color_by == "size":
+        codes = _size_codes(valid)
         for i, (label, _, _) in enumerate(H_BINS):
-            mask = valid["size_class"].values == label
+            mask = codes == i
             if not mask.any():
                 continue
             _add_hist(
@@ -2957,8 +3368,8 @@ def _make_elongation_hist(dff, color_by, group_by, t, height):
 
     fig.update_layout(
         barmode="stack",
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         title="Solar elongation at discovery",
         xaxis=dict(title="Solar Elongation",
@@ -2974,27 +3385,27 @@ def _make_elongation_hist(dff, color_by, group_by, t, height):
     fig.add_annotation(
         text="\u2190 Morning sky", xref="paper", yref="paper",
         x=0.22, y=-0.15, showarrow=False,
-        font=dict(size=11, color=t["subtext"]), xanchor="center",
+        font=dict(size=11, color=t.subtext), xanchor="center",
     )
     fig.add_annotation(
         text="Evening sky \u2192", xref="paper", yref="paper",
         x=0.78, y=-0.15, showarrow=False,
-        font=dict(size=11, color=t["subtext"]), xanchor="center",
+        font=dict(size=11, color=t.subtext), xanchor="center",
     )
     fig.add_annotation(
         text="\u2600", xref="paper", yref="paper",
         x=0.0, y=-0.15, showarrow=False,
-        font=dict(size=12, color=t["subtext"]), xanchor="left",
+        font=dict(size=12, color=t.subtext), xanchor="left",
     )
     fig.add_annotation(
         text="\u2600", xref="paper", yref="paper",
         x=1.0, y=-0.15, showarrow=False,
-        font=dict(size=12, color=t["subtext"]), xanchor="right",
+        font=dict(size=12, color=t.subtext), xanchor="right",
     )
     fig.add_annotation(
         text="Opposition", xref="paper", yref="paper",
         x=0.5, y=-0.15, showarrow=False,
-        font=dict(size=11, color=t["subtext"]), xanchor="center",
+        font=dict(size=11, color=t.subtext), xanchor="center",
     )
     return fig
 
@@ -3004,6 +3415,7 @@ def _make_elongation_hist(dff, color_by, group_by, t, height):
 # ---------------------------------------------------------------------------
 
 app = Dash(__name__, suppress_callback_exceptions=True,
+           serve_locally=not _SERVE_CDN,
            title="Planetary Defense Dashboard (βeta)",
            meta_tags=[
                {"name": "viewport",
@@ -3041,11 +3453,38 @@ app = Dash(__name__, suppress_callback_exceptions=True,
                             "assets/CSS_logo_transparent.png")},
            ])
 server = app.server  # Flask WSGI server for gunicorn deployment
+_ASSETS_URL_PREFIX = app.get_relative_path("/assets/")
+
+
+def _fingerprinted_asset_url(name):
+    """Asset URL carrying a content hash, so it can be cached for a year
+    and still change whenever the file does."""
+    path = os.path.join(os.path.dirname(__file__), "assets", name)
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:10]
+    return f"{app.get_asset_url(name)}?v={digest}"
+
+
+_LOGO_URL = _fingerprinted_asset_url("CSS_logo_transparent.png")
 
 
 @server.after_request
 def _add_cache_headers(response):
-    """Prevent browser from caching CSS/JS assets during development."""
+    """Prevent browser from caching our own CSS/JS assets during development.
+
+    Only the app's assets/ files are affected.  Dash's component bundles
+    (including the ~3 MB plotly.js) are served from fingerprinted URLs
+    with a one-year max-age, which must be left alone so browsers reuse
+    them across page loads.  Images requested through
+    _fingerprinted_asset_url() get the same long-lived, immutable policy.
+    """
+    if not request.path.startswith(_ASSETS_URL_PREFIX):
+        return response
+    if (request.args.get("v") and response.status_code == 200
+            and (response.content_type or "").startswith("image/")):
+        response.headers["Cache-Control"] = (
+            "public, max-age=31536000, immutable")
+        return response
     if response.content_type and ("css" in response.content_type
                                   or "javascript" in response.content_type):
         response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
@@ -3087,8 +3526,13 @@ def _load_all_data():
     global query_timestamp
     global year_min, year_max, _data_error
     try:
+        # The apparition query is the slow one; run it alongside the
+        # discovery load.  The call below joins the in-flight load.
+        threading.Thread(target=_prefetch_apparition, daemon=True).start()
         df, query_timestamp = load_data()
         df_apparition = load_apparition_data()
+        _align_categories((df, df_apparition), "station_code")
+        _align_categories((df, df_apparition), "project")
         year_min = int(df["disc_year"].min())
         year_max = int(df["disc_year"].max())
         print(f"Data ready: {len(df):,} NEOs, "
@@ -3102,6 +3546,8 @@ def _load_all_data():
             print(f"Source membership attached: {len(membership):,} "
                   f"v_membership_wide rows; df all-six count = "
                   f"{int(df['all_six_agree'].sum()):,}")
+        _attach_designation_ids(df, df_apparition)
+        _disc_info_index(df)
         load_obscodes()
         df_lifetime = load_lifetime_followup()
         df_site_mag_stats = load_site_mag_stats()
@@ -3117,6 +3563,60 @@ _loader_thread.start()
 # Pre-load MPS archive bundle index so first timeline render isn't delayed
 threading.Thread(target=_load_mps_bundles, daemon=True).start()
 
+# Shared RangeSlider marks and tooltip (the year span is fixed above)
+YEAR_MARKS = {y: {"label": str(y)} for y in range(year_min, year_max + 1, 5)}
+YEAR_MARKS_10 = {y: {"label": str(y)}
+                 for y in range(year_min, year_max + 1, 10)}
+H_MARKS = {h: {"label": str(h)} for h in range(16, 28)}
+SLIDER_TOOLTIP = {"placement": "bottom", "always_visible": False}
+
+# Size-class and survey dropdown options
+_SIZE_OPTIONS = ([{"label": "All sizes", "value": "all"}]
+                 + [{"label": l, "value": l} for l, _, _ in H_BINS])
+_SIZE_OPTIONS_SPLIT = (_SIZE_OPTIONS[:1]
+                       + [{"label": "Split sizes", "value": "split"}]
+                       + _SIZE_OPTIONS[1:])
+_SURVEY_SELECT_OPTIONS = (
+    [{"label": p, "value": p}
+     for p in PROJECT_ORDER if p not in _BOTTOM_SURVEYS]
+    + [{"label": "\u2500" * 20, "value": "_sep", "disabled": True}]
+    + [{"label": p, "value": p} for p in _BOTTOM_ORDER]
+)
+
+# Shared RadioItems options (tuples: built once, reused by every
+# control that offers the same choices)
+_GROUP_BY_OPTIONS = (
+    {"label": " Combined", "value": "combined"},
+    {"label": " Project", "value": "project"},
+    {"label": " Station", "value": "station"},
+)
+_PLOT_HEIGHT_OPTIONS = (
+    {"label": " Short", "value": "500"},
+    {"label": " Normal", "value": "700"},
+    {"label": " Tall", "value": "900"},
+)
+_THEME_OPTIONS = (
+    {"label": " Light", "value": "light"},
+    {"label": " Dark", "value": "dark"},
+)
+_VIEW_OPTIONS = (
+    {"label": " Per year", "value": "annual"},
+    {"label": " Cumulative", "value": "cumulative"},
+)
+_YSCALE_OPTIONS = (
+    {"label": " Log", "value": "log"},
+    {"label": " Linear", "value": "linear"},
+)
+_PRECOVERY_OPTIONS = (
+    {"label": " Post-discovery", "value": "post_only"},
+    {"label": " Include precoveries", "value": "include"},
+)
+_METRIC_OPTIONS = (
+    {"label": " NEOs", "value": "neos"},
+    {"label": " Tracklets", "value": "tracklets"},
+    {"label": " Obs", "value": "observations"},
+)
+
 # Label style helper
 LABEL_STYLE = {"fontFamily": "sans-serif", "fontSize": "13px"}
 # RadioItems label style — "inherit" lets the page-container color propagate
@@ -3129,6 +3629,22 @@ DOWNLOAD_BTN_STYLE = {
     "cursor": "pointer",
     "whiteSpace": "nowrap",
 }
+SMALL_BTN_STYLE = {"padding": "4px 12px", "fontSize": "12px",
+                   "cursor": "pointer"}
+# Bottom-aligned, wrapping row of tab controls
+CONTROL_ROW_STYLE = {"display": "flex", "gap": "20px", "flexWrap": "wrap",
+                     "alignItems": "flex-end", "marginBottom": "15px"}
+# Inline error message returned by the Tools-tab calculators
+ERROR_TEXT_STYLE = {"color": "#c0392b", "fontSize": "12px"}
+# Collapsible html.Details sections (MPEC detail, observation timeline)
+SECTION_DETAILS_STYLE = {"marginBottom": "12px",
+                         "border": "1px solid var(--hr-color, #ccc)",
+                         "borderRadius": "6px"}
+SECTION_SUMMARY_STYLE = {"padding": "10px 14px", "cursor": "pointer",
+                         "fontFamily": "sans-serif", "fontWeight": "600",
+                         "fontSize": "14px",
+                         "backgroundColor": "var(--paper-bg, white)",
+                         "borderRadius": "6px"}
 
 # ---------------------------------------------------------------------------
 # NEO Consensus tab (R&D-only via --rnd)
@@ -3706,6 +4222,61 @@ def _tool_input_style():
     }
 
 
+def _lazy_graph(graph, style=None):
+    """Wrap a below-the-fold graph or table so it renders only near view.
+
+    assets/lazy_graphs.js sets the companion ``visible-<graph id>`` store
+    to True once the wrapper comes within one viewport height of view and
+    back to False once it is more than four away.  Callbacks feeding the
+    graph take the store as an Input and skip the figure while it is
+    False.
+    """
+    return html.Div(
+        id=f"wrap-{graph.id}",
+        className="lazy-graph",
+        style=style,
+        children=[graph, dcc.Store(id=f"visible-{graph.id}", data=False)],
+        **{"data-graph-id": graph.id},
+    )
+
+
+def _top_stations_panel():
+    """Discovery tab's top-stations table: a titled DataTable themed by
+    the page's CSS variables, filled by update_discovery_details()."""
+    table = dash_table.DataTable(
+        id="top-stations-table",
+        columns=_TOP_STATIONS_COLUMNS,
+        data=[],
+        page_action="none",
+        style_cell={
+            "fontFamily": "sans-serif",
+            "fontSize": "12px",
+            "padding": "4px 8px",
+            "textAlign": "left",
+            "backgroundColor": "transparent",
+            "color": "inherit",
+            "borderColor": "var(--hr-color, #ccc)",
+        },
+        style_header={
+            "fontWeight": "600",
+            "fontSize": "13px",
+            "borderBottom": "2px solid var(--hr-color, #999)",
+        },
+    )
+    return html.Div(
+        style={"flex": "1", "minWidth": "400px", "height": "350px",
+               "overflowY": "auto", "boxSizing": "border-box",
+               "padding": "12px 10px",
+               "backgroundColor": "var(--paper-bg, white)",
+               "fontFamily": "sans-serif"},
+        children=[
+            html.Div("Top 15 Discovery Sites (selected range)",
+                     style={"fontSize": "17px", "marginBottom": "8px"}),
+            _lazy_graph(table),
+        ],
+    )
+
+
 def _tool_card(title, description, controls, output_id, info=None):
     """Build a single calculator card for the Tools tab.
 
@@ -3747,20 +4318,906 @@ def _tool_card(title, description, controls, output_id, info=None):
     )
 
 
-app.layout = html.Div(
-    id="page-container",
-    style={
-        "minHeight": "100vh", "padding": "20px",
-        # Initial CSS variable values (dark theme defaults, overwritten
-        # immediately by the theme callback on page load)
-        "backgroundColor": "#1e1e1e", "color": "#e0e0e0",
-        "--subtext-color": "#888888",
-        "--hr-color": "#444444",
-        "--paper-bg": "#1e1e1e",
-        "--tab-border": "#444444",
-        "--row-hover": "#2a2a2a",
-    },
-    children=[
+# ---------------------------------------------------------------------------
+# Lazily mounted tabs
+# ---------------------------------------------------------------------------
+# The Follow-up Comparison and About tabs share no controls with other
+# tabs (nor with the reset callback), so their subtrees are left out of
+# the initial layout and mounted the first time the tab is selected.
+# The built children are cached per process so later page loads skip
+# rebuilding them.
+
+@lru_cache(maxsize=None)
+def _build_followup_compare_tab():
+    """Children of the Follow-up Comparison tab."""
+    return [
+        html.Div(style={"paddingTop": "15px"}, children=[
+            # Year-range slider
+            html.Div(
+                style={"marginBottom": "10px"},
+                children=[
+                    html.Label("Discovery years",
+                               style=LABEL_STYLE),
+                    dcc.RangeSlider(
+                        id="fuc-year-range",
+                        min=year_min,
+                        max=year_max,
+                        value=[2004, year_max],
+                        marks=YEAR_MARKS,
+                        tooltip=SLIDER_TOOLTIP,
+                    ),
+                ],
+            ),
+            # Controls row
+            html.Div(
+                style=CONTROL_ROW_STYLE,
+                children=[
+                    html.Div(children=[
+                        html.Label("Time scope",
+                                   style=LABEL_STYLE),
+                        dcc.RadioItems(
+                            id="fuc-time-scope",
+                            options=[
+                                {"label":
+                                    " Discovery apparition",
+                                 "value":
+                                    "apparition"},
+                                {"label": " All time",
+                                 "value": "all_time"},
+                                {"label":
+                                    " Recovery only",
+                                 "value": "recovery"},
+                            ],
+                            value="apparition",
+                            inline=True,
+                            style=RADIO_STYLE,
+                            labelStyle=
+                                RADIO_LABEL_STYLE,
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Follow-up window",
+                                   style=LABEL_STYLE),
+                        dcc.Dropdown(
+                            id="fuc-window",
+                            options=[
+                                {"label": "1 day",
+                                 "value": 1},
+                                {"label": "1 week",
+                                 "value": 7},
+                                {"label": "1 lunation "
+                                          "(29 d)",
+                                 "value": 29},
+                                {"label": "100 days",
+                                 "value": 100},
+                                {"label": "200 days",
+                                 "value": 200},
+                            ],
+                            value=200,
+                            clearable=False,
+                            style={"width": "180px"},
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Precovery",
+                                   style=LABEL_STYLE),
+                        dcc.RadioItems(
+                            id="fuc-precovery",
+                            options=_PRECOVERY_OPTIONS,
+                            value="post_only",
+                            inline=True,
+                            style=RADIO_STYLE,
+                            labelStyle=
+                                RADIO_LABEL_STYLE,
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Metric",
+                                   style=LABEL_STYLE),
+                        dcc.RadioItems(
+                            id="fuc-metric",
+                            options=_METRIC_OPTIONS,
+                            value="neos",
+                            inline=True,
+                            style=RADIO_STYLE,
+                            labelStyle=
+                                RADIO_LABEL_STYLE,
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Site type",
+                                   style=LABEL_STYLE),
+                        dcc.Dropdown(
+                            id="fuc-site-type",
+                            options=[
+                                {"label": "Optical",
+                                 "value": "optical"},
+                                {"label": "All types",
+                                 "value": "all"},
+                                {"label": "Satellite",
+                                 "value": "satellite"},
+                                {"label": "Radar",
+                                 "value": "radar"},
+                                {"label": "Occultation",
+                                 "value": "occultation"},
+                                {"label": "Roving",
+                                 "value": "roving"},
+                            ],
+                            value="optical",
+                            clearable=False,
+                            style={"width": "150px"},
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Graticule",
+                                   style=LABEL_STYLE),
+                        dcc.RadioItems(
+                            id="fuc-graticule",
+                            options=[
+                                {"label": " Off",
+                                 "value": "off"},
+                                {"label": " On",
+                                 "value": "on"},
+                            ],
+                            value="off",
+                            inline=True,
+                            style=RADIO_STYLE,
+                            labelStyle=
+                                RADIO_LABEL_STYLE,
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Map projection",
+                                   style=LABEL_STYLE),
+                        dcc.Dropdown(
+                            id="fuc-projection",
+                            options=[
+                                {"label": "Equirectangular",
+                                 "value":
+                                    "equirectangular"},
+                                {"label": "Natural earth",
+                                 "value":
+                                    "natural earth"},
+                                {"label": "Robinson",
+                                 "value": "robinson"},
+                                {"label": "Mollweide",
+                                 "value": "mollweide"},
+                                {"label": "Mercator",
+                                 "value": "mercator"},
+                                {"label": "Miller",
+                                 "value": "miller"},
+                                {"label": "Kavrayskiy VII",
+                                 "value": "kavrayskiy7"},
+                                {"label": "Orthographic",
+                                 "value": "orthographic"},
+                            ],
+                            value="equirectangular",
+                            clearable=False,
+                            style={"width": "180px"},
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Sites shown",
+                                   style=LABEL_STYLE),
+                        dcc.RadioItems(
+                            id="fuc-sites-filter",
+                            options=[
+                                {"label":
+                                    " NEO-active only",
+                                 "value": "neo_active"},
+                                {"label":
+                                    " All MPC sites",
+                                 "value": "all"},
+                            ],
+                            value="neo_active",
+                            inline=True,
+                            style=RADIO_STYLE,
+                            labelStyle=
+                                RADIO_LABEL_STYLE,
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label(
+                            "Depth statistic",
+                            style=LABEL_STYLE),
+                        dcc.Dropdown(
+                            id="fuc-depth-stat",
+                            options=[
+                                {"label":
+                                    "Median + 1.4826·MAD",
+                                 "value": "median_mad"},
+                                {"label": "Mean + 1σ",
+                                 "value": "mean_sigma"},
+                                {"label":
+                                    "95th percentile",
+                                 "value": "pct95"},
+                            ],
+                            value="median_mad",
+                            clearable=False,
+                            style={"width": "200px"},
+                        ),
+                    ]),
+                    html.Div(
+                        style={"width": "260px"},
+                        children=[
+                            html.Label(
+                                "V-mag depth range",
+                                style=LABEL_STYLE),
+                            dcc.RangeSlider(
+                                id="fuc-depth-range",
+                                min=14.0, max=24.0,
+                                step=0.5,
+                                value=[14.0, 24.0],
+                                marks={
+                                    14: "14",
+                                    17: "17",
+                                    20: "20",
+                                    23: "23",
+                                },
+                                tooltip=SLIDER_TOOLTIP,
+                                allowCross=False,
+                            ),
+                        ],
+                    ),
+                    html.Div(children=[
+                        html.Label("Color scale",
+                                   style=LABEL_STYLE),
+                        dcc.RadioItems(
+                            id="fuc-cscale",
+                            options=_YSCALE_OPTIONS,
+                            value="log",
+                            inline=True,
+                            style=RADIO_STYLE,
+                            labelStyle=
+                                RADIO_LABEL_STYLE,
+                        ),
+                    ]),
+                    html.Div(children=[
+                        html.Label("Colormap",
+                                   style=LABEL_STYLE),
+                        dcc.Dropdown(
+                            id="fuc-colormap",
+                            options=[
+                                {"label": "Viridis",
+                                 "value": "Viridis"},
+                                {"label": "Plasma",
+                                 "value": "Plasma"},
+                                {"label": "Cividis",
+                                 "value": "Cividis"},
+                                {"label": "Turbo",
+                                 "value": "Turbo"},
+                                {"label": "Magma",
+                                 "value": "Magma"},
+                                {"label": "Inferno",
+                                 "value": "Inferno"},
+                                {"label": "RdYlBu (rev.)",
+                                 "value": "RdYlBu_r"},
+                                {"label": "Spectral (rev.)",
+                                 "value": "Spectral_r"},
+                            ],
+                            value="Viridis",
+                            clearable=False,
+                            style={"width": "150px"},
+                        ),
+                    ]),
+                    html.Div(
+                        style={"alignSelf": "flex-end"},
+                        children=[
+                            html.Button(
+                                "Download CSV",
+                                id="btn-download-fuc",
+                                n_clicks=0,
+                                style=DOWNLOAD_BTN_STYLE,
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+            html.P(
+                "Phase 1: “follow-up” = distinct NEOs "
+                "observed at a site other than the "
+                "discovery site, within the chosen "
+                "follow-up window (capped by the "
+                "±200-day apparition cache). "
+                "Tracklet/observation counts and "
+                "multi-apparition recovery are Phase 2.",
+                className="subtext",
+                style={"fontFamily": "sans-serif",
+                       "marginBottom": "10px",
+                       "fontSize": "12px"},
+            ),
+            # Stats card
+            html.Div(
+                id="fuc-stats",
+                style={
+                    "border":
+                        "1px solid var(--hr-color, #ccc)",
+                    "borderRadius": "8px",
+                    "padding": "10px 14px",
+                    "marginBottom": "12px",
+                    "fontFamily": "sans-serif",
+                    "fontSize": "13px",
+                },
+            ),
+            # Persistent viewport bbox. Plotly fires
+            # a relayoutData event for every pan,
+            # zoom, AND map click — but click events
+            # carry no axis info, which would clear
+            # the bbox and snap the bar/stats back to
+            # 'global' even though the map is still
+            # zoomed. We funnel relayoutData through
+            # a Store that only updates when a real
+            # viewport change came in.
+            dcc.Store(id="fuc-viewport", data=None),
+            # Map + bar report to the shared spinner,
+            # which only appears if the callback
+            # actually takes >600 ms, so fast updates
+            # (radio toggles, dropdowns) don't blink.
+            html.Div(
+                className="shared-loading",
+                children=dcc.Graph(
+                    id="fuc-world-map",
+                    config={**GRAPH_CONFIG,
+                            "scrollZoom": True}),
+            ),
+            html.Div(
+                "Trackpad pinch or scroll wheel "
+                "zooms; click-drag pans; "
+                "double-click resets.",
+                style={"marginTop": "4px",
+                       "fontSize": "11px",
+                       "fontStyle": "italic",
+                       "color":
+                           "var(--subtext-color, "
+                           "#888)"}),
+            html.Div(
+                style={"marginTop": "12px",
+                       "marginBottom": "8px",
+                       "display": "flex",
+                       "gap": "16px",
+                       "flexWrap": "wrap",
+                       "alignItems": "flex-end"},
+                children=[
+                    html.Div(children=[
+                        html.Label("Bars to show",
+                                   style=LABEL_STYLE),
+                        dcc.Dropdown(
+                            id="fuc-max-bars",
+                            options=[
+                                {"label": "5",
+                                 "value": 5},
+                                {"label": "10",
+                                 "value": 10},
+                                {"label": "20",
+                                 "value": 20},
+                                {"label": "50",
+                                 "value": 50},
+                                {"label": "100",
+                                 "value": 100},
+                            ],
+                            value=10,
+                            clearable=False,
+                            style={"width": "100px"},
+                        ),
+                    ]),
+                    html.Div(
+                        style={"flex": "1 1 360px",
+                               "minWidth": "260px"},
+                        children=[
+                            html.Label(
+                                "Sites for bar chart "
+                                "(blank = top N)",
+                                style=LABEL_STYLE),
+                            dcc.Dropdown(
+                                id="fuc-site-select",
+                                options=[],
+                                value=[],
+                                multi=True,
+                                placeholder=(
+                                    "Click to pick "
+                                    "(or paste a list "
+                                    "→)"),
+                            ),
+                        ],
+                    ),
+                    html.Div(
+                        style={"flex": "0 1 240px",
+                               "minWidth": "200px"},
+                        children=[
+                            html.Label(
+                                "Paste codes ↵",
+                                style=LABEL_STYLE),
+                            dcc.Input(
+                                id="fuc-paste-codes",
+                                type="text",
+                                value="",
+                                placeholder=(
+                                    "I52 V06 J95 …"),
+                                debounce=True,
+                                style={"width": "100%",
+                                       "padding": "6px",
+                                       "fontFamily":
+                                           "monospace"},
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+            html.Div(
+                className="shared-loading",
+                children=dcc.Graph(
+                    id="fuc-bar",
+                    config=GRAPH_CONFIG),
+            ),
+            dcc.Download(id="dl-fuc"),
+        ]),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _build_about_tab():
+    """Children of the About tab."""
+    return [
+        html.Div(style={"paddingTop": "15px",
+                        "fontFamily": "sans-serif"},
+                 children=[
+            html.H2("About this dashboard",
+                     style={"fontSize": "22px",
+                            "fontWeight": "600",
+                            "marginBottom": "6px"}),
+            html.Div(
+                "Interactive views of NEO discovery "
+                "statistics, multi-survey reach, "
+                "follow-up timing, and the cross-source "
+                "NEO consensus catalog. Data is rebuilt "
+                "nightly from the MPC PostgreSQL replica "
+                "maintained at the Catalina Sky Survey, "
+                "University of Arizona.",
+                className="subtext",
+                style={"fontSize": "15px",
+                       "lineHeight": "1.5",
+                       "marginBottom": "20px",
+                       "maxWidth": "720px"}),
+            html.Div(
+                style={
+                    "display": "grid",
+                    "gridTemplateColumns":
+                        "repeat(auto-fill, minmax(380px, 1fr))",
+                    "gap": "16px",
+                },
+                children=[
+                    # ── Get in touch ──
+                    html.Div(
+                        style={
+                            "border":
+                                "1px solid var(--hr-color, #ccc)",
+                            "borderRadius": "8px",
+                            "padding": "14px 16px",
+                            "backgroundColor":
+                                "var(--paper-bg, white)",
+                        },
+                        children=[
+                            html.Div(
+                                html.Span(
+                                    "Get in touch",
+                                    style={
+                                        "fontWeight": "600",
+                                        "fontSize": "16px"}),
+                                style={"marginBottom": "12px"}),
+                            html.Div([
+                                html.Strong("Source code: "),
+                                html.A(
+                                    "github.com/rlseaman/"
+                                    "CSS_MPC_toolkit",
+                                    href="https://github.com/"
+                                         "rlseaman/"
+                                         "CSS_MPC_toolkit",
+                                    target="_blank",
+                                    rel="noopener noreferrer",
+                                ),
+                            ], style={"fontSize": "15px",
+                                      "lineHeight": "1.6",
+                                      "marginBottom": "8px"}),
+                            html.Div([
+                                html.Strong("Contact: "),
+                                html.A(
+                                    "contact@"
+                                    "hotwireduniverse.org",
+                                    href="mailto:contact@"
+                                         "hotwireduniverse.org",
+                                ),
+                            ], style={"fontSize": "15px",
+                                      "lineHeight": "1.6",
+                                      "marginBottom": "8px"}),
+                            html.Div([
+                                html.Strong("Maintainer: "),
+                                "Rob Seaman, Catalina Sky "
+                                "Survey / Lunar & Planetary "
+                                "Laboratory, University of "
+                                "Arizona.",
+                            ], style={"fontSize": "15px",
+                                      "lineHeight": "1.6"}),
+                        ],
+                    ),
+                    # ── Release notes ──
+                    html.Div(
+                        style={
+                            "border":
+                                "1px solid var(--hr-color, #ccc)",
+                            "borderRadius": "8px",
+                            "padding": "14px 16px",
+                            "backgroundColor":
+                                "var(--paper-bg, white)",
+                        },
+                        children=[
+                            html.Div(
+                                html.Span(
+                                    "Release notes",
+                                    style={
+                                        "fontWeight": "600",
+                                        "fontSize": "16px"}),
+                                style={"marginBottom":
+                                       "12px"}),
+                            html.Ul(
+                                style={"fontSize": "14px",
+                                       "lineHeight": "1.55",
+                                       "paddingLeft":
+                                           "18px",
+                                       "margin": "0"},
+                                children=[
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-05-10 "
+                                            "(Phase 3A) — "),
+                                        "Follow-up "
+                                        "Comparison "
+                                        "adds a V-mag "
+                                        "depth filter "
+                                        "with a "
+                                        "double-ended "
+                                        "range slider "
+                                        "and a choice "
+                                        "of three "
+                                        "depth "
+                                        "statistics "
+                                        "(Median + "
+                                        "1.4826·MAD, "
+                                        "Mean + 1σ, "
+                                        "95th "
+                                        "percentile). "
+                                        "Per-station "
+                                        "V-corrected "
+                                        "mag "
+                                        "distributions "
+                                        "are derived "
+                                        "from the most "
+                                        "recent 5 "
+                                        "years of NEO "
+                                        "observations.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-05-10 "
+                                            "(Phase 2B) — "),
+                                        "Follow-up "
+                                        "Comparison adds "
+                                        "a Time scope "
+                                        "radio "
+                                        "(Discovery "
+                                        "apparition / "
+                                        "All time / "
+                                        "Recovery only). "
+                                        "All-time and "
+                                        "recovery modes "
+                                        "are backed by "
+                                        "a new lifetime "
+                                        "cache covering "
+                                        "every NEO × "
+                                        "station ever, "
+                                        "not just the "
+                                        "discovery "
+                                        "apparition. "
+                                        "Multi-survey "
+                                        "Comparison's "
+                                        "Survey-reach "
+                                        "chart also "
+                                        "gains a Metric "
+                                        "selector. "
+                                        "Follow-up "
+                                        "Comparison "
+                                        "promoted to "
+                                        "production.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-05-09 "
+                                            "(Phase 2A) — "),
+                                        "Follow-up "
+                                        "Comparison adds "
+                                        "a Metric "
+                                        "selector "
+                                        "(NEOs / "
+                                        "Tracklets / "
+                                        "Observations). "
+                                        "Tracklet and "
+                                        "observation "
+                                        "counts come "
+                                        "from 28 pre-"
+                                        "aggregated "
+                                        "FILTER columns "
+                                        "added to the "
+                                        "apparition "
+                                        "cache.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-05-09 "
+                                            "(Phase 1) — "),
+                                        "Follow-up "
+                                        "Comparison tab "
+                                        "lands on dev: "
+                                        "world map of "
+                                        "MPC obscodes, "
+                                        "selectable "
+                                        "projection, "
+                                        "log/linear "
+                                        "color-by-NEO-"
+                                        "count, "
+                                        "follow-up "
+                                        "window selector "
+                                        "(1 d / 1 wk / "
+                                        "1 lunation / "
+                                        "100 d / 200 d), "
+                                        "post-discovery vs "
+                                        "include-"
+                                        "precoveries "
+                                        "toggle.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-05-07 — "),
+                                        "NEO Consensus: "
+                                        "smarter NEOfixer "
+                                        "rule (smart q-"
+                                        "rule keeps long-"
+                                        "arc divergences, "
+                                        "drops boundary "
+                                        "disagreements); "
+                                        "tab gains NF q / "
+                                        "NEO% / U columns "
+                                        "and a 'Disc by' "
+                                        "column from the "
+                                        "new obs_summary "
+                                        "matview.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-04-28 — "),
+                                        "NEO Consensus + "
+                                        "banner-level "
+                                        "source-membership "
+                                        "filter promoted "
+                                        "to prod; default "
+                                        "filter is "
+                                        "all_six.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-04-27 — "),
+                                        "Production "
+                                        "hardening: dash "
+                                        "under launchd, "
+                                        "waitress WSGI, "
+                                        "first pip-audit "
+                                        "pass.",
+                                    ]),
+                                    html.Li([
+                                        html.Strong(
+                                            "2026-04-24 — "),
+                                        "Gizmo replica "
+                                        "(PostgreSQL 18.3 "
+                                        "on NVMe) is now "
+                                        "the dev "
+                                        "platform. "
+                                        "obs_sbn_neo "
+                                        "matview drives "
+                                        "LOAD_SQL / "
+                                        "APPARITION_SQL.",
+                                    ]),
+                                ]),
+                        ],
+                    ),
+                ],
+            ),
+            # ── FAQ card (below the grid) ───────────────
+            html.Div(
+                style={
+                    "border":
+                        "1px solid var(--hr-color, #ccc)",
+                    "borderRadius": "8px",
+                    "padding": "14px 16px",
+                    "backgroundColor":
+                        "var(--paper-bg, white)",
+                    "marginTop": "16px",
+                    "maxWidth": "720px",
+                },
+                children=[
+                    html.Div(
+                        html.Span(
+                            "FAQ",
+                            style={"fontWeight": "600",
+                                   "fontSize": "16px"}),
+                        style={"marginBottom": "12px"}),
+                    # Q: data freshness
+                    html.Div([
+                        html.Strong(
+                            "How current is the data? "),
+                        "Caches rebuild nightly at 06:00 "
+                        "MST from the MPC PostgreSQL "
+                        "replica, so most views are up "
+                        "to ~24 hours behind MPC. The "
+                        "MPEC Browser fetches live."
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6",
+                              "marginBottom": "10px"}),
+                    # Q: NEO definition
+                    html.Div([
+                        html.Strong("What's a NEO here? "),
+                        "Perihelion distance q ≤ 1.3 AU. "
+                        "Almost every tab is NEO-only; "
+                        "Asteroid Classes is the one "
+                        "exception and shows the full "
+                        "~1.5M-object catalog."
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6",
+                              "marginBottom": "10px"}),
+                    # Q: six sources rationale
+                    html.Div([
+                        html.Strong(
+                            "Why six sources side by "
+                            "side? "),
+                        "MPC NEA.txt, mpc_orbits, JPL "
+                        "CNEOS, ESA NEOCC, CSS NEOfixer, "
+                        "and Lowell astorb each apply "
+                        "slightly different inclusion "
+                        "rules (NEOCP candidates, "
+                        "find_orb cutoffs, recently "
+                        "delisted objects, …). The "
+                        "Consensus tab surfaces "
+                        "agreements and disagreements; "
+                        "we don't pick a winner."
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6",
+                              "marginBottom": "10px"}),
+                    # Q: orbit class derivation
+                    html.Div([
+                        html.Strong(
+                            "How are orbit classes "
+                            "computed? "),
+                        "Derived from current orbital "
+                        "elements (q, e, i) using the "
+                        "MPC's published rules. The "
+                        "raw orbit_type_int column is "
+                        "missing for ~35% of objects, "
+                        "so we don't rely on it."
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6",
+                              "marginBottom": "10px"}),
+                    # Q: map projections
+                    html.Div([
+                        html.Strong(
+                            "Which map projection "
+                            "should I pick? "),
+                        html.Em("Equirectangular"),
+                        " is the simplest "
+                        "(lat/lon = x/y) and good for "
+                        "side-by-side numerical "
+                        "comparison. ",
+                        html.Em("Natural earth"),
+                        " (default) and ",
+                        html.Em("Robinson"),
+                        " are general-purpose "
+                        "compromises that minimize "
+                        "shape and area distortion "
+                        "globally. ",
+                        html.Em("Mollweide"),
+                        " is equal-area — useful when "
+                        "you care about relative "
+                        "geographic coverage. ",
+                        html.Em("Mercator"),
+                        " preserves angles and is "
+                        "familiar from web maps but "
+                        "wildly inflates polar "
+                        "regions. ",
+                        html.Em("Miller"),
+                        " is a Mercator variant that "
+                        "tames polar inflation. ",
+                        html.Em("Kavrayskiy VII"),
+                        " is a pseudo-cylindrical "
+                        "compromise favored by Soviet "
+                        "atlases. ",
+                        html.Em("Orthographic"),
+                        " shows the Earth as a globe "
+                        "from a fixed viewpoint — "
+                        "great for visualizing one "
+                        "hemisphere at a time, "
+                        "useless for the other. ",
+                        html.Em("Note: "),
+                        "the Follow-up Comparison "
+                        "tab's viewport-aware "
+                        "filtering (stats card and "
+                        "bar chart restricting to "
+                        "the visible map area) is "
+                        "exact for ",
+                        html.Em("equirectangular"),
+                        ", ",
+                        html.Em("Mercator"),
+                        ", and ",
+                        html.Em("Miller"),
+                        " — those projections expose "
+                        "their viewport rectangle "
+                        "directly. Other projections "
+                        "use an approximate bbox "
+                        "derived from center + zoom, "
+                        "so the filter is "
+                        "best-effort.",
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6",
+                              "marginBottom": "10px"}),
+                    # Q: mobile
+                    html.Div([
+                        html.Strong(
+                            "Why does my phone screen "
+                            "look cramped? "),
+                        "The dashboard is currently "
+                        "desktop-oriented. A "
+                        "mobile-friendly variant is on "
+                        "the roadmap."
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6",
+                              "marginBottom": "10px"}),
+                    # Q: contact / report a bug
+                    html.Div([
+                        html.Strong(
+                            "How do I report a bug or "
+                            "suggest a feature? "),
+                        "GitHub issues at the repo link "
+                        "above, or email ",
+                        html.A(
+                            "contact@"
+                            "hotwireduniverse.org",
+                            href="mailto:contact@"
+                                 "hotwireduniverse.org",
+                        ),
+                        ".",
+                    ], style={"fontSize": "15px",
+                              "lineHeight": "1.6"}),
+                ],
+            ),
+        ]),
+    ]
+
+
+_LAZY_TABS = {
+    "tab-followup-compare": ("fuc-tab-content", _build_followup_compare_tab),
+    "tab-about": ("about-tab-content", _build_about_tab),
+}
+
+
+app.layout = html.Div(
+    id="page-container",
+    style={
+        "minHeight": "100vh", "padding": "20px",
+        # Initial CSS variable values (dark theme defaults, overwritten
+        # immediately by the theme callback on page load)
+        "backgroundColor": "#1e1e1e", "color": "#e0e0e0",
+        "--subtext-color": "#888888",
+        "--hr-color": "#444444",
+        "--paper-bg": "#1e1e1e",
+        "--tab-border": "#444444",
+        "--row-hover": "#2a2a2a",
+    },
+    children=[
         # ── Maintenance banner ────────────────────────────────────────
         html.Div(
             _MAINTENANCE_MSG,
@@ -3783,12 +5240,12 @@ app.layout = html.Div(
         # ── Loading banner (shown while data loads at startup) ────────
         html.Div(id="loading-banner"),
         dcc.Interval(id="loading-check", interval=2_000, n_intervals=0),
+        # Control defaults for the clientside reset callback
+        dcc.Store(id="reset-defaults"),
         # ── Download components (hidden, one per tab) ─────────────────
-        dcc.Download(id="download-discovery"),
         dcc.Download(id="download-neomod"),
         dcc.Download(id="download-comparison"),
         dcc.Download(id="download-followup"),
-        dcc.Download(id="download-circumstances"),
         dcc.Download(id="download-boxscore"),
         # ── Banner: logo + title + shared controls ───────────────────
         html.Div(
@@ -3800,7 +5257,7 @@ app.layout = html.Div(
                     target="_blank",
                     title="Catalina Sky Survey",
                     children=html.Img(
-                        src="/assets/CSS_logo_transparent.png",
+                        src=_LOGO_URL,
                         style={
                             "height": "98px", "width": "98px",
                             "borderRadius": "50%",
@@ -3905,11 +5362,7 @@ app.layout = html.Div(
                     html.Label("Group by", style=LABEL_STYLE),
                     dcc.RadioItems(
                         id="group-by",
-                        options=[
-                            {"label": " Combined", "value": "combined"},
-                            {"label": " Project", "value": "project"},
-                            {"label": " Station", "value": "station"},
-                        ],
+                        options=_GROUP_BY_OPTIONS,
                         value="combined",
                         inline=True,
                         style=RADIO_STYLE,
@@ -3920,11 +5373,7 @@ app.layout = html.Div(
                     html.Label("Plot height", style=LABEL_STYLE),
                     dcc.RadioItems(
                         id="plot-height",
-                        options=[
-                            {"label": " Short", "value": "500"},
-                            {"label": " Normal", "value": "700"},
-                            {"label": " Tall", "value": "900"},
-                        ],
+                        options=_PLOT_HEIGHT_OPTIONS,
                         value="700",
                         inline=True,
                         style=RADIO_STYLE,
@@ -3935,10 +5384,7 @@ app.layout = html.Div(
                     html.Label("Theme", style=LABEL_STYLE),
                     dcc.RadioItems(
                         id="theme-toggle",
-                        options=[
-                            {"label": " Light", "value": "light"},
-                            {"label": " Dark", "value": "dark"},
-                        ],
+                        options=_THEME_OPTIONS,
                         value="dark",
                         inline=True,
                         style=RADIO_STYLE,
@@ -4004,6 +5450,9 @@ app.layout = html.Div(
                      n_intervals=0),  # 15 min
         dcc.Interval(id="mpec-enrich-poll", interval=60_000,
                      n_intervals=0, max_intervals=10, disabled=True),
+        # One spinner for every .shared-loading region, driven by
+        # assets/shared_loading.js from the graphs' loading flags.
+        html.Div(id="global-spinner", className="global-spinner"),
         dcc.Tabs(
             id="tabs",
             value="tab-mpec",
@@ -5102,16 +6551,8 @@ app.layout = html.Div(
                                                 id="year-range",
                                                 min=year_min, max=year_max,
                                                 value=[1995, year_max],
-                                                marks={
-                                                    y: {"label": str(y)}
-                                                    for y in range(
-                                                        year_min,
-                                                        year_max + 1, 5)
-                                                },
-                                                tooltip={
-                                                    "placement": "bottom",
-                                                    "always_visible":
-                                                        False},
+                                                marks=YEAR_MARKS,
+                                                tooltip=SLIDER_TOOLTIP,
                                             ),
                                         ],
                                     ),
@@ -5120,14 +6561,7 @@ app.layout = html.Div(
                                                    style=LABEL_STYLE),
                                         dcc.Dropdown(
                                             id="size-filter",
-                                            options=(
-                                                [{"label": "All sizes",
-                                                  "value": "all"},
-                                                 {"label": "Split sizes",
-                                                  "value": "split"}]
-                                                + [{"label": l, "value": l}
-                                                   for l, _, _ in H_BINS]
-                                            ),
+                                            options=_SIZE_OPTIONS_SPLIT,
                                             value="split",
                                             clearable=False,
                                             style={"width": "270px"},
@@ -5138,12 +6572,7 @@ app.layout = html.Div(
                                                    style=LABEL_STYLE),
                                         dcc.RadioItems(
                                             id="cumulative-toggle",
-                                            options=[
-                                                {"label": " Per year",
-                                                 "value": "annual"},
-                                                {"label": " Cumulative",
-                                                 "value": "cumulative"},
-                                            ],
+                                            options=_VIEW_OPTIONS,
                                             value="annual",
                                             inline=True,
                                             style=RADIO_STYLE,
@@ -5171,18 +6600,14 @@ app.layout = html.Div(
                                 style={"display": "flex", "gap": "20px",
                                         "flexWrap": "wrap"},
                                 children=[
-                                    dcc.Graph(
-                                        id="size-histogram",
+                                    _lazy_graph(
+                                        dcc.Graph(
+                                            id="size-histogram",
+                                            style={"height": "350px"},
+                                            config=GRAPH_CONFIG),
                                         style={"flex": "1",
-                                               "minWidth": "400px",
-                                               "height": "350px"},
-                                        config=GRAPH_CONFIG),
-                                    dcc.Graph(
-                                        id="top-stations-table",
-                                        style={"flex": "1",
-                                               "minWidth": "400px",
-                                               "height": "350px"},
-                                        config=GRAPH_CONFIG),
+                                               "minWidth": "400px"}),
+                                    _top_stations_panel(),
                                 ],
                             ),
                         ]),
@@ -5207,15 +6632,8 @@ app.layout = html.Div(
                                         min=year_min,
                                         max=year_max,
                                         value=[year_min, year_max],
-                                        marks={
-                                            y: {"label": str(y)}
-                                            for y in range(
-                                                year_min,
-                                                year_max + 1, 10)
-                                        },
-                                        tooltip={
-                                            "placement": "bottom",
-                                            "always_visible": False},
+                                        marks=YEAR_MARKS_10,
+                                        tooltip=SLIDER_TOOLTIP,
                                     ),
                                 ],
                             ),
@@ -5237,14 +6655,8 @@ app.layout = html.Div(
                                                 min=15.25, max=27.75,
                                                 value=[16.25, 22.75],
                                                 step=0.5,
-                                                marks={
-                                                    h: {"label": str(h)}
-                                                    for h in range(16, 28)
-                                                },
-                                                tooltip={
-                                                    "placement": "bottom",
-                                                    "always_visible":
-                                                        False},
+                                                marks=H_MARKS,
+                                                tooltip=SLIDER_TOOLTIP,
                                             ),
                                         ],
                                     ),
@@ -5253,12 +6665,7 @@ app.layout = html.Div(
                                                    style=LABEL_STYLE),
                                         dcc.RadioItems(
                                             id="h-yscale",
-                                            options=[
-                                                {"label": " Log",
-                                                 "value": "log"},
-                                                {"label": " Linear",
-                                                 "value": "linear"},
-                                            ],
+                                            options=_YSCALE_OPTIONS,
                                             value="linear",
                                             inline=True,
                                             style=RADIO_STYLE,
@@ -5362,8 +6769,44 @@ app.layout = html.Div(
                                 style={"fontFamily": "sans-serif",
                                        "marginTop": "0"},
                             ),
-                            dcc.Graph(id="neomod3-table",
-                                      config=GRAPH_CONFIG),
+                            dcc.Loading(
+                                type="circle",
+                                delay_show=600,
+                                children=_lazy_graph(
+                                    dash_table.DataTable(
+                                        id="neomod3-table",
+                                        columns=_NEOMOD3_TABLE_COLUMNS,
+                                        data=[],
+                                        page_action="none",
+                                        style_table={"overflowX": "auto"},
+                                        style_cell={
+                                            "fontFamily": "sans-serif",
+                                            "fontSize": "12px",
+                                            "padding": "4px 8px",
+                                            "textAlign": "right",
+                                            "backgroundColor":
+                                                "transparent",
+                                            "color": "inherit",
+                                            "borderColor":
+                                                "var(--hr-color, #ccc)",
+                                        },
+                                        style_cell_conditional=[
+                                            {"if": {"column_id": c},
+                                             "textAlign": "center"}
+                                            for c in ("bin", "n_range")
+                                        ],
+                                        style_header={
+                                            "fontWeight": "600",
+                                            "textAlign": "center",
+                                            "backgroundColor":
+                                                "var(--paper-bg, #f5f5f5)",
+                                            "color": "inherit",
+                                            "borderBottom":
+                                                "2px solid "
+                                                "var(--hr-color, #999)",
+                                        },
+                                    )),
+                            ),
                         ]),
                     ],
                 ),
@@ -5386,37 +6829,21 @@ app.layout = html.Div(
                                         min=year_min,
                                         max=year_max,
                                         value=[2004, year_max],
-                                        marks={
-                                            y: {"label": str(y)}
-                                            for y in range(
-                                                year_min,
-                                                year_max + 1, 5)
-                                        },
-                                        tooltip={
-                                            "placement": "bottom",
-                                            "always_visible": False},
+                                        marks=YEAR_MARKS,
+                                        tooltip=SLIDER_TOOLTIP,
                                     ),
                                 ],
                             ),
                             # Controls row
                             html.Div(
-                                style={"display": "flex", "gap": "20px",
-                                        "flexWrap": "wrap",
-                                        "alignItems": "flex-end",
-                                        "marginBottom": "15px"},
+                                style=CONTROL_ROW_STYLE,
                                 children=[
                                     html.Div(children=[
                                         html.Label("Size class",
                                                    style=LABEL_STYLE),
                                         dcc.Dropdown(
                                             id="comp-size-filter",
-                                            options=(
-                                                [{"label": "All sizes",
-                                                  "value": "all"}]
-                                                + [{"label": l,
-                                                    "value": l}
-                                                   for l, _, _ in H_BINS]
-                                            ),
+                                            options=_SIZE_OPTIONS,
                                             value="all",
                                             clearable=False,
                                             style={"width": "270px"},
@@ -5428,16 +6855,7 @@ app.layout = html.Div(
                                                    style=LABEL_STYLE),
                                         dcc.Dropdown(
                                             id="comp-survey-select",
-                                            options=(
-                                                [{"label": p, "value": p}
-                                                 for p in PROJECT_ORDER
-                                                 if p not in _BOTTOM_SURVEYS]
-                                                + [{"label": "\u2500" * 20,
-                                                    "value": "_sep",
-                                                    "disabled": True}]
-                                                + [{"label": p, "value": p}
-                                                   for p in _BOTTOM_ORDER]
-                                            ),
+                                            options=_SURVEY_SELECT_OPTIONS,
                                             value=["Catalina Survey",
                                                    "Pan-STARRS",
                                                    "ATLAS"],
@@ -5450,14 +6868,7 @@ app.layout = html.Div(
                                                    style=LABEL_STYLE),
                                         dcc.RadioItems(
                                             id="comp-precovery",
-                                            options=[
-                                                {"label":
-                                                    " Post-discovery",
-                                                 "value": "post_only"},
-                                                {"label":
-                                                    " Include precoveries",
-                                                 "value": "include"},
-                                            ],
+                                            options=_PRECOVERY_OPTIONS,
                                             value="post_only",
                                             inline=True,
                                             style=RADIO_STYLE,
@@ -5491,15 +6902,7 @@ app.layout = html.Div(
                                             style=LABEL_STYLE),
                                         dcc.RadioItems(
                                             id="comp-metric",
-                                            options=[
-                                                {"label": " NEOs",
-                                                 "value": "neos"},
-                                                {"label": " Tracklets",
-                                                 "value": "tracklets"},
-                                                {"label": " Obs",
-                                                 "value":
-                                                    "observations"},
-                                            ],
+                                            options=_METRIC_OPTIONS,
                                             value="neos",
                                             inline=True,
                                             style=RADIO_STYLE,
@@ -5558,11 +6961,17 @@ app.layout = html.Div(
                                     ),
                                 ],
                             ),
-                            # MPC codes reference
+                            # MPC codes reference.  The body is
+                            # filled by assets/lazy_details.js when
+                            # the section is opened and emptied when
+                            # it is closed; only the lines ship here.
                             html.Details(
+                                className="lazy-details",
                                 style={"marginBottom": "12px",
                                        "fontFamily": "sans-serif",
                                        "fontSize": "12px"},
+                                **{"data-body-id": "mpc-codes-body",
+                                   "data-lines": _MPC_CODE_LINES_JSON},
                                 children=[
                                     html.Summary(
                                         "Survey group MPC codes",
@@ -5570,27 +6979,18 @@ app.layout = html.Div(
                                                "fontWeight": "bold",
                                                "fontSize": "13px"}),
                                     html.Div(
+                                        id="mpc-codes-body",
                                         style={"display": "flex",
                                                "flexWrap": "wrap",
                                                "gap": "8px 24px",
                                                "padding": "8px 0"},
-                                        children=[
-                                            html.Span(
-                                                f"{proj}: "
-                                                f"{', '.join(sorted(stns))}",
-                                            )
-                                            for proj in PROJECT_ORDER
-                                            if proj in PROJECT_STATIONS
-                                            for stns in
-                                                [PROJECT_STATIONS[proj]]
-                                        ],
                                     ),
                                 ],
                             ),
                             # 2x2 visualization grid + full-width
                             # annual overlap chart
-                            dcc.Loading(
-                                type="default",
+                            html.Div(
+                                className="shared-loading",
                                 children=[
                                     html.Div(
                                         style={
@@ -5599,9 +6999,8 @@ app.layout = html.Div(
                                                 "1fr 1fr",
                                             "gap": "10px"},
                                         children=[
-                                            dcc.Graph(
-                                                id="venn-diagram",
-                                                config=GRAPH_CONFIG),
+                                            html.Div(
+                                                id="venn-diagram"),
                                             dcc.Graph(
                                                 id="survey-reach",
                                                 config=GRAPH_CONFIG),
@@ -5613,9 +7012,9 @@ app.layout = html.Div(
                                                 config=GRAPH_CONFIG),
                                         ],
                                     ),
-                                    dcc.Graph(
+                                    _lazy_graph(dcc.Graph(
                                         id="annual-overlap",
-                                        config=GRAPH_CONFIG),
+                                        config=GRAPH_CONFIG)),
                                     # Station-level annual overlap
                                     html.Div(
                                         style={"marginTop": "15px",
@@ -5661,519 +7060,45 @@ app.layout = html.Div(
                     value="tab-followup-compare",
                     className="nav-tab",
                     selected_className="nav-tab--selected",
+                    children=[html.Div(id="fuc-tab-content")],
+                ),
+                # ━━━ Tab 4: Follow-up Timing ━━━━━━━━━━━━━━━━━━━━━━━━━
+                dcc.Tab(
+                    label="Follow-up Timing",
+                    value="tab-followup",
+                    className="nav-tab",
+                    selected_className="nav-tab--selected",
                     children=[
                         html.Div(style={"paddingTop": "15px"}, children=[
-                            # Year-range slider
+                            # Year slider — full width
                             html.Div(
                                 style={"marginBottom": "10px"},
                                 children=[
                                     html.Label("Discovery years",
                                                style=LABEL_STYLE),
                                     dcc.RangeSlider(
-                                        id="fuc-year-range",
+                                        id="fu-year-range",
                                         min=year_min,
                                         max=year_max,
                                         value=[2004, year_max],
-                                        marks={
-                                            y: {"label": str(y)}
-                                            for y in range(
-                                                year_min,
-                                                year_max + 1, 5)
-                                        },
-                                        tooltip={
-                                            "placement": "bottom",
-                                            "always_visible": False},
+                                        marks=YEAR_MARKS,
+                                        tooltip=SLIDER_TOOLTIP,
                                     ),
                                 ],
                             ),
                             # Controls row
                             html.Div(
-                                style={"display": "flex", "gap": "20px",
-                                       "flexWrap": "wrap",
-                                       "alignItems": "flex-end",
-                                       "marginBottom": "15px"},
+                                style=CONTROL_ROW_STYLE,
                                 children=[
                                     html.Div(children=[
-                                        html.Label("Time scope",
-                                                   style=LABEL_STYLE),
-                                        dcc.RadioItems(
-                                            id="fuc-time-scope",
-                                            options=[
-                                                {"label":
-                                                    " Discovery apparition",
-                                                 "value":
-                                                    "apparition"},
-                                                {"label": " All time",
-                                                 "value": "all_time"},
-                                                {"label":
-                                                    " Recovery only",
-                                                 "value": "recovery"},
-                                            ],
-                                            value="apparition",
-                                            inline=True,
-                                            style=RADIO_STYLE,
-                                            labelStyle=
-                                                RADIO_LABEL_STYLE,
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Follow-up window",
+                                        html.Label("Size class",
                                                    style=LABEL_STYLE),
                                         dcc.Dropdown(
-                                            id="fuc-window",
-                                            options=[
-                                                {"label": "1 day",
-                                                 "value": 1},
-                                                {"label": "1 week",
-                                                 "value": 7},
-                                                {"label": "1 lunation "
-                                                          "(29 d)",
-                                                 "value": 29},
-                                                {"label": "100 days",
-                                                 "value": 100},
-                                                {"label": "200 days",
-                                                 "value": 200},
-                                            ],
-                                            value=200,
+                                            id="fu-size-filter",
+                                            options=_SIZE_OPTIONS,
+                                            value="all",
                                             clearable=False,
-                                            style={"width": "180px"},
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Precovery",
-                                                   style=LABEL_STYLE),
-                                        dcc.RadioItems(
-                                            id="fuc-precovery",
-                                            options=[
-                                                {"label":
-                                                    " Post-discovery",
-                                                 "value": "post_only"},
-                                                {"label":
-                                                    " Include precoveries",
-                                                 "value": "include"},
-                                            ],
-                                            value="post_only",
-                                            inline=True,
-                                            style=RADIO_STYLE,
-                                            labelStyle=
-                                                RADIO_LABEL_STYLE,
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Metric",
-                                                   style=LABEL_STYLE),
-                                        dcc.RadioItems(
-                                            id="fuc-metric",
-                                            options=[
-                                                {"label": " NEOs",
-                                                 "value": "neos"},
-                                                {"label": " Tracklets",
-                                                 "value": "tracklets"},
-                                                {"label": " Obs",
-                                                 "value":
-                                                    "observations"},
-                                            ],
-                                            value="neos",
-                                            inline=True,
-                                            style=RADIO_STYLE,
-                                            labelStyle=
-                                                RADIO_LABEL_STYLE,
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Site type",
-                                                   style=LABEL_STYLE),
-                                        dcc.Dropdown(
-                                            id="fuc-site-type",
-                                            options=[
-                                                {"label": "Optical",
-                                                 "value": "optical"},
-                                                {"label": "All types",
-                                                 "value": "all"},
-                                                {"label": "Satellite",
-                                                 "value": "satellite"},
-                                                {"label": "Radar",
-                                                 "value": "radar"},
-                                                {"label": "Occultation",
-                                                 "value": "occultation"},
-                                                {"label": "Roving",
-                                                 "value": "roving"},
-                                            ],
-                                            value="optical",
-                                            clearable=False,
-                                            style={"width": "150px"},
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Graticule",
-                                                   style=LABEL_STYLE),
-                                        dcc.RadioItems(
-                                            id="fuc-graticule",
-                                            options=[
-                                                {"label": " Off",
-                                                 "value": "off"},
-                                                {"label": " On",
-                                                 "value": "on"},
-                                            ],
-                                            value="off",
-                                            inline=True,
-                                            style=RADIO_STYLE,
-                                            labelStyle=
-                                                RADIO_LABEL_STYLE,
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Map projection",
-                                                   style=LABEL_STYLE),
-                                        dcc.Dropdown(
-                                            id="fuc-projection",
-                                            options=[
-                                                {"label": "Equirectangular",
-                                                 "value":
-                                                    "equirectangular"},
-                                                {"label": "Natural earth",
-                                                 "value":
-                                                    "natural earth"},
-                                                {"label": "Robinson",
-                                                 "value": "robinson"},
-                                                {"label": "Mollweide",
-                                                 "value": "mollweide"},
-                                                {"label": "Mercator",
-                                                 "value": "mercator"},
-                                                {"label": "Miller",
-                                                 "value": "miller"},
-                                                {"label": "Kavrayskiy VII",
-                                                 "value": "kavrayskiy7"},
-                                                {"label": "Orthographic",
-                                                 "value": "orthographic"},
-                                            ],
-                                            value="equirectangular",
-                                            clearable=False,
-                                            style={"width": "180px"},
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Sites shown",
-                                                   style=LABEL_STYLE),
-                                        dcc.RadioItems(
-                                            id="fuc-sites-filter",
-                                            options=[
-                                                {"label":
-                                                    " NEO-active only",
-                                                 "value": "neo_active"},
-                                                {"label":
-                                                    " All MPC sites",
-                                                 "value": "all"},
-                                            ],
-                                            value="neo_active",
-                                            inline=True,
-                                            style=RADIO_STYLE,
-                                            labelStyle=
-                                                RADIO_LABEL_STYLE,
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label(
-                                            "Depth statistic",
-                                            style=LABEL_STYLE),
-                                        dcc.Dropdown(
-                                            id="fuc-depth-stat",
-                                            options=[
-                                                {"label":
-                                                    "Median + 1.4826·MAD",
-                                                 "value": "median_mad"},
-                                                {"label": "Mean + 1σ",
-                                                 "value": "mean_sigma"},
-                                                {"label":
-                                                    "95th percentile",
-                                                 "value": "pct95"},
-                                            ],
-                                            value="median_mad",
-                                            clearable=False,
-                                            style={"width": "200px"},
-                                        ),
-                                    ]),
-                                    html.Div(
-                                        style={"width": "260px"},
-                                        children=[
-                                            html.Label(
-                                                "V-mag depth range",
-                                                style=LABEL_STYLE),
-                                            dcc.RangeSlider(
-                                                id="fuc-depth-range",
-                                                min=14.0, max=24.0,
-                                                step=0.5,
-                                                value=[14.0, 24.0],
-                                                marks={
-                                                    14: "14",
-                                                    17: "17",
-                                                    20: "20",
-                                                    23: "23",
-                                                },
-                                                tooltip={
-                                                    "placement":
-                                                        "bottom",
-                                                    "always_visible":
-                                                        False},
-                                                allowCross=False,
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(children=[
-                                        html.Label("Color scale",
-                                                   style=LABEL_STYLE),
-                                        dcc.RadioItems(
-                                            id="fuc-cscale",
-                                            options=[
-                                                {"label": " Log",
-                                                 "value": "log"},
-                                                {"label": " Linear",
-                                                 "value": "linear"},
-                                            ],
-                                            value="log",
-                                            inline=True,
-                                            style=RADIO_STYLE,
-                                            labelStyle=
-                                                RADIO_LABEL_STYLE,
-                                        ),
-                                    ]),
-                                    html.Div(children=[
-                                        html.Label("Colormap",
-                                                   style=LABEL_STYLE),
-                                        dcc.Dropdown(
-                                            id="fuc-colormap",
-                                            options=[
-                                                {"label": "Viridis",
-                                                 "value": "Viridis"},
-                                                {"label": "Plasma",
-                                                 "value": "Plasma"},
-                                                {"label": "Cividis",
-                                                 "value": "Cividis"},
-                                                {"label": "Turbo",
-                                                 "value": "Turbo"},
-                                                {"label": "Magma",
-                                                 "value": "Magma"},
-                                                {"label": "Inferno",
-                                                 "value": "Inferno"},
-                                                {"label": "RdYlBu (rev.)",
-                                                 "value": "RdYlBu_r"},
-                                                {"label": "Spectral (rev.)",
-                                                 "value": "Spectral_r"},
-                                            ],
-                                            value="Viridis",
-                                            clearable=False,
-                                            style={"width": "150px"},
-                                        ),
-                                    ]),
-                                    html.Div(
-                                        style={"alignSelf": "flex-end"},
-                                        children=[
-                                            html.Button(
-                                                "Download CSV",
-                                                id="btn-download-fuc",
-                                                n_clicks=0,
-                                                style=DOWNLOAD_BTN_STYLE,
-                                            ),
-                                        ],
-                                    ),
-                                ],
-                            ),
-                            html.P(
-                                "Phase 1: “follow-up” = distinct NEOs "
-                                "observed at a site other than the "
-                                "discovery site, within the chosen "
-                                "follow-up window (capped by the "
-                                "±200-day apparition cache). "
-                                "Tracklet/observation counts and "
-                                "multi-apparition recovery are Phase 2.",
-                                className="subtext",
-                                style={"fontFamily": "sans-serif",
-                                       "marginBottom": "10px",
-                                       "fontSize": "12px"},
-                            ),
-                            # Stats card
-                            html.Div(
-                                id="fuc-stats",
-                                style={
-                                    "border":
-                                        "1px solid var(--hr-color, #ccc)",
-                                    "borderRadius": "8px",
-                                    "padding": "10px 14px",
-                                    "marginBottom": "12px",
-                                    "fontFamily": "sans-serif",
-                                    "fontSize": "13px",
-                                },
-                            ),
-                            # Persistent viewport bbox. Plotly fires
-                            # a relayoutData event for every pan,
-                            # zoom, AND map click — but click events
-                            # carry no axis info, which would clear
-                            # the bbox and snap the bar/stats back to
-                            # 'global' even though the map is still
-                            # zoomed. We funnel relayoutData through
-                            # a Store that only updates when a real
-                            # viewport change came in.
-                            dcc.Store(id="fuc-viewport", data=None),
-                            # Map + bar each in their own Loading
-                            # wrapper with delay_show so fast updates
-                            # (radio toggles, dropdowns) don't blink
-                            # the contents. Spinner only appears if
-                            # the callback actually takes >600 ms.
-                            dcc.Loading(
-                                type="circle",
-                                delay_show=600,
-                                children=dcc.Graph(
-                                    id="fuc-world-map",
-                                    config={**GRAPH_CONFIG,
-                                            "scrollZoom": True}),
-                            ),
-                            html.Div(
-                                "Trackpad pinch or scroll wheel "
-                                "zooms; click-drag pans; "
-                                "double-click resets.",
-                                style={"marginTop": "4px",
-                                       "fontSize": "11px",
-                                       "fontStyle": "italic",
-                                       "color":
-                                           "var(--subtext-color, "
-                                           "#888)"}),
-                            html.Div(
-                                style={"marginTop": "12px",
-                                       "marginBottom": "8px",
-                                       "display": "flex",
-                                       "gap": "16px",
-                                       "flexWrap": "wrap",
-                                       "alignItems": "flex-end"},
-                                children=[
-                                    html.Div(children=[
-                                        html.Label("Bars to show",
-                                                   style=LABEL_STYLE),
-                                        dcc.Dropdown(
-                                            id="fuc-max-bars",
-                                            options=[
-                                                {"label": "5",
-                                                 "value": 5},
-                                                {"label": "10",
-                                                 "value": 10},
-                                                {"label": "20",
-                                                 "value": 20},
-                                                {"label": "50",
-                                                 "value": 50},
-                                                {"label": "100",
-                                                 "value": 100},
-                                            ],
-                                            value=10,
-                                            clearable=False,
-                                            style={"width": "100px"},
-                                        ),
-                                    ]),
-                                    html.Div(
-                                        style={"flex": "1 1 360px",
-                                               "minWidth": "260px"},
-                                        children=[
-                                            html.Label(
-                                                "Sites for bar chart "
-                                                "(blank = top N)",
-                                                style=LABEL_STYLE),
-                                            dcc.Dropdown(
-                                                id="fuc-site-select",
-                                                options=[],
-                                                value=[],
-                                                multi=True,
-                                                placeholder=(
-                                                    "Click to pick "
-                                                    "(or paste a list "
-                                                    "→)"),
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(
-                                        style={"flex": "0 1 240px",
-                                               "minWidth": "200px"},
-                                        children=[
-                                            html.Label(
-                                                "Paste codes ↵",
-                                                style=LABEL_STYLE),
-                                            dcc.Input(
-                                                id="fuc-paste-codes",
-                                                type="text",
-                                                value="",
-                                                placeholder=(
-                                                    "I52 V06 J95 …"),
-                                                debounce=True,
-                                                style={"width": "100%",
-                                                       "padding": "6px",
-                                                       "fontFamily":
-                                                           "monospace"},
-                                            ),
-                                        ],
-                                    ),
-                                ],
-                            ),
-                            dcc.Loading(
-                                type="circle",
-                                delay_show=600,
-                                children=dcc.Graph(
-                                    id="fuc-bar",
-                                    config=GRAPH_CONFIG),
-                            ),
-                            dcc.Download(id="dl-fuc"),
-                        ]),
-                    ],
-                ),
-                # ━━━ Tab 4: Follow-up Timing ━━━━━━━━━━━━━━━━━━━━━━━━━
-                dcc.Tab(
-                    label="Follow-up Timing",
-                    value="tab-followup",
-                    className="nav-tab",
-                    selected_className="nav-tab--selected",
-                    children=[
-                        html.Div(style={"paddingTop": "15px"}, children=[
-                            # Year slider — full width
-                            html.Div(
-                                style={"marginBottom": "10px"},
-                                children=[
-                                    html.Label("Discovery years",
-                                               style=LABEL_STYLE),
-                                    dcc.RangeSlider(
-                                        id="fu-year-range",
-                                        min=year_min,
-                                        max=year_max,
-                                        value=[2004, year_max],
-                                        marks={
-                                            y: {"label": str(y)}
-                                            for y in range(
-                                                year_min,
-                                                year_max + 1, 5)
-                                        },
-                                        tooltip={
-                                            "placement": "bottom",
-                                            "always_visible": False},
-                                    ),
-                                ],
-                            ),
-                            # Controls row
-                            html.Div(
-                                style={"display": "flex", "gap": "20px",
-                                        "flexWrap": "wrap",
-                                        "alignItems": "flex-end",
-                                        "marginBottom": "15px"},
-                                children=[
-                                    html.Div(children=[
-                                        html.Label("Size class",
-                                                   style=LABEL_STYLE),
-                                        dcc.Dropdown(
-                                            id="fu-size-filter",
-                                            options=(
-                                                [{"label": "All sizes",
-                                                  "value": "all"}]
-                                                + [{"label": l,
-                                                    "value": l}
-                                                   for l, _, _ in H_BINS]
-                                            ),
-                                            value="all",
-                                            clearable=False,
-                                            style={"width": "270px"},
+                                            style={"width": "270px"},
                                         ),
                                     ]),
                                     html.Div(
@@ -6189,10 +7114,7 @@ app.layout = html.Div(
                                                     7: "7", 30: "30",
                                                     90: "90", 200: "200",
                                                 },
-                                                tooltip={
-                                                    "placement": "bottom",
-                                                    "always_visible":
-                                                        False},
+                                                tooltip=SLIDER_TOOLTIP,
                                             ),
                                         ],
                                     ),
@@ -6258,37 +7180,21 @@ app.layout = html.Div(
                                         min=year_min,
                                         max=year_max,
                                         value=[2004, year_max],
-                                        marks={
-                                            y: {"label": str(y)}
-                                            for y in range(
-                                                year_min,
-                                                year_max + 1, 5)
-                                        },
-                                        tooltip={
-                                            "placement": "bottom",
-                                            "always_visible": False},
+                                        marks=YEAR_MARKS,
+                                        tooltip=SLIDER_TOOLTIP,
                                     ),
                                 ],
                             ),
                             # Controls row
                             html.Div(
-                                style={"display": "flex", "gap": "20px",
-                                        "flexWrap": "wrap",
-                                        "alignItems": "flex-end",
-                                        "marginBottom": "15px"},
+                                style=CONTROL_ROW_STYLE,
                                 children=[
                                     html.Div(children=[
                                         html.Label("Size class",
                                                    style=LABEL_STYLE),
                                         dcc.Dropdown(
                                             id="circ-size-filter",
-                                            options=(
-                                                [{"label": "All sizes",
-                                                  "value": "all"}]
-                                                + [{"label": l,
-                                                    "value": l}
-                                                   for l, _, _ in H_BINS]
-                                            ),
+                                            options=_SIZE_OPTIONS,
                                             value="all",
                                             clearable=False,
                                             style={"width": "270px"},
@@ -6506,10 +7412,7 @@ app.layout = html.Div(
                                                    10: "10", 15: "15",
                                                    20: "20", 25: "25",
                                                    30: "30"},
-                                            tooltip={
-                                                "placement": "bottom",
-                                                "always_visible": False,
-                                            },
+                                            tooltip=SLIDER_TOOLTIP,
                                         ),
                                     ]),
                                     # Arc range (days).  Linear slider over a
@@ -6533,10 +7436,7 @@ app.layout = html.Div(
                                                    18250: "50y",
                                                    36500: "100y",
                                                    50000: "100y+"},
-                                            tooltip={
-                                                "placement": "bottom",
-                                                "always_visible": False,
-                                            },
+                                            tooltip=SLIDER_TOOLTIP,
                                         ),
                                     ]),
                                     html.Div(style={"width": "250px"},
@@ -6551,10 +7451,7 @@ app.layout = html.Div(
                                                    10: "10", 15: "15",
                                                    20: "20", 25: "25",
                                                    30: "30+"},
-                                            tooltip={
-                                                "placement": "bottom",
-                                                "always_visible": False,
-                                            },
+                                            tooltip=SLIDER_TOOLTIP,
                                         ),
                                     ]),
                                     html.Div(style={"width": "250px"},
@@ -6569,10 +7466,7 @@ app.layout = html.Div(
                                                    100: "100",
                                                    250: "250",
                                                    500: "500+"},
-                                            tooltip={
-                                                "placement": "bottom",
-                                                "always_visible": False,
-                                            },
+                                            tooltip=SLIDER_TOOLTIP,
                                         ),
                                     ]),
                                     # Random pick from the current table —
@@ -6652,23 +7546,17 @@ app.layout = html.Div(
                                         "Reset axes",
                                         id="obshist-btn-reset",
                                         n_clicks=0,
-                                        style={"padding": "4px 12px",
-                                               "fontSize": "12px",
-                                               "cursor": "pointer"}),
+                                        style=SMALL_BTN_STYLE),
                                     html.Button(
                                         "Show all bands",
                                         id="obshist-btn-bands",
                                         n_clicks=0,
-                                        style={"padding": "4px 12px",
-                                               "fontSize": "12px",
-                                               "cursor": "pointer"}),
+                                        style=SMALL_BTN_STYLE),
                                     html.Button(
                                         "Toggle elongation shading",
                                         id="obshist-btn-shading",
                                         n_clicks=0,
-                                        style={"padding": "4px 12px",
-                                               "fontSize": "12px",
-                                               "cursor": "pointer"}),
+                                        style=SMALL_BTN_STYLE),
                                     # V range slider — driven by the
                                     # callback to reset on plot change
                                     # and hidden when the loaded object
@@ -6699,11 +7587,7 @@ app.layout = html.Div(
                                                            20: "20",
                                                            25: "25",
                                                            28: "28"},
-                                                    tooltip={
-                                                        "placement":
-                                                            "bottom",
-                                                        "always_visible":
-                                                            False},
+                                                    tooltip=SLIDER_TOOLTIP,
                                                     allowCross=False,
                                                 ),
                                             ),
@@ -7079,11 +7963,7 @@ app.layout = html.Div(
                                                     value=[14, 28],
                                                     marks={14: "14",
                                                            28: "28"},
-                                                    tooltip={
-                                                        "always_visible":
-                                                            False,
-                                                        "placement":
-                                                            "bottom"},
+                                                    tooltip=SLIDER_TOOLTIP,
                                                     allowCross=False,
                                                 ),
                                                 style={"flex": "1"}),
@@ -7114,11 +7994,7 @@ app.layout = html.Div(
                                                            for v in
                                                            (0, 60, 120,
                                                             180)},
-                                                    tooltip={
-                                                        "always_visible":
-                                                            False,
-                                                        "placement":
-                                                            "bottom"},
+                                                    tooltip=SLIDER_TOOLTIP,
                                                 ),
                                                 style={"flex": "1"}),
                                         ],
@@ -7194,10 +8070,7 @@ app.layout = html.Div(
                             ),
                             # Controls row
                             html.Div(
-                                style={"display": "flex", "gap": "20px",
-                                        "flexWrap": "wrap",
-                                        "alignItems": "flex-end",
-                                        "marginBottom": "15px"},
+                                style=CONTROL_ROW_STYLE,
                                 children=[
                                     html.Div(children=[
                                         html.Label("Class grouping",
@@ -7249,9 +8122,7 @@ app.layout = html.Div(
                                                 15: "15", 20: "20",
                                                 25: "25", 30: "30",
                                             },
-                                            tooltip={
-                                                "placement": "bottom",
-                                                "always_visible": False},
+                                            tooltip=SLIDER_TOOLTIP,
                                         ),
                                     ], style={"width": "250px"}),
                                     html.Div(
@@ -7845,9 +8716,7 @@ app.layout = html.Div(
                                 "Download NEO CSV",
                                 id="station-neo-dl-btn",
                                 n_clicks=0,
-                                style={"padding": "4px 12px",
-                                       "fontSize": "12px",
-                                       "cursor": "pointer"},
+                                style=SMALL_BTN_STYLE,
                             ),
                             dcc.Download(id="station-neo-dl"),
                             # Non-NEO breakdown
@@ -7862,9 +8731,7 @@ app.layout = html.Div(
                                 "Download non-NEO CSV",
                                 id="station-non-neo-dl-btn",
                                 n_clicks=0,
-                                style={"padding": "4px 12px",
-                                       "fontSize": "12px",
-                                       "cursor": "pointer"},
+                                style=SMALL_BTN_STYLE,
                             ),
                             dcc.Download(id="station-non-neo-dl"),
                             # MPEC stub for Phase 2
@@ -7889,445 +8756,7 @@ app.layout = html.Div(
                     value="tab-about",
                     className="nav-tab",
                     selected_className="nav-tab--selected",
-                    children=[
-                        html.Div(style={"paddingTop": "15px",
-                                        "fontFamily": "sans-serif"},
-                                 children=[
-                            html.H2("About this dashboard",
-                                     style={"fontSize": "22px",
-                                            "fontWeight": "600",
-                                            "marginBottom": "6px"}),
-                            html.Div(
-                                "Interactive views of NEO discovery "
-                                "statistics, multi-survey reach, "
-                                "follow-up timing, and the cross-source "
-                                "NEO consensus catalog. Data is rebuilt "
-                                "nightly from the MPC PostgreSQL replica "
-                                "maintained at the Catalina Sky Survey, "
-                                "University of Arizona.",
-                                className="subtext",
-                                style={"fontSize": "15px",
-                                       "lineHeight": "1.5",
-                                       "marginBottom": "20px",
-                                       "maxWidth": "720px"}),
-                            html.Div(
-                                style={
-                                    "display": "grid",
-                                    "gridTemplateColumns":
-                                        "repeat(auto-fill, minmax(380px, 1fr))",
-                                    "gap": "16px",
-                                },
-                                children=[
-                                    # ── Get in touch ──
-                                    html.Div(
-                                        style={
-                                            "border":
-                                                "1px solid var(--hr-color, #ccc)",
-                                            "borderRadius": "8px",
-                                            "padding": "14px 16px",
-                                            "backgroundColor":
-                                                "var(--paper-bg, white)",
-                                        },
-                                        children=[
-                                            html.Div(
-                                                html.Span(
-                                                    "Get in touch",
-                                                    style={
-                                                        "fontWeight": "600",
-                                                        "fontSize": "16px"}),
-                                                style={"marginBottom": "12px"}),
-                                            html.Div([
-                                                html.Strong("Source code: "),
-                                                html.A(
-                                                    "github.com/rlseaman/"
-                                                    "CSS_MPC_toolkit",
-                                                    href="https://github.com/"
-                                                         "rlseaman/"
-                                                         "CSS_MPC_toolkit",
-                                                    target="_blank",
-                                                    rel="noopener noreferrer",
-                                                ),
-                                            ], style={"fontSize": "15px",
-                                                      "lineHeight": "1.6",
-                                                      "marginBottom": "8px"}),
-                                            html.Div([
-                                                html.Strong("Contact: "),
-                                                html.A(
-                                                    "contact@"
-                                                    "hotwireduniverse.org",
-                                                    href="mailto:contact@"
-                                                         "hotwireduniverse.org",
-                                                ),
-                                            ], style={"fontSize": "15px",
-                                                      "lineHeight": "1.6",
-                                                      "marginBottom": "8px"}),
-                                            html.Div([
-                                                html.Strong("Maintainer: "),
-                                                "Rob Seaman, Catalina Sky "
-                                                "Survey / Lunar & Planetary "
-                                                "Laboratory, University of "
-                                                "Arizona.",
-                                            ], style={"fontSize": "15px",
-                                                      "lineHeight": "1.6"}),
-                                        ],
-                                    ),
-                                    # ── Release notes ──
-                                    html.Div(
-                                        style={
-                                            "border":
-                                                "1px solid var(--hr-color, #ccc)",
-                                            "borderRadius": "8px",
-                                            "padding": "14px 16px",
-                                            "backgroundColor":
-                                                "var(--paper-bg, white)",
-                                        },
-                                        children=[
-                                            html.Div(
-                                                html.Span(
-                                                    "Release notes",
-                                                    style={
-                                                        "fontWeight": "600",
-                                                        "fontSize": "16px"}),
-                                                style={"marginBottom":
-                                                       "12px"}),
-                                            html.Ul(
-                                                style={"fontSize": "14px",
-                                                       "lineHeight": "1.55",
-                                                       "paddingLeft":
-                                                           "18px",
-                                                       "margin": "0"},
-                                                children=[
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-05-10 "
-                                                            "(Phase 3A) — "),
-                                                        "Follow-up "
-                                                        "Comparison "
-                                                        "adds a V-mag "
-                                                        "depth filter "
-                                                        "with a "
-                                                        "double-ended "
-                                                        "range slider "
-                                                        "and a choice "
-                                                        "of three "
-                                                        "depth "
-                                                        "statistics "
-                                                        "(Median + "
-                                                        "1.4826·MAD, "
-                                                        "Mean + 1σ, "
-                                                        "95th "
-                                                        "percentile). "
-                                                        "Per-station "
-                                                        "V-corrected "
-                                                        "mag "
-                                                        "distributions "
-                                                        "are derived "
-                                                        "from the most "
-                                                        "recent 5 "
-                                                        "years of NEO "
-                                                        "observations.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-05-10 "
-                                                            "(Phase 2B) — "),
-                                                        "Follow-up "
-                                                        "Comparison adds "
-                                                        "a Time scope "
-                                                        "radio "
-                                                        "(Discovery "
-                                                        "apparition / "
-                                                        "All time / "
-                                                        "Recovery only). "
-                                                        "All-time and "
-                                                        "recovery modes "
-                                                        "are backed by "
-                                                        "a new lifetime "
-                                                        "cache covering "
-                                                        "every NEO × "
-                                                        "station ever, "
-                                                        "not just the "
-                                                        "discovery "
-                                                        "apparition. "
-                                                        "Multi-survey "
-                                                        "Comparison's "
-                                                        "Survey-reach "
-                                                        "chart also "
-                                                        "gains a Metric "
-                                                        "selector. "
-                                                        "Follow-up "
-                                                        "Comparison "
-                                                        "promoted to "
-                                                        "production.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-05-09 "
-                                                            "(Phase 2A) — "),
-                                                        "Follow-up "
-                                                        "Comparison adds "
-                                                        "a Metric "
-                                                        "selector "
-                                                        "(NEOs / "
-                                                        "Tracklets / "
-                                                        "Observations). "
-                                                        "Tracklet and "
-                                                        "observation "
-                                                        "counts come "
-                                                        "from 28 pre-"
-                                                        "aggregated "
-                                                        "FILTER columns "
-                                                        "added to the "
-                                                        "apparition "
-                                                        "cache.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-05-09 "
-                                                            "(Phase 1) — "),
-                                                        "Follow-up "
-                                                        "Comparison tab "
-                                                        "lands on dev: "
-                                                        "world map of "
-                                                        "MPC obscodes, "
-                                                        "selectable "
-                                                        "projection, "
-                                                        "log/linear "
-                                                        "color-by-NEO-"
-                                                        "count, "
-                                                        "follow-up "
-                                                        "window selector "
-                                                        "(1 d / 1 wk / "
-                                                        "1 lunation / "
-                                                        "100 d / 200 d), "
-                                                        "post-discovery vs "
-                                                        "include-"
-                                                        "precoveries "
-                                                        "toggle.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-05-07 — "),
-                                                        "NEO Consensus: "
-                                                        "smarter NEOfixer "
-                                                        "rule (smart q-"
-                                                        "rule keeps long-"
-                                                        "arc divergences, "
-                                                        "drops boundary "
-                                                        "disagreements); "
-                                                        "tab gains NF q / "
-                                                        "NEO% / U columns "
-                                                        "and a 'Disc by' "
-                                                        "column from the "
-                                                        "new obs_summary "
-                                                        "matview.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-04-28 — "),
-                                                        "NEO Consensus + "
-                                                        "banner-level "
-                                                        "source-membership "
-                                                        "filter promoted "
-                                                        "to prod; default "
-                                                        "filter is "
-                                                        "all_six.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-04-27 — "),
-                                                        "Production "
-                                                        "hardening: dash "
-                                                        "under launchd, "
-                                                        "waitress WSGI, "
-                                                        "first pip-audit "
-                                                        "pass.",
-                                                    ]),
-                                                    html.Li([
-                                                        html.Strong(
-                                                            "2026-04-24 — "),
-                                                        "Gizmo replica "
-                                                        "(PostgreSQL 18.3 "
-                                                        "on NVMe) is now "
-                                                        "the dev "
-                                                        "platform. "
-                                                        "obs_sbn_neo "
-                                                        "matview drives "
-                                                        "LOAD_SQL / "
-                                                        "APPARITION_SQL.",
-                                                    ]),
-                                                ]),
-                                        ],
-                                    ),
-                                ],
-                            ),
-                            # ── FAQ card (below the grid) ───────────────
-                            html.Div(
-                                style={
-                                    "border":
-                                        "1px solid var(--hr-color, #ccc)",
-                                    "borderRadius": "8px",
-                                    "padding": "14px 16px",
-                                    "backgroundColor":
-                                        "var(--paper-bg, white)",
-                                    "marginTop": "16px",
-                                    "maxWidth": "720px",
-                                },
-                                children=[
-                                    html.Div(
-                                        html.Span(
-                                            "FAQ",
-                                            style={"fontWeight": "600",
-                                                   "fontSize": "16px"}),
-                                        style={"marginBottom": "12px"}),
-                                    # Q: data freshness
-                                    html.Div([
-                                        html.Strong(
-                                            "How current is the data? "),
-                                        "Caches rebuild nightly at 06:00 "
-                                        "MST from the MPC PostgreSQL "
-                                        "replica, so most views are up "
-                                        "to ~24 hours behind MPC. The "
-                                        "MPEC Browser fetches live."
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6",
-                                              "marginBottom": "10px"}),
-                                    # Q: NEO definition
-                                    html.Div([
-                                        html.Strong("What's a NEO here? "),
-                                        "Perihelion distance q ≤ 1.3 AU. "
-                                        "Almost every tab is NEO-only; "
-                                        "Asteroid Classes is the one "
-                                        "exception and shows the full "
-                                        "~1.5M-object catalog."
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6",
-                                              "marginBottom": "10px"}),
-                                    # Q: six sources rationale
-                                    html.Div([
-                                        html.Strong(
-                                            "Why six sources side by "
-                                            "side? "),
-                                        "MPC NEA.txt, mpc_orbits, JPL "
-                                        "CNEOS, ESA NEOCC, CSS NEOfixer, "
-                                        "and Lowell astorb each apply "
-                                        "slightly different inclusion "
-                                        "rules (NEOCP candidates, "
-                                        "find_orb cutoffs, recently "
-                                        "delisted objects, …). The "
-                                        "Consensus tab surfaces "
-                                        "agreements and disagreements; "
-                                        "we don't pick a winner."
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6",
-                                              "marginBottom": "10px"}),
-                                    # Q: orbit class derivation
-                                    html.Div([
-                                        html.Strong(
-                                            "How are orbit classes "
-                                            "computed? "),
-                                        "Derived from current orbital "
-                                        "elements (q, e, i) using the "
-                                        "MPC's published rules. The "
-                                        "raw orbit_type_int column is "
-                                        "missing for ~35% of objects, "
-                                        "so we don't rely on it."
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6",
-                                              "marginBottom": "10px"}),
-                                    # Q: map projections
-                                    html.Div([
-                                        html.Strong(
-                                            "Which map projection "
-                                            "should I pick? "),
-                                        html.Em("Equirectangular"),
-                                        " is the simplest "
-                                        "(lat/lon = x/y) and good for "
-                                        "side-by-side numerical "
-                                        "comparison. ",
-                                        html.Em("Natural earth"),
-                                        " (default) and ",
-                                        html.Em("Robinson"),
-                                        " are general-purpose "
-                                        "compromises that minimize "
-                                        "shape and area distortion "
-                                        "globally. ",
-                                        html.Em("Mollweide"),
-                                        " is equal-area — useful when "
-                                        "you care about relative "
-                                        "geographic coverage. ",
-                                        html.Em("Mercator"),
-                                        " preserves angles and is "
-                                        "familiar from web maps but "
-                                        "wildly inflates polar "
-                                        "regions. ",
-                                        html.Em("Miller"),
-                                        " is a Mercator variant that "
-                                        "tames polar inflation. ",
-                                        html.Em("Kavrayskiy VII"),
-                                        " is a pseudo-cylindrical "
-                                        "compromise favored by Soviet "
-                                        "atlases. ",
-                                        html.Em("Orthographic"),
-                                        " shows the Earth as a globe "
-                                        "from a fixed viewpoint — "
-                                        "great for visualizing one "
-                                        "hemisphere at a time, "
-                                        "useless for the other. ",
-                                        html.Em("Note: "),
-                                        "the Follow-up Comparison "
-                                        "tab's viewport-aware "
-                                        "filtering (stats card and "
-                                        "bar chart restricting to "
-                                        "the visible map area) is "
-                                        "exact for ",
-                                        html.Em("equirectangular"),
-                                        ", ",
-                                        html.Em("Mercator"),
-                                        ", and ",
-                                        html.Em("Miller"),
-                                        " — those projections expose "
-                                        "their viewport rectangle "
-                                        "directly. Other projections "
-                                        "use an approximate bbox "
-                                        "derived from center + zoom, "
-                                        "so the filter is "
-                                        "best-effort.",
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6",
-                                              "marginBottom": "10px"}),
-                                    # Q: mobile
-                                    html.Div([
-                                        html.Strong(
-                                            "Why does my phone screen "
-                                            "look cramped? "),
-                                        "The dashboard is currently "
-                                        "desktop-oriented. A "
-                                        "mobile-friendly variant is on "
-                                        "the roadmap."
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6",
-                                              "marginBottom": "10px"}),
-                                    # Q: contact / report a bug
-                                    html.Div([
-                                        html.Strong(
-                                            "How do I report a bug or "
-                                            "suggest a feature? "),
-                                        "GitHub issues at the repo link "
-                                        "above, or email ",
-                                        html.A(
-                                            "contact@"
-                                            "hotwireduniverse.org",
-                                            href="mailto:contact@"
-                                                 "hotwireduniverse.org",
-                                        ),
-                                        ".",
-                                    ], style={"fontSize": "15px",
-                                              "lineHeight": "1.6"}),
-                                ],
-                            ),
-                        ]),
-                    ],
+                    children=[html.Div(id="about-tab-content")],
                 ),
             ],
         ),
@@ -8335,29 +8764,60 @@ app.layout = html.Div(
 )
 
 
+# The layout above is built once at import and never reassigned, so its
+# JSON is serialized on the first /_dash-layout request and then served
+# from memory; Dash's own view re-serializes the tree on every page load.
+@lru_cache(maxsize=1)
+def _layout_json():
+    return pio.json.to_json_plotly(app.get_layout())
+
+
+def _serve_cached_layout():
+    return Response(_layout_json(), mimetype="application/json")
+
+
+server.view_functions[
+    app.config.routes_pathname_prefix + "_dash-layout"] = _serve_cached_layout
+
+
+def _register_lazy_tab(tab_value, content_id, builder):
+    @app.callback(
+        Output(content_id, "children"),
+        Input("tabs", "value"),
+        State(content_id, "children"),
+    )
+    def _mount(active_tab, children):
+        if active_tab != tab_value or children:
+            raise PreventUpdate
+        return builder()
+
+
+for _tab_value, (_content_id, _builder) in _LAZY_TABS.items():
+    _register_lazy_tab(_tab_value, _content_id, _builder)
+
+
 # ---------------------------------------------------------------------------
-# Theme callback — update page background + text colors via CSS variables
+# Theme — page background + text colors via CSS variables
 # ---------------------------------------------------------------------------
 
-@app.callback(
-    Output("page-container", "style"),
-    Input("theme-toggle", "value"),
-)
-def update_theme(theme_name):
-    t = theme(theme_name)
+def _page_style(t):
     return {
-        "backgroundColor": t["page"],
-        "color": t["text"],
+        "backgroundColor": t.page,
+        "color": t.text,
         "minHeight": "100vh",
         "padding": "20px",
-        "--subtext-color": t["subtext"],
-        "--hr-color": t["hr_color"],
-        "--paper-bg": t["paper"],
-        "--tab-border": t["hr_color"],
-        "--row-hover": t["row_hover"],
+        "--subtext-color": t.subtext,
+        "--hr-color": t.hr_color,
+        "--paper-bg": t.paper,
+        "--tab-border": t.hr_color,
+        "--row-hover": t.row_hover,
     }
 
 
+# Applied by the banner clientside callback below, keyed by theme name
+_PAGE_STYLES = {name: _page_style(t) for name, t in THEMES.items()}
+
+
 # ---------------------------------------------------------------------------
 # Service health check — banner-level connectivity status
 # ---------------------------------------------------------------------------
@@ -8434,7 +8894,6 @@ def select_obs_site(btn_clicks, custom_values):
     return no_update
 
 
-
 # ---------------------------------------------------------------------------
 # Refresh-banner callback — show notice when cron job is updating caches
 # ---------------------------------------------------------------------------
@@ -8442,28 +8901,38 @@ def select_obs_site(btn_clicks, custom_values):
 _SENTINEL_FILE = os.path.join(_APP_DIR, ".refreshing")
 
 
+# Banner children returned by the interval-driven status callbacks below.
+# Every open page polls them, so the few distinct banners are built once.
+@lru_cache(maxsize=16)
+def _status_banner(message, background, color, border):
+    """Full-width status message with the given background/text/border."""
+    return html.Div(
+        message,
+        className="status-banner",
+        style={
+            "backgroundColor": background,
+            "--banner-color": color,
+            "padding": "10px 20px",
+            "borderRadius": "4px",
+            "marginBottom": "10px",
+            "fontFamily": "sans-serif",
+            "fontSize": "14px",
+            "textAlign": "center",
+            "border": f"1px solid {border}",
+        },
+    )
+
+
 @app.callback(
     Output("refresh-banner", "children"),
     Input("refresh-check", "n_intervals"),
 )
 def check_refresh_status(_n):
     if os.path.exists(_SENTINEL_FILE):
-        return html.Div(
+        return _status_banner(
             f"Data refresh in progress \u2014 results shown are from "
             f"the previous update ({query_timestamp}).",
-            className="status-banner",
-            style={
-                "backgroundColor": "#fff3cd",
-                "--banner-color": "#856404",
-                "padding": "10px 20px",
-                "borderRadius": "4px",
-                "marginBottom": "10px",
-                "fontFamily": "sans-serif",
-                "fontSize": "14px",
-                "textAlign": "center",
-                "border": "1px solid #ffc107",
-            },
-        )
+            "#fff3cd", "#856404", "#ffc107")
     return None
 
 
@@ -8475,45 +8944,21 @@ def check_refresh_status(_n):
     Output("loading-banner", "children"),
     Output("loading-check", "disabled"),
     Output("subtitle-text", "children"),
+    Output("reset-defaults", "data"),
     Input("loading-check", "n_intervals"),
 )
 def check_loading_status(_n):
     if _data_ready.is_set():
         if _data_error:
-            banner = html.Div(
-                f"Error loading data: {_data_error}",
-                className="status-banner",
-                style={
-                    "backgroundColor": "#f8d7da",
-                    "--banner-color": "#721c24",
-                    "padding": "10px 20px",
-                    "borderRadius": "4px",
-                    "marginBottom": "10px",
-                    "fontFamily": "sans-serif",
-                    "fontSize": "14px",
-                    "textAlign": "center",
-                    "border": "1px solid #f5c6cb",
-                },
-            )
-            return banner, True, "Data load failed"
+            banner = _status_banner(f"Error loading data: {_data_error}",
+                                    "#f8d7da", "#721c24", "#f5c6cb")
+            return banner, True, "Data load failed", _get_defaults()
         count = f"{len(df):,}" if df is not None else "?"
         subtitle = f"Source: MPC/SBN database ({count} NEO discoveries)"
-        return None, True, subtitle
-    return html.Div(
-        "Loading data from cache (please wait)...",
-        className="status-banner",
-        style={
-            "backgroundColor": "#cce5ff",
-            "--banner-color": "#004085",
-            "padding": "10px 20px",
-            "borderRadius": "4px",
-            "marginBottom": "10px",
-            "fontFamily": "sans-serif",
-            "fontSize": "14px",
-            "textAlign": "center",
-            "border": "1px solid #b8daff",
-        },
-    ), False, "Loading data..."
+        return None, True, subtitle, _get_defaults()
+    return _status_banner("Loading data from cache (please wait)...",
+                          "#cce5ff", "#004085", "#b8daff"), \
+        False, "Loading data...", _get_defaults()
 
 
 # ---------------------------------------------------------------------------
@@ -8643,7 +9088,7 @@ _TAB_KEYS = {
 }
 _SHARED_KEYS = {"group-by", "plot-height", "neo-source-filter"}
 
-# Output order must match the tuple returned by reset_controls
+# Output order of the clientside reset callback below
 _RESET_ORDER = [
     "year-range", "size-filter", "cumulative-toggle",
     "h-year-range", "h-range", "h-yscale", "h-mode",
@@ -8699,16 +9144,6 @@ _NEO_SOURCE_FILTER_TABS = {
 }
 
 
-@app.callback(
-    Output("neo-source-filter-container", "style"),
-    Input("tabs", "value"),
-)
-def _toggle_source_filter_visibility(active_tab):
-    if active_tab in _NEO_SOURCE_FILTER_TABS:
-        return {"display": "block"}
-    return {"display": "none"}
-
-
 # ── Banner-level Group by — show only when it actually affects the
 # active view. Three tabs read Input("group-by"), but two of them
 # have orthogonal controls that override it:
@@ -8719,23 +9154,6 @@ def _toggle_source_filter_visibility(active_tab):
 #   tab-neomod        → always uses group-by.
 # Hiding when overridden keeps the banner uncluttered and avoids
 # the "this control does nothing" confusion.
-@app.callback(
-    Output("group-by-container", "style"),
-    Input("tabs", "value"),
-    Input("size-filter", "value"),
-    Input("circ-color-by", "value"),
-)
-def _toggle_group_by_visibility(active_tab, size_filter, circ_color_by):
-    show = {"display": "block"}
-    hide = {"display": "none"}
-    if active_tab == "tab-discovery":
-        return show if size_filter != "split" else hide
-    if active_tab == "tab-neomod":
-        return show
-    if active_tab == "tab-circumstances":
-        return show if circ_color_by == "survey" else hide
-    return hide
-
 
 # Plot-height has no effect on the Observation-history tab (the
 # per-object plot ships at a fixed 720 px) — hide the selector when
@@ -8744,14 +9162,43 @@ _NO_PLOT_HEIGHT_TABS = {"tab-mpec", "tab-tools", "tab-consensus",
                         "tab-about", "tab-obshist", "tab-station"}
 
 
-@app.callback(
+# Theme, source-filter, group-by and plot-height visibility only restyle
+# the banner and page, so they are applied together in one clientside
+# callback rather than four server round-trips.
+app.clientside_callback(
+    """
+    function(theme, tab, sizeFilter, circColorBy) {
+        var pageStyles = %s;
+        var sourceTabs = %s;
+        var noHeightTabs = %s;
+        var show = {display: "block"}, hide = {display: "none"};
+        var groupBy = hide;
+        if (tab === "tab-discovery") {
+            groupBy = sizeFilter !== "split" ? show : hide;
+        } else if (tab === "tab-neomod") {
+            groupBy = show;
+        } else if (tab === "tab-circumstances") {
+            groupBy = circColorBy === "survey" ? show : hide;
+        }
+        return [
+            pageStyles[theme] || pageStyles["light"],
+            sourceTabs.indexOf(tab) >= 0 ? show : hide,
+            groupBy,
+            noHeightTabs.indexOf(tab) >= 0 ? hide : show,
+        ];
+    }
+    """ % (json.dumps(_PAGE_STYLES),
+           json.dumps(sorted(_NEO_SOURCE_FILTER_TABS)),
+           json.dumps(sorted(_NO_PLOT_HEIGHT_TABS))),
+    Output("page-container", "style"),
+    Output("neo-source-filter-container", "style"),
+    Output("group-by-container", "style"),
     Output("plot-height-container", "style"),
+    Input("theme-toggle", "value"),
     Input("tabs", "value"),
+    Input("size-filter", "value"),
+    Input("circ-color-by", "value"),
 )
-def _toggle_plot_height_visibility(active_tab):
-    if active_tab in _NO_PLOT_HEIGHT_TABS:
-        return {"display": "none"}
-    return {"display": "block"}
 
 
 @app.callback(
@@ -8768,14 +9215,54 @@ def _update_source_filter_caption(source):
     return f"{matched:,} of {total:,} matched"
 
 
-@app.callback(
+# Reset only maps the active tab to default values, so it runs in the
+# browser.  The defaults follow year_max, which is final only once the
+# data has loaded, so check_loading_status keeps the reset-defaults
+# store current until then.
+app.clientside_callback(
+    """
+    function(_tabClicks, _allClicks, activeTab, defaults) {
+        var tabKeys = %s;
+        var sharedKeys = %s;
+        var order = %s;
+        var noUpdate = window.dash_clientside.no_update;
+        if (!defaults) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        var triggered = window.dash_clientside.callback_context.triggered;
+        var trigger = (triggered && triggered.length)
+            ? triggered[0].prop_id.split(".")[0] : null;
+        var reset = {};
+        if (trigger === "reset-all-btn") {
+            Object.keys(defaults).forEach(function (k) { reset[k] = true; });
+        } else if (trigger === "reset-tab-btn") {
+            (tabKeys[activeTab] || []).concat(sharedKeys).forEach(
+                function (k) { reset[k] = true; });
+        } else {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        var values = order.map(function (k) {
+            return reset[k] ? defaults[k] : noUpdate;
+        });
+        // fc-vmag-limit's min/max/marks (not just value) need restoring
+        // to defaults -- update_finding_chart rewrites them when an
+        // object's predicted-V range is known.  Clearing fc-slider-state
+        // also forces the next finding-chart rebuild to re-snap the
+        // slider cleanly from the new object's predictions.
+        var sliderExtras = reset["fc-vmag-limit"]
+            ? [14, 28, {"14": "14", "28": "28"}, null]
+            : [noUpdate, noUpdate, noUpdate, noUpdate];
+        // Obshist controls being reset -> also snap the displayed object
+        // back to Apophis.  Clearing plot-state and selected_rows lets
+        // update_obshist_plot reload the default on its next fire.
+        var objExtras = reset["obshist-classes"]
+            ? [null, []] : [noUpdate, noUpdate];
+        return values.concat(sliderExtras, objExtras);
+    }
+    """ % (json.dumps({tab: sorted(keys) for tab, keys in _TAB_KEYS.items()}),
+           json.dumps(sorted(_SHARED_KEYS)),
+           json.dumps(_RESET_ORDER)),
     [Output(k, "value", allow_duplicate=True) for k in _RESET_ORDER]
-    # fc-vmag-limit's min/max/marks (not just value) need restoring
-    # to defaults — `update_finding_chart` rewrites them when an
-    # object's predicted-V range is known, and they'd otherwise stay
-    # pinned to that range across a Reset.  Clearing fc-slider-state
-    # also forces the next finding-chart rebuild to re-snap the slider
-    # cleanly from the new object's predictions.
     + [Output("fc-vmag-limit", "min", allow_duplicate=True),
        Output("fc-vmag-limit", "max", allow_duplicate=True),
        Output("fc-vmag-limit", "marks", allow_duplicate=True),
@@ -8788,144 +9275,246 @@ def _update_source_filter_caption(source):
     Input("reset-tab-btn", "n_clicks"),
     Input("reset-all-btn", "n_clicks"),
     State("tabs", "value"),
+    State("reset-defaults", "data"),
     prevent_initial_call=True,
 )
-def reset_controls(_tab_clicks, _all_clicks, active_tab):
-    triggered = ctx.triggered_id
-    defaults = _get_defaults()
-    if triggered == "reset-all-btn":
-        reset_keys = set(defaults)
-    elif triggered == "reset-tab-btn":
-        reset_keys = _TAB_KEYS.get(active_tab, set()) | _SHARED_KEYS
-    else:
-        raise PreventUpdate
-    values = tuple(
-        defaults[k] if k in reset_keys else no_update
-        for k in _RESET_ORDER
-    )
-    if "fc-vmag-limit" in reset_keys:
-        slider_extras = (14, 28, {14: "14", 28: "28"}, None)
-    else:
-        slider_extras = (no_update,) * 4
-    # Obshist controls being reset → also snap the displayed object
-    # back to Apophis.  Clearing plot-state and selected_rows lets
-    # update_obshist_plot reload the default on its next fire.
-    if "obshist-classes" in reset_keys:
-        obj_extras = (None, [])
-    else:
-        obj_extras = (no_update, no_update)
-    return values + slider_extras + obj_extras
 
 
 # ---------------------------------------------------------------------------
 # Discovery-by-year callback
 # ---------------------------------------------------------------------------
 
-@app.callback(
-    Output("discovery-bar", "figure"),
-    Output("size-histogram", "figure"),
-    Output("top-stations-table", "figure"),
-    Input("year-range", "value"),
-    Input("group-by", "value"),
-    Input("size-filter", "value"),
-    Input("cumulative-toggle", "value"),
-    Input("theme-toggle", "value"),
-    Input("plot-height", "value"),
-    Input("tabs", "value"),
-    Input("neo-source-filter", "value"),
-)
-def update_charts(year_range, group_by, size_filter, view_mode, theme_name,
-                  plot_height, _tab, neo_source):
-    if df is None:
-        raise PreventUpdate
-    t = theme(theme_name)
-    y0, y1 = year_range
-    df_view = _apply_source_filter(df, neo_source)
-    filtered = df_view[(df_view["disc_year"] >= y0) & (df_view["disc_year"] <= y1)]
+# Finished discovery-tab figures per control state, as for the follow-up
+# and circumstances tabs; keys lead with the figure name.  Scrubbing a
+# slider back over earlier positions, or toggling the theme back, is
+# then a dict lookup.  Cleared when it fills up.
+_DISCOVERY_FIG_CACHE = {}
+_DISCOVERY_FIG_CACHE_MAX = 192
+
+
+def _cache_discovery_fig(key, fig):
+    if len(_DISCOVERY_FIG_CACHE) >= _DISCOVERY_FIG_CACHE_MAX:
+        _DISCOVERY_FIG_CACHE.clear()
+    _DISCOVERY_FIG_CACHE[key] = fig
+
 
+_DISCOVERY_AGG_KEYS = ["disc_year", "size_class", "project",
+                       "station_code", "station_name"]
+_discovery_agg_cache = (None, {})
+
+
+def _discovery_agg(df_main, neo_source="any"):
+    """Discovery counts per (year, size class, project, station).
+
+    A few thousand rows in place of one per NEO, so the discovery tab
+    filters and re-sums these instead of grouping df on every callback.
+    Built once per *df_main* object and source, like _year_h_hist().
+    """
+    global _discovery_agg_cache
+    src, aggs = _discovery_agg_cache
+    if src is not df_main:
+        aggs = {}
+        _discovery_agg_cache = (df_main, aggs)
+    agg = aggs.get(neo_source)
+    if agg is None:
+        view = _apply_source_filter(df_main, neo_source)
+        agg = aggs[neo_source] = (
+            view.groupby(_DISCOVERY_AGG_KEYS, observed=True, dropna=False)
+            .size().reset_index(name="count"))
+    return agg
+
+
+def _discovery_counts(year_range, size_filter, neo_source):
+    """_discovery_agg() rows in *year_range* passing the size filter."""
+    y0, y1 = year_range
+    agg = _discovery_agg(df, neo_source)
+    counts = _year_slice(agg, y0, y1)
     if size_filter not in ("all", "split"):
-        filtered = filtered[filtered["size_class"] == size_filter]
+        counts = counts[counts["size_class"] == size_filter]
+    return counts
+
+
+# Bar-trace data per data selection, under the figure cache above: a
+# theme or height change the figure cache hasn't seen yet only restyles
+# these rather than redoing the groupby/reindex/cumsum over df.
+_DISCOVERY_COUNTS_CACHE = {}
+_DISCOVERY_COUNTS_CACHE_MAX = 64
+
+
+def _cumulative_by_group(counts, color_col):
+    """Running totals of per-(disc_year, *color_col*) *counts*, with a
+    row for every year from each group's first discovery on.
+
+    Accumulates in a dense years x groups matrix instead of reindexing
+    a MultiIndex and running a grouped cumsum.  The leading zero rows
+    are dropped: in a stacked bar they draw nothing but still cost one
+    SVG bar each, which adds up over a century of years and 16 groups.
+    """
+    first_year = int(counts["disc_year"].min())
+    years = np.arange(first_year, int(counts["disc_year"].max()) + 1)
+    codes, groups = pd.factorize(counts[color_col])
+    matrix = np.zeros((len(years), len(groups)), dtype=np.int64)
+    # (year, group) pairs are unique after the groupby, so plain
+    # assignment fills the matrix.
+    matrix[counts["disc_year"].to_numpy() - first_year, codes] = (
+        counts["count"].to_numpy())
+    totals = matrix.cumsum(axis=0).ravel()
+    keep = totals > 0
+    return pd.DataFrame({
+        "disc_year": np.repeat(years, len(groups))[keep],
+        color_col: groups[np.tile(np.arange(len(groups)), len(years))[keep]],
+        "count": totals[keep],
+    })
+
+
+def _discovery_bar_traces(year_range, group_by, size_filter, view_mode,
+                          neo_source):
+    """Bar trace dicts for the discovery bar chart; callers must not
+    mutate them."""
+    key = (tuple(year_range), group_by, size_filter, view_mode,
+           neo_source)
+    cached = _DISCOVERY_COUNTS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    selected = _discovery_counts(year_range, size_filter, neo_source)
+    traces = []
 
-    # -- Main bar chart --
     if size_filter == "split":
         # Stack by size class (overrides Group by)
         color_col = "size_class"
-        counts = filtered.groupby(
-            ["disc_year", color_col]).size().reset_index(name="count")
+        counts = selected.groupby(
+            ["disc_year", color_col], observed=True
+        )["count"].sum().reset_index()
 
         if view_mode == "cumulative":
-            all_years = range(
-                int(counts["disc_year"].min()),
-                int(counts["disc_year"].max()) + 1)
-            all_groups = counts[color_col].unique()
-            full_idx = pd.MultiIndex.from_product(
-                [all_years, all_groups], names=["disc_year", color_col])
-            counts = (counts.set_index(["disc_year", color_col])
-                      .reindex(full_idx, fill_value=0).reset_index())
-            counts = counts.sort_values("disc_year")
-            counts["count"] = counts.groupby(color_col)["count"].cumsum()
+            counts = _cumulative_by_group(counts, color_col)
 
-        bar_fig = go.Figure()
+        # Row positions per size class from one groupby pass rather
+        # than a full mask of counts per class
+        rows = _group_rows(counts, color_col)
+        years = counts["disc_year"].to_numpy()
+        values = counts["count"].to_numpy()
         for i, (label, _, _) in enumerate(H_BINS):
-            gdata = counts[counts[color_col] == label]
-            if len(gdata) > 0:
-                bar_fig.add_trace(go.Bar(
-                    x=gdata["disc_year"], y=gdata["count"], name=label,
-                    marker_color=SIZE_COLORS[i],
-                    hovertemplate=("Year %{x}<br>" + label
-                                   + ": %{y:,}<extra></extra>"),
-                ))
+            idx = rows.get(label)
+            if idx is not None:
+                traces.append({
+                    "type": "bar",
+                    "x": years[idx],
+                    "y": values[idx],
+                    "name": label,
+                    "marker": {"color": SIZE_COLORS[i]},
+                    "hovertemplate": ("Year %{x}<br>" + label
+                                      + ": %{y:,}<extra></extra>"),
+                })
 
     elif group_by == "combined":
-        counts = filtered.groupby("disc_year").size().reset_index(name="count")
+        counts = selected.groupby("disc_year")["count"].sum().reset_index()
         if view_mode == "cumulative":
             counts = counts.sort_values("disc_year")
             counts["count"] = counts["count"].cumsum()
-        bar_fig = go.Figure(go.Bar(
-            x=counts["disc_year"], y=counts["count"],
-            marker_color="#607D8B",
-            hovertemplate="Year %{x}<br>%{y:,} discoveries<extra></extra>",
-        ))
+        traces.append({
+            "type": "bar",
+            "x": counts["disc_year"].to_numpy(),
+            "y": counts["count"].to_numpy(),
+            "marker": {"color": "#607D8B"},
+            "hovertemplate": "Year %{x}<br>%{y:,} discoveries<extra></extra>",
+        })
     else:
         color_col = "project" if group_by == "project" else "station_name"
-        counts = filtered.groupby(
-            ["disc_year", color_col]).size().reset_index(name="count")
+        counts = selected.groupby(
+            ["disc_year", color_col], observed=True
+        )["count"].sum().reset_index()
 
         if view_mode == "cumulative":
-            all_years = range(
-                int(counts["disc_year"].min()),
-                int(counts["disc_year"].max()) + 1)
-            all_groups = counts[color_col].unique()
-            full_idx = pd.MultiIndex.from_product(
-                [all_years, all_groups], names=["disc_year", color_col])
-            counts = (counts.set_index(["disc_year", color_col])
-                      .reindex(full_idx, fill_value=0).reset_index())
-            counts = counts.sort_values("disc_year")
-            counts["count"] = counts.groupby(color_col)["count"].cumsum()
+            counts = _cumulative_by_group(counts, color_col)
 
+        years = counts["disc_year"].to_numpy()
+        values = counts["count"].to_numpy()
         if group_by == "project":
-            color_order = [p for p in PROJECT_ORDER
-                           if p in counts[color_col].unique()]
+            rows = _group_rows(counts, color_col)
+            series = [(p, years[rows[p]], values[rows[p]])
+                      for p in PROJECT_ORDER if p in rows]
             color_map = PROJECT_COLORS
         else:
-            top = (counts.groupby(color_col)["count"]
-                   .sum().nlargest(15).index.tolist())
-            counts.loc[~counts[color_col].isin(top), color_col] = "Others"
-            counts = (counts.groupby(["disc_year", color_col])
-                      .sum().reset_index())
-            color_order = top + (
-                ["Others"] if "Others" in counts[color_col].values else [])
+            # Fifteen busiest stations by category code, ties in category
+            # order; the rest are summed per year into "Others" without
+            # rewriting the column to strings
+            codes = counts[color_col].cat.codes.to_numpy()
+            cats = counts[color_col].cat.categories
+            present = np.unique(codes)
+            totals = np.bincount(codes, weights=values)[present]
+            top_codes = present[np.argsort(-totals, kind="stable")[:15]]
+            series = []
+            for code in top_codes:
+                idx = np.flatnonzero(codes == code)
+                series.append((cats[code], years[idx], values[idx]))
+            other = ~np.isin(codes, top_codes)
+            if other.any():
+                other_years, inv = np.unique(years[other],
+                                             return_inverse=True)
+                other_counts = np.bincount(
+                    inv, weights=values[other]).astype(values.dtype)
+                series.append(("Others", other_years, other_counts))
             color_map = None
 
-        bar_fig = go.Figure()
-        for gname in color_order:
-            gdata = counts[counts[color_col] == gname]
-            bar_fig.add_trace(go.Bar(
-                x=gdata["disc_year"], y=gdata["count"], name=gname,
-                marker_color=(color_map or {}).get(gname),
-                hovertemplate=("Year %{x}<br>" + gname
-                               + ": %{y:,}<extra></extra>"),
-            ))
+        for gname, x, y in series:
+            trace = {
+                "type": "bar",
+                "x": x,
+                "y": y,
+                "name": gname,
+                "hovertemplate": ("Year %{x}<br>" + gname
+                                  + ": %{y:,}<extra></extra>"),
+            }
+            if color_map is not None and gname in color_map:
+                trace["marker"] = {"color": color_map[gname]}
+            traces.append(trace)
+
+    if len(_DISCOVERY_COUNTS_CACHE) >= _DISCOVERY_COUNTS_CACHE_MAX:
+        _DISCOVERY_COUNTS_CACHE.clear()
+    _DISCOVERY_COUNTS_CACHE[key] = traces
+    return traces
+
+
+_BAR_LAYOUT = _theme_layouts(
+    barmode="stack",
+    bargap=0.1,
+    legend={"orientation": "h", "yanchor": "bottom", "y": 1.02,
+            "xanchor": "right", "x": 1},
+    yaxis={"title": {"text": "Discoveries"}},
+)
+
+
+@app.callback(
+    Output("discovery-bar", "figure"),
+    Input("year-range", "value"),
+    Input("group-by", "value"),
+    Input("size-filter", "value"),
+    Input("cumulative-toggle", "value"),
+    State("theme-toggle", "value"),
+    State("plot-height", "value"),
+    Input("tabs", "value"),
+    Input("neo-source-filter", "value"),
+)
+def update_charts(year_range, group_by, size_filter, view_mode, theme_name,
+                  plot_height, active_tab, neo_source):
+    # Theme and height are States: restyle_discovery_bar() patches them
+    # into the current figure without resending its traces
+    if active_tab != "tab-discovery" or df is None:
+        raise PreventUpdate
+    key = ("bar", tuple(year_range), group_by, size_filter, view_mode,
+           theme_name, plot_height, neo_source)
+    cached = _DISCOVERY_FIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+    t = theme(theme_name)
+    y0, y1 = year_range
+
+    # -- Main bar chart --
+    # Built as a plain figure dict, like the detail figures below:
+    # go.Figure would re-validate every trace array on each miss.
+    traces = _discovery_bar_traces(year_range, group_by, size_filter,
+                                   view_mode, neo_source)
 
     title = "NEO Discoveries"
     if size_filter == "split":
@@ -8937,76 +9526,315 @@ def update_charts(year_range, group_by, size_filter, view_mode, theme_name,
     if view_mode == "cumulative":
         title += " (Cumulative)"
 
-    chart_h = int(plot_height)
-    bar_fig.update_layout(
-        barmode="stack",
-        height=chart_h,
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
-        title=title,
-        bargap=0.1,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02,
-                    xanchor="right", x=1),
-        xaxis=dict(title="Year",
-                   dtick=1 if (y1 - y0) <= 15 else 5),
-        yaxis=dict(title="Discoveries"),
-    )
+    bar_fig = {
+        "data": list(traces),
+        "layout": {
+            **_BAR_LAYOUT[t],
+            "height": int(plot_height),
+            "title": {"text": title},
+            "xaxis": {"title": {"text": "Year"},
+                      "dtick": 1 if (y1 - y0) <= 15 else 5},
+        },
+    }
+    _cache_discovery_fig(key, bar_fig)
+    return bar_fig
 
-    # -- Size distribution histogram --
-    size_order = [l for l, _, _ in H_BINS] + ["Unknown H"]
-    size_counts = filtered["size_class"].value_counts().reindex(
-        size_order).dropna()
-    size_fig = go.Figure(go.Bar(
-        x=size_counts.index, y=size_counts.values,
-        marker_color=["#440154", "#31688e", "#35b779", "#90d743", "#fde725"]
-        [:len(size_counts)],
-    ))
-    size_fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
-        title="Size Distribution (selected range)",
-        xaxis_title="Size Class (H magnitude)",
-        yaxis_title="Count",
-        showlegend=False,
-    )
 
-    # -- Top stations table --
-    top_df = (
-        filtered.groupby(["station_code", "station_name", "project"])
-        .size().reset_index(name="discoveries")
-        .sort_values("discoveries", ascending=False).head(15)
-    )
-    table_fig = go.Figure(go.Table(
-        header=dict(
-            values=["Station", "Project", "Discoveries"],
-            fill_color=t["table_header"],
-            font=dict(color=t["text"], size=13),
-            align="left",
-        ),
-        cells=dict(
-            values=[
-                top_df["station_code"] + " " + top_df["station_name"],
-                top_df["project"],
-                top_df["discoveries"].map("{:,}".format),
-            ],
-            fill_color=t["table_cell"],
-            font=dict(color=t["table_font"], size=12),
-            align="left",
-        ),
-    ))
-    table_fig.update_layout(
-        title="Top 15 Discovery Sites (selected range)",
-        template=t["template"],
-        paper_bgcolor=t["paper"],
-        margin=dict(l=10, r=10, t=40, b=10),
-    )
+@app.callback(
+    Output("discovery-bar", "figure", allow_duplicate=True),
+    Input("theme-toggle", "value"),
+    Input("plot-height", "value"),
+    State("tabs", "value"),
+    prevent_initial_call=True,
+)
+def restyle_discovery_bar(theme_name, plot_height, active_tab):
+    """Apply a theme or plot-height change to the discovery bar chart as
+    a Patch of its layout, leaving the traces in the browser.  Off the
+    tab, update_charts() picks the new values up on the way back."""
+    if active_tab != "tab-discovery" or df is None:
+        raise PreventUpdate
+    t = theme(theme_name)
+    patch = Patch()
+    for k in ("template", "paper_bgcolor", "plot_bgcolor"):
+        patch["layout"][k] = _BAR_LAYOUT[t][k]
+    patch["layout"]["height"] = int(plot_height)
+    return patch
+
+
+def _size_histogram_figure(counts, t):
+    """Discoveries per size class in *counts* (_discovery_counts() rows),
+    as a figure dict."""
+    # size_class categories are H_BIN_LABELS + ["Unknown H"] (load_data),
+    # so a weighted bincount of the codes is already in display order
+    size_order = H_BIN_LABELS + ["Unknown H"]
+    codes = counts["size_class"].cat.codes.to_numpy()
+    totals = np.bincount(codes[codes >= 0],
+                         weights=counts["count"].to_numpy()[codes >= 0],
+                         minlength=len(size_order)).astype(np.int64)
+    shown = np.flatnonzero(totals > 0)
+    return {
+        "data": [{
+            "type": "bar",
+            "x": [size_order[i] for i in shown],
+            "y": totals[shown],
+            "marker": {"color": ["#440154", "#31688e", "#35b779",
+                                 "#90d743", "#fde725"][:len(shown)]},
+        }],
+        "layout": {
+            "template": _template_json(t.template),
+            "paper_bgcolor": t.paper, "plot_bgcolor": t.plot,
+            "title": {"text": "Size Distribution (selected range)"},
+            "xaxis": {"title": {"text": "Size Class (H magnitude)"}},
+            "yaxis": {"title": {"text": "Count"}},
+            "showlegend": False,
+        },
+    }
+
+
+# (df object, {(source, size filter): per-station per-year counts})
+_station_year_cache = (None, {})
+
+
+def _station_year_counts(neo_source, size_filter):
+    """Discoveries per station (rows: code, name, project) and year
+    (columns), summed from _discovery_agg().  Built once per df object,
+    source and size filter, so the top-stations table sums a year slice
+    of a few hundred rows instead of regrouping on every callback."""
+    global _station_year_cache
+    src, tables = _station_year_cache
+    if src is not df:
+        tables = {}
+        _station_year_cache = (df, tables)
+    if size_filter == "split":
+        size_filter = "all"
+    table = tables.get((neo_source, size_filter))
+    if table is None:
+        agg = _discovery_agg(df, neo_source)
+        if size_filter != "all":
+            agg = agg[agg["size_class"] == size_filter]
+        table = tables[(neo_source, size_filter)] = (
+            agg.groupby(["station_code", "station_name", "project",
+                         "disc_year"], observed=True)["count"]
+            .sum().unstack("disc_year", fill_value=0))
+    return table
+
+
+def _top_stations_rows(year_range, size_filter, neo_source):
+    """DataTable rows for the 15 stations with the most discoveries in
+    *year_range* passing the size filter."""
+    y0, y1 = year_range
+    totals = _station_year_counts(neo_source, size_filter).loc[
+        :, y0:y1].sum(axis=1)
+    top = totals[totals > 0].nlargest(15)
+    return [
+        {"station": f"{code} {name}", "project": project,
+         "discoveries": f"{n:,}"}
+        for (code, name, project), n in top.items()
+    ]
+
+
+# The size histogram and top-stations table sit below the main chart, so
+# they are only built once scrolled into view (see _lazy_graph).
+@app.callback(
+    Output("size-histogram", "figure"),
+    Output("top-stations-table", "data"),
+    Input("year-range", "value"),
+    Input("size-filter", "value"),
+    Input("theme-toggle", "value"),
+    Input("tabs", "value"),
+    Input("neo-source-filter", "value"),
+    Input("visible-size-histogram", "data"),
+    Input("visible-top-stations-table", "data"),
+)
+def update_discovery_details(year_range, size_filter, theme_name,
+                             active_tab, neo_source, hist_visible,
+                             table_visible):
+    if (active_tab != "tab-discovery" or df is None
+            or not (hist_visible or table_visible)):
+        raise PreventUpdate
+    t = theme(theme_name)
+    state = (tuple(year_range), size_filter, neo_source)
+    outputs = []
+    # The table is styled through the page's CSS variables, so only the
+    # histogram depends on the theme
+    for key, visible, build in (
+            (("hist", theme_name) + state, hist_visible,
+             lambda: _size_histogram_figure(
+                 _discovery_counts(year_range, size_filter, neo_source),
+                 t)),
+            (("stations",) + state, table_visible,
+             lambda: _top_stations_rows(year_range, size_filter,
+                                        neo_source))):
+        if not visible:
+            outputs.append(no_update)
+            continue
+        out = _DISCOVERY_FIG_CACHE.get(key)
+        if out is None:
+            out = build()
+            _cache_discovery_fig(key, out)
+        outputs.append(out)
+    return tuple(outputs)
+
+
+# ---------------------------------------------------------------------------
+# H-magnitude distribution callback
+# ---------------------------------------------------------------------------
+
+_year_h_hist_cache = (None, {})
+
+
+def _year_h_hist(df_main, neo_source="any"):
+    """Discovered-NEO counts per (discovery year, half-magnitude bin).
+
+    Returns (first_year, counts) with counts[year - first_year, bin]
+    for the rows passing the banner source filter.  Built once per
+    *df_main* object and source, so callbacks only slice and sum.
+    """
+    global _year_h_hist_cache
+    src, hists = _year_h_hist_cache
+    if src is not df_main:
+        hists = {}
+        _year_h_hist_cache = (df_main, hists)
+    hist = hists.get(neo_source)
+    if hist is None:
+        view = _apply_source_filter(df_main, neo_source)
+        years = view["disc_year"].to_numpy(dtype=np.int64)
+        bins = view["h_bin_idx"].to_numpy(dtype=np.int64)
+        first_year = int(df_main["disc_year"].min())
+        n_years = int(df_main["disc_year"].max()) - first_year + 1
+        ok = (bins >= 0) & (bins < len(H_BIN_CENTERS))
+        counts = np.bincount(
+            (years[ok] - first_year) * len(H_BIN_CENTERS) + bins[ok],
+            minlength=n_years * len(H_BIN_CENTERS),
+        ).reshape(n_years, len(H_BIN_CENTERS))
+        hist = hists[neo_source] = (first_year, counts)
+    return hist
+
+
+# H-distribution figures and NEOMOD3 table rows per control state, keyed
+# like _DISCOVERY_FIG_CACHE.  Cleared when it fills up.
+_NEOMOD_FIG_CACHE = {}
+_NEOMOD_FIG_CACHE_MAX = 128
+
+
+def _cache_neomod_result(key, result):
+    if len(_NEOMOD_FIG_CACHE) >= _NEOMOD_FIG_CACHE_MAX:
+        _NEOMOD_FIG_CACHE.clear()
+    _NEOMOD_FIG_CACHE[key] = result
+
+
+def _h_cumulative_counts(idx, h):
+    """N(H < upper edge) for every half-magnitude bin, given the rows'
+    h_bin_idx and H values as arrays.
+
+    Objects brighter than the first bin count toward every bin, as in
+    NEOMOD3's N_cumul = N(H < H2).  One bincount over the precomputed
+    h_bin_idx plus a cumsum, rather than one comparison pass per bin.
+    """
+    per_bin = np.bincount(idx[(idx >= 0) & (idx < len(H_BIN_CENTERS))],
+                          minlength=len(H_BIN_CENTERS))
+    # h_bin_idx is -1 for both NaN and too-bright H, so count the latter
+    # directly.
+    n_bright = int((h < H_BIN_EDGES[0]).sum())
+    return n_bright + per_bin.cumsum()
+
 
-    return bar_fig, size_fig, table_fig
+def _h_bin_slice(h_lo, h_hi):
+    """Slice of the H_BIN_CENTERS bins with centers in [h_lo, h_hi].
 
+    The centers are sorted, so two binary searches replace a boolean
+    mask and per-bin arrays are cut as contiguous views.
+    """
+    return slice(int(np.searchsorted(H_BIN_CENTERS, h_lo, side="left")),
+                 int(np.searchsorted(H_BIN_CENTERS, h_hi, side="right")))
+
+
+def _neomod3_cumul_at(h):
+    """NEOMOD3 N(H < *h*), interpolated linearly across the model bin
+    that contains *h*; None when *h* is outside the model's bins."""
+    j = int(np.searchsorted(_NM_H1, h, side="right")) - 1
+    if j < 0 or h >= _NM_H2[j]:
+        return None
+    n_prev = _NM_NCUMUL[j - 1] if j > 0 else _NM_NCUMUL[j] - _NM_DN[j]
+    frac = (h - _NM_H1[j]) / (_NM_H2[j] - _NM_H1[j])
+    return n_prev + frac * (_NM_NCUMUL[j] - n_prev)
+
+
+def _h_bin_counts(df_main, year_range, neo_source="any"):
+    """Discovered NEOs per half-magnitude bin over *year_range*."""
+    first_year, counts = _year_h_hist(df_main, neo_source)
+    lo = max(int(year_range[0]) - first_year, 0)
+    hi = max(int(year_range[1]) - first_year + 1, 0)
+    return counts[lo:hi].sum(axis=0).astype(float)
+
+
+def _h_group_counts(filtered, group_by, h_mode):
+    """(groups, colors, counts) for the stacked H-distribution bars, with
+    counts[i] the per-bin (or, for *h_mode* "cumul", cumulative) count
+    of groups[i] over all H bins.  Callers must not mutate them."""
+    h_idx = filtered["h_bin_idx"].to_numpy()
+    h_vals = filtered["h"].to_numpy()
+    in_bins = (h_idx >= 0) & (h_idx < len(H_BIN_CENTERS))
+    color_col = "project" if group_by == "project" else "station_name"
+    # Group rows by category code; code -1 (missing) only ever lands
+    # in "Others"
+    codes = filtered[color_col].cat.codes.to_numpy()
+    cats = filtered[color_col].cat.categories
+    valid_codes = codes[in_bins & (codes >= 0)]
+    present, first_row = np.unique(valid_codes, return_index=True)
+    if group_by == "project":
+        groups = [p for p in PROJECT_ORDER
+                  if p in set(cats[present])]
+        colors = PROJECT_COLORS
+    else:
+        # Ten busiest stations, ties in order of first appearance
+        n_rows = np.bincount(valid_codes)[present]
+        top_codes = present[np.lexsort((first_row, -n_rows))[:10]]
+        groups = cats[top_codes].tolist()
+        colors = {}
+    # Map each row to its group position through a lookup on category
+    # codes (the extra last slot catches code -1); -1 means no group.
+    lut = np.full(len(cats) + 1, -1, dtype=np.intp)
+    lut[[cats.get_loc(g) for g in groups]] = np.arange(len(groups))
+    if group_by != "project":
+        others = lut == -1
+        lut[others] = len(groups)
+        if others[valid_codes].any() or (codes == -1)[in_bins].any():
+            groups.append("Others")
+    group_row = lut[codes]
+
+    # Every group's per-bin counts from one bincount over
+    # (group, bin) pairs, instead of a mask and a pass per group
+    n_bins = len(H_BIN_CENTERS)
+    n_groups = len(groups)
+    binned = in_bins & (group_row >= 0) & (group_row < n_groups)
+    counts = np.bincount(group_row[binned] * n_bins + h_idx[binned],
+                         minlength=n_groups * n_bins
+                         ).reshape(n_groups, n_bins)
+    if h_mode == "cumul":
+        # True cumulative per group: count objects with H < each
+        # bin upper edge, including objects brighter than first bin.
+        # Stacking works because each object belongs to exactly one
+        # group — sum of per-group cumulatives = combined cumulative.
+        bright = ((h_vals < H_BIN_EDGES[0]) & (group_row >= 0)
+                  & (group_row < n_groups))
+        n_bright = np.bincount(group_row[bright], minlength=n_groups)
+        counts = n_bright[:, None] + counts.cumsum(axis=1)
+    else:
+        counts = counts.astype(float)
+    return groups, colors, counts
+
+
+# Theme-dependent layout of the H-distribution figure, merged into its
+# dict form last: setting a named template through update_layout costs
+# more than building the rest of the figure.
+_H_DIST_LAYOUT = _theme_layouts(
+    barmode="stack",
+    margin={"r": 20},
+    legend={"orientation": "h", "yanchor": "bottom", "y": 1.02,
+            "xanchor": "right", "x": 1},
+)
 
-# ---------------------------------------------------------------------------
-# H-magnitude distribution callback
-# ---------------------------------------------------------------------------
 
 @app.callback(
     Output("h-distribution", "figure"),
@@ -9024,34 +9852,31 @@ def update_charts(year_range, group_by, size_filter, view_mode, theme_name,
 )
 def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
                           size_mapping, comp_labels, theme_name, plot_height,
-                          _tab, neo_source):
-    if df is None:
+                          active_tab, neo_source):
+    if active_tab != "tab-neomod" or df is None:
         raise PreventUpdate
+    key = ("h", tuple(h_year_range), group_by, tuple(h_range), yscale,
+           h_mode, size_mapping, tuple(comp_labels or ()), theme_name,
+           plot_height, neo_source)
+    cached = _NEOMOD_FIG_CACHE.get(key)
+    if cached is not None:
+        return cached
     t = theme(theme_name)
     hy0, hy1 = h_year_range
     # Snap slider values to nearest bin center to avoid floating-point drift
     h_lo = round(h_range[0] * 4) / 4  # snap to 0.25 grid
     h_hi = round(h_range[1] * 4) / 4
     df_view = _apply_source_filter(df, neo_source)
-    filtered = df_view[(df_view["disc_year"] >= hy0) & (df_view["disc_year"] <= hy1)]
-
-    # Only rows with valid H in the bin range
-    valid = filtered[
-        (filtered["h_bin_idx"] >= 0)
-        & (filtered["h_bin_idx"] < len(H_BIN_CENTERS))
-    ].copy()
+    filtered = _year_slice(df_view, hy0, hy1)
 
-    # Mask of bin indices within the selected H range
-    bin_mask = (H_BIN_CENTERS >= h_lo) & (H_BIN_CENTERS <= h_hi)
+    # Bins within the selected H range
+    bin_mask = _h_bin_slice(h_lo, h_hi)
     vis_centers = H_BIN_CENTERS[bin_mask]
 
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
     # ── Total count per bin (for completeness) ───────────────────
-    total_per_bin = np.zeros(len(H_BIN_CENTERS))
-    for idx, cnt in valid["h_bin_idx"].value_counts().items():
-        if 0 <= idx < len(total_per_bin):
-            total_per_bin[idx] = cnt
+    total_per_bin = _h_bin_counts(df, h_year_range, neo_source)
 
     # Slice to visible range
     vis_total = total_per_bin[bin_mask]
@@ -9060,73 +9885,50 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
     # edge (including objects brighter than our first bin at H=15.25).
     # This matches NEOMOD3's N_cumul = N(H < H2) definition.
     if h_mode == "cumul":
-        h_vals = filtered["h"]
-        vis_cumul = np.array([
-            int((h_vals < H_BIN_EDGES[i + 1]).sum())
-            for i, m in enumerate(bin_mask) if m
-        ])
+        cumul_all = _h_cumulative_counts(filtered["h_bin_idx"].to_numpy(),
+                                         filtered["h"].to_numpy())
+        vis_cumul = cumul_all[bin_mask]
 
     # ── Discovered bars (stacked by group or combined) ───────────
+    # Collected as dicts and added with one add_traces() call below:
+    # each add_trace() re-runs the figure's validation and bookkeeping.
+    bars = []
     if group_by == "combined":
         if h_mode == "diff":
             y_vals = vis_total
         else:
             y_vals = vis_cumul
-        fig.add_trace(
-            go.Bar(
-                x=vis_centers, y=y_vals,
-                name="Discovered",
-                marker_color="#607D8B",
-                width=0.36,
-                hovertemplate="%{x:.2f}<br>Discovered: %{y:,}<extra></extra>",
-            ),
-            secondary_y=False,
-        )
+        bars.append({
+            "type": "bar", "x": vis_centers, "y": y_vals,
+            "name": "Discovered",
+            "marker": {"color": "#607D8B"},
+            "width": 0.36,
+            "hovertemplate":
+                "%{x:.2f}<br>Discovered: %{y:,}<extra></extra>",
+        })
     else:
-        color_col = "project" if group_by == "project" else "station_name"
-        if group_by == "project":
-            groups = [p for p in PROJECT_ORDER
-                      if p in valid[color_col].unique()]
-            colors = PROJECT_COLORS
-        else:
-            top = valid[color_col].value_counts().nlargest(10).index.tolist()
-            valid.loc[~valid[color_col].isin(top), color_col] = "Others"
-            filtered.loc[
-                ~filtered[color_col].isin(top), color_col
-            ] = "Others"
-            groups = top + (
-                ["Others"] if "Others" in valid[color_col].values else [])
-            colors = {}
-
-        for gname in groups:
-            subset = valid[valid[color_col] == gname]
-            counts = np.zeros(len(H_BIN_CENTERS))
-            for idx, cnt in subset["h_bin_idx"].value_counts().items():
-                if 0 <= idx < len(counts):
-                    counts[idx] = cnt
-            vis_counts = counts[bin_mask]
-            if h_mode == "cumul":
-                # True cumulative per group: count objects with H < each
-                # bin upper edge, including objects brighter than first bin.
-                # Stacking works because each object belongs to exactly one
-                # group — sum of per-group cumulatives = combined cumulative.
-                grp_h = filtered.loc[
-                    filtered[color_col] == gname, "h"
-                ]
-                vis_counts = np.array([
-                    int((grp_h < H_BIN_EDGES[i + 1]).sum())
-                    for i, m in enumerate(bin_mask) if m
-                ])
-            fig.add_trace(
-                go.Bar(
-                    x=vis_centers, y=vis_counts, name=gname,
-                    marker_color=colors.get(gname),
-                    width=0.36,
-                    hovertemplate=("%{x:.2f}<br>" + gname
-                                   + ": %{y:,}<extra></extra>"),
-                ),
-                secondary_y=False,
-            )
+        # The group counts depend only on the data selection and mode,
+        # so H-range, scale, label and theme changes reuse them
+        groups_key = ("h_groups", tuple(h_year_range), group_by, h_mode,
+                      neo_source)
+        grouped = _NEOMOD_FIG_CACHE.get(groups_key)
+        if grouped is None:
+            grouped = _h_group_counts(filtered, group_by, h_mode)
+            _cache_neomod_result(groups_key, grouped)
+        groups, colors, counts = grouped
+
+        for gname, group_counts in zip(groups, counts):
+            vis_counts = group_counts[bin_mask]
+            bar = {
+                "type": "bar", "x": vis_centers, "y": vis_counts,
+                "name": gname,
+                "width": 0.36,
+                "hovertemplate": ("%{x:.2f}<br>" + gname
+                                  + ": %{y:,}<extra></extra>"),
+            }
+            if gname in colors:
+                bar["marker"] = {"color": colors[gname]}
+            bars.append(bar)
 
     # ── NEOMOD3 undiscovered remainder ──────────────────────────
     # The "remaining" bar stacks on top of discovered so the total
@@ -9137,29 +9939,17 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
 
     model_col = "dn_model" if h_mode == "diff" else "n_cumul"
 
-    # For differential: lookup per-bin discovered count
+    # For differential: per-bin discovered count
     # For cumulative: count ALL discovered with H < bin upper edge,
     #   including objects brighter than our first bin (H < 15.25).
     #   NEOMOD3 N_cumul is N(H < H2), so we must match that definition.
-    diff_by_center = dict(zip(vis_centers, vis_total))
-
-    if h_mode == "cumul":
-        h_vals = filtered["h"]
-        cumul_by_center = {}
-        for _, row in nm.iterrows():
-            cumul_by_center[row["h_center"]] = int((h_vals < row["h2"]).sum())
-
-    def get_disc(hc):
-        if h_mode == "diff":
-            return diff_by_center.get(hc, 0)
-        return cumul_by_center.get(hc, 0)
-
-    remainder = []
-    disc_for_hover = []
-    for _, row in nm.iterrows():
-        disc = get_disc(row["h_center"])
-        disc_for_hover.append(disc)
-        remainder.append(max(0, row[model_col] - disc))
+    # NEOMOD3's rows sit on the half-magnitude grid, so both come from
+    # indexing the full-length per-bin arrays by each row's bin index.
+    disc_per_bin = total_per_bin if h_mode == "diff" else cumul_all
+    nm_bin = nm["bin_idx"].to_numpy()
+    disc_for_hover = np.where(
+        nm_bin >= 0, disc_per_bin[np.maximum(nm_bin, 0)], 0)
+    remainder = np.maximum(nm[model_col].to_numpy() - disc_for_hover, 0)
     nm["remainder"] = remainder
     nm["disc_count"] = disc_for_hover
 
@@ -9167,27 +9957,25 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
         else "rgba(120,120,120,0.5)"
     remainder_label = "Est. undiscovered" if h_mode == "diff" \
         else "Est. undiscovered (cumul)"
-    fig.add_trace(
-        go.Bar(
-            x=nm["h_center"], y=nm["remainder"],
-            name=remainder_label,
-            marker=dict(
-                color="rgba(0,0,0,0)",
-                line=dict(color=model_outline_color, width=0.75),
-            ),
-            width=0.36,
-            customdata=np.stack([
-                nm[model_col].values,
-                np.array(remainder),
-            ], axis=-1),
-            hovertemplate=(
-                "%{x:.2f}<br>"
-                "NEOMOD3 total: %{customdata[0]:,}<br>"
-                "Undiscovered: %{customdata[1]:,}<extra></extra>"
-            ),
+    bars.append({
+        "type": "bar", "x": nm["h_center"], "y": nm["remainder"],
+        "name": remainder_label,
+        "marker": {
+            "color": "rgba(0,0,0,0)",
+            "line": {"color": model_outline_color, "width": 0.75},
+        },
+        "width": 0.36,
+        "customdata": np.stack([
+            nm[model_col].values,
+            remainder,
+        ], axis=-1),
+        "hovertemplate": (
+            "%{x:.2f}<br>"
+            "NEOMOD3 total: %{customdata[0]:,}<br>"
+            "Undiscovered: %{customdata[1]:,}<extra></extra>"
         ),
-        secondary_y=False,
-    )
+    })
+    fig.add_traces(bars, secondary_ys=[False] * len(bars))
 
     # ── Completeness line with 1-sigma error bars ───────────────
     # Error bars come from NEOMOD3's N_min/N_max (1σ on cumulative).
@@ -9196,30 +9984,36 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
     # In cumulative mode, N_cumul = N(H < H2) so completeness points
     # belong at the right bin edge (h2), not the center.
     # In differential mode, dN covers the full bin so center is correct.
-    comp_x, comp_y, err_lo, err_hi = [], [], [], []
-    for _, row in nm.iterrows():
-        hc = row["h_center"]
-        disc = get_disc(hc)
-        if h_mode == "cumul":
-            model_val = row["n_cumul"]
-            model_lo = row["n_min"]
-            model_hi = row["n_max"]
-        else:
-            model_val = row["dn_model"]
-            # Scale dN by fractional cumulative bounds
-            frac_lo = row["n_min"] / row["n_cumul"] if row["n_cumul"] else 1
-            frac_hi = row["n_max"] / row["n_cumul"] if row["n_cumul"] else 1
-            model_lo = model_val * frac_lo
-            model_hi = model_val * frac_hi
-        if model_val > 0:
-            comp = min(disc / model_val * 100, 100)
-            # Higher model → lower completeness and vice versa
-            c_lo = min(disc / model_hi * 100, 100) if model_hi > 0 else 0
-            c_hi = min(disc / model_lo * 100, 100) if model_lo > 0 else 100
-            comp_x.append(row["h2"] if h_mode == "cumul" else hc)
-            comp_y.append(comp)
-            err_lo.append(comp - c_lo)
-            err_hi.append(c_hi - comp)
+    n_cumul = nm["n_cumul"].to_numpy()
+    if h_mode == "cumul":
+        model_val = n_cumul
+        model_lo = nm["n_min"].to_numpy()
+        model_hi = nm["n_max"].to_numpy()
+    else:
+        model_val = nm["dn_model"].to_numpy()
+        # Scale dN by fractional cumulative bounds
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac_lo = np.where(n_cumul != 0, nm["n_min"].to_numpy() / n_cumul,
+                               1)
+            frac_hi = np.where(n_cumul != 0, nm["n_max"].to_numpy() / n_cumul,
+                               1)
+        model_lo = model_val * frac_lo
+        model_hi = model_val * frac_hi
+    shown = model_val > 0
+    disc = disc_for_hover[shown]
+    model_val, model_lo, model_hi = (
+        model_val[shown], model_lo[shown], model_hi[shown])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        comp_y = np.minimum(disc / model_val * 100, 100)
+        # Higher model → lower completeness and vice versa
+        c_lo = np.where(model_hi > 0,
+                        np.minimum(disc / model_hi * 100, 100), 0)
+        c_hi = np.where(model_lo > 0,
+                        np.minimum(disc / model_lo * 100, 100), 100)
+    comp_x = (nm["h2"] if h_mode == "cumul" else nm["h_center"]
+              ).to_numpy()[shown]
+    err_lo = comp_y - c_lo
+    err_hi = c_hi - comp_y
 
     show_labels = "show" in (comp_labels or [])
 
@@ -9245,10 +10039,8 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
                 "1\u03C3 range: %{customdata[0]:.1f}\u2013%{customdata[1]:.1f}%"
                 "<extra></extra>"
             ),
-            customdata=list(zip(
-                [comp_y[i] - err_lo[i] for i in range(len(comp_y))],
-                [comp_y[i] + err_hi[i] for i in range(len(comp_y))],
-            )),
+            customdata=np.stack([comp_y - err_lo, comp_y + err_hi],
+                                axis=-1),
         ),
         secondary_y=True,
     )
@@ -9300,23 +10092,15 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
         # Interpolate NEOMOD3 model N(<h_140m) between surrounding bin edges
         h_vals_all = filtered["h"]
         n_disc_140m = int((h_vals_all < h_140m).sum())
-        # Find the bin containing h_140m
-        n_model_140m = None
-        for j, row in NEOMOD3_DF.iterrows():
-            if row["h1"] <= h_140m < row["h2"]:
-                n_prev = NEOMOD3_DF.iloc[j - 1]["n_cumul"] if j > 0 else (
-                    row["n_cumul"] - row["dn_model"])
-                frac = (h_140m - row["h1"]) / (row["h2"] - row["h1"])
-                n_model_140m = n_prev + frac * (row["n_cumul"] - n_prev)
-                break
+        n_model_140m = _neomod3_cumul_at(h_140m)
         if n_model_140m and n_model_140m > 0:
             comp_140m = min(n_disc_140m / n_model_140m * 100, 100)
             fig.add_annotation(
                 x=h_140m, y=comp_140m, yref="y2",
                 text=f" {comp_140m:.0f}% at H={h_140m}",
-                showarrow=True, arrowhead=2, arrowcolor=t["text"],
+                showarrow=True, arrowhead=2, arrowcolor=t.text,
                 ax=45, ay=-28,
-                font=dict(size=12, color=t["text"]),
+                font=dict(size=12, color=t.text),
             )
 
     mode_label = "Differential" if h_mode == "diff" else "Cumulative"
@@ -9326,15 +10110,9 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
     year_note = f" \u2014 {hy0}\u2013{hy1}" if hy0 != year_min or hy1 != year_max \
         else ""
     fig.update_layout(
-        barmode="stack",
         height=int(plot_height),
-        margin=dict(r=20),
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
         title=(f"NEO Discoveries vs. NEOMOD3 ({mode_label}, half-mag bins)"
                + year_note),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02,
-                    xanchor="right", x=1),
         xaxis=dict(
             title="Absolute magnitude H",
             range=x_range,
@@ -9346,7 +10124,7 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
         xref="paper", yref="paper",
         x=0.02, y=-0.08,
         showarrow=False,
-        font=dict(size=10, color=t["subtext"]),
+        font=dict(size=10, color=t.subtext),
     )
     y_label = "NEOs per bin" if h_mode == "diff" else "Cumulative N(<H)"
     fig.update_yaxes(
@@ -9355,6 +10133,9 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
         secondary_y=False,
     )
 
+    fig = fig.to_plotly_json()
+    fig["layout"].update(_H_DIST_LAYOUT[t])
+    _cache_neomod_result(key, fig)
     return fig
 
 
@@ -9363,40 +10144,39 @@ def update_h_distribution(h_year_range, group_by, h_range, yscale, h_mode,
 # ---------------------------------------------------------------------------
 
 @app.callback(
-    Output("neomod3-table", "figure"),
+    Output("neomod3-table", "data"),
     Input("h-year-range", "value"),
-    Input("theme-toggle", "value"),
     Input("tabs", "value"),
     Input("neo-source-filter", "value"),
+    Input("visible-neomod3-table", "data"),
 )
-def update_neomod3_table(h_year_range, theme_name, _tab, neo_source):
-    if df is None:
+def update_neomod3_table(h_year_range, active_tab, neo_source, visible):
+    if active_tab != "tab-neomod" or df is None or not visible:
         raise PreventUpdate
-    t = theme(theme_name)
+    key = ("nm3", tuple(h_year_range), neo_source)
+    cached = _NEOMOD_FIG_CACHE.get(key)
+    if cached is not None:
+        return cached
     hy0, hy1 = h_year_range
     df_view = _apply_source_filter(df, neo_source)
-    filtered = df_view[(df_view["disc_year"] >= hy0) & (df_view["disc_year"] <= hy1)]
+    filtered = _year_slice(df_view, hy0, hy1)
 
     # Count discovered NEOs per half-magnitude bin
-    valid = filtered[
-        (filtered["h_bin_idx"] >= 0)
-        & (filtered["h_bin_idx"] < len(H_BIN_CENTERS))
-    ]
-    disc_per_bin = np.zeros(len(H_BIN_CENTERS))
-    for idx, cnt in valid["h_bin_idx"].value_counts().items():
-        if 0 <= idx < len(disc_per_bin):
-            disc_per_bin[idx] = cnt
+    disc_per_bin = _h_bin_counts(df, h_year_range, neo_source)
 
     # Build table rows aligned to NEOMOD3 bins
     # Cumulative completeness uses count of ALL discovered with H < H2
     # (including objects brighter than first bin edge) to match NEOMOD3's
-    # N_cumul = N(H < H2) definition.
-    h_vals = filtered["h"]
+    # N_cumul = N(H < H2) definition.  NEOMOD3's h2 values are the bin
+    # upper edges, so one bincount + cumsum gives every row's count.
+    cumul_per_bin = _h_cumulative_counts(filtered["h_bin_idx"].to_numpy(),
+                                         filtered["h"].to_numpy())
     rows = []
     for _, row in NEOMOD3_DF.iterrows():
-        bin_idx = int(round((row["h_center"] - H_BIN_CENTERS[0]) / 0.5))
-        disc = int(disc_per_bin[bin_idx]) if 0 <= bin_idx < len(disc_per_bin) else 0
-        disc_below_h2 = int((h_vals < row["h2"]).sum())
+        bin_idx = row["bin_idx"]
+        in_range = bin_idx >= 0
+        disc = int(disc_per_bin[bin_idx]) if in_range else 0
+        disc_below_h2 = int(cumul_per_bin[bin_idx]) if in_range else 0
         comp_diff = min(disc / row["dn_model"] * 100, 100) \
             if row["dn_model"] > 0 else 0
         comp_cumul = min(disc_below_h2 / row["n_cumul"] * 100, 100) \
@@ -9412,49 +10192,110 @@ def update_neomod3_table(h_year_range, theme_name, _tab, neo_source):
             "comp_cumul": f"{comp_cumul:.1f}%",
         })
 
-    tbl = pd.DataFrame(rows)
-    fig = go.Figure(go.Table(
-        header=dict(
-            values=["H bin", "Model dN", "Model N(&lt;H)",
-                    "N 1\u03C3 range", "Discovered", "Disc. cumul.",
-                    "Compl. (bin)", "Compl. (cumul.)"],
-            fill_color=t["table_header"],
-            font=dict(color=t["text"], size=12),
-            align="center",
-        ),
-        cells=dict(
-            values=[tbl[c] for c in tbl.columns],
-            fill_color=t["table_cell"],
-            font=dict(color=t["table_font"], size=11),
-            align=["center", "right", "right", "center",
-                   "right", "right", "right", "right"],
-        ),
-    ))
-    fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
-        margin=dict(l=10, r=10, t=10, b=10),
-        height=700,
-    )
-    return fig
+    _cache_neomod_result(key, rows)
+    return rows
 
 
 # ---------------------------------------------------------------------------
-# Multi-survey comparison callback
+# Multi-survey comparison callbacks
 # ---------------------------------------------------------------------------
 
+# Survey sets and reach totals per data selection.  Each comparison graph
+# has its own callback, so a metric or Venn-selection change re-renders
+# only the graph that uses it; all of them share these entries rather
+# than rebuilding the sets.  The data is loaded once per process, so
+# entries never go stale.  Callers must not mutate the returned sets.
+_COMPARISON_DATA_CACHE = {}
+_COMPARISON_DATA_CACHE_MAX = 64
+# One lock per key being built, so the graph callbacks that a control
+# change fires together wait for a single build instead of each running
+# it on its own server thread.  _COMPARISON_BUILD_LOCKS is guarded by
+# _comparison_locks_lock.
+_COMPARISON_BUILD_LOCKS = {}
+_comparison_locks_lock = threading.Lock()
+
+
+def _comparison_cached(key, build):
+    """Cached value for *key*, calling *build()* at most once per key
+    across concurrent callers."""
+    if key in _COMPARISON_DATA_CACHE:
+        return _COMPARISON_DATA_CACHE[key]
+    with _comparison_locks_lock:
+        key_lock = _COMPARISON_BUILD_LOCKS.setdefault(key, threading.Lock())
+    with key_lock:
+        # Another caller may have finished the build while we waited
+        if key in _COMPARISON_DATA_CACHE:
+            return _COMPARISON_DATA_CACHE[key]
+        try:
+            value = build()
+            if len(_COMPARISON_DATA_CACHE) >= _COMPARISON_DATA_CACHE_MAX:
+                _COMPARISON_DATA_CACHE.clear()
+            _COMPARISON_DATA_CACHE[key] = value
+            return value
+        finally:
+            with _comparison_locks_lock:
+                _COMPARISON_BUILD_LOCKS.pop(key, None)
+
+
+def _comparison_data(year_range, size_filter, exclude_precovery,
+                     window_days, group_col, neo_source):
+    """(survey_sets, eligible) for the comparison tab."""
+    key = ("sets", tuple(year_range), size_filter, exclude_precovery,
+           window_days, group_col, neo_source)
+
+    def build():
+        df_view = _apply_source_filter(df, neo_source)
+        df_app_view = _apply_source_filter(df_apparition, neo_source)
+        return build_survey_sets(
+            df_view, df_app_view, year_range, size_filter,
+            exclude_precovery, window_days, group_col)
+
+    return _comparison_cached(key, build)
+
+
+def _comparison_reach_totals(year_range, size_filter, exclude_precovery,
+                             window_days, group_col, metric, neo_source):
+    """Per-survey totals for a non-"neos" reach metric (may be empty)."""
+    key = ("reach", tuple(year_range), size_filter, exclude_precovery,
+           window_days, group_col, metric, neo_source)
+
+    def build():
+        df_view = _apply_source_filter(df, neo_source)
+        df_app_view = _apply_source_filter(df_apparition, neo_source)
+        return build_survey_metric_totals(
+            df_view, df_app_view, year_range, size_filter,
+            exclude_precovery, window_days, group_col, metric)
+
+    return _comparison_cached(key, build)
+
+
+def _comparison_params(precovery, window_days, group_mode):
+    """(exclude_precovery, window_days, group_col, color_map) from the
+    comparison controls."""
+    exclude_precovery = precovery == "post_only"
+    window_days = int(window_days or 200)
+    if group_mode == "station":
+        return exclude_precovery, window_days, "station_code", STATION_COLORS
+    return exclude_precovery, window_days, "project", PROJECT_COLORS
+
+
+def _comparison_year_tag(year_range):
+    y0, y1 = year_range
+    return f"({y0})" if y0 == y1 else f"({y0}\u2013{str(y1)[-2:]})"
+
+
+def _require_comparison_tab(active_tab):
+    if active_tab != "tab-comparison" or df is None or df_apparition is None:
+        raise PreventUpdate
+
+
 @app.callback(
-    Output("venn-diagram", "figure"),
-    Output("survey-reach", "figure"),
-    Output("pairwise-heatmap", "figure"),
-    Output("comparison-summary", "figure"),
-    Output("annual-overlap", "figure"),
+    Output("venn-diagram", "children"),
     Input("comp-year-range", "value"),
     Input("comp-size-filter", "value"),
     Input("comp-survey-select", "value"),
     Input("comp-precovery", "value"),
     Input("comp-window", "value"),
-    Input("comp-metric", "value"),
     Input("comp-group-mode", "value"),
     Input("comp-venn-labels", "value"),
     Input("theme-toggle", "value"),
@@ -9462,75 +10303,167 @@ def update_neomod3_table(h_year_range, theme_name, _tab, neo_source):
     Input("tabs", "value"),
     Input("neo-source-filter", "value"),
 )
-def update_comparison(year_range, size_filter, survey_select,
-                      precovery, window_days, metric, group_mode,
-                      venn_labels, theme_name, plot_height, active_tab,
-                      neo_source):
-    if active_tab != "tab-comparison" or df is None or df_apparition is None:
-        raise PreventUpdate
+def update_venn(year_range, size_filter, survey_select, precovery,
+                window_days, group_mode, venn_labels, theme_name,
+                plot_height, active_tab, neo_source):
+    _require_comparison_tab(active_tab)
 
     t = theme(theme_name)
     height = int(plot_height)
-    exclude_precovery = precovery == "post_only"
-    window_days = int(window_days or 200)
-    metric = metric or "neos"
-    group_col = ("station_code" if group_mode == "station"
-                 else "project")
-    color_map = (STATION_COLORS if group_mode == "station"
-                 else PROJECT_COLORS)
-
-    df_view = _apply_source_filter(df, neo_source)
-    df_app_view = _apply_source_filter(df_apparition, neo_source)
-    survey_sets, eligible = build_survey_sets(
-        df_view, df_app_view, year_range, size_filter, exclude_precovery,
-        window_days, group_col)
-    if metric == "neos":
-        reach_totals = None
-    else:
-        reach_totals = build_survey_metric_totals(
-            df_view, df_app_view, year_range, size_filter,
-            exclude_precovery, window_days, group_col, metric)
-        if not reach_totals:
-            # Fallback: pre-agg cols missing (cache pre-Phase-2A) →
-            # render the chart at NEO counts and fall through.
-            metric = "neos"
-
-    eligible_total = len(eligible)
-    y0, y1 = year_range
-    yr_tag = (f"({y0})" if y0 == y1
-              else f"({y0}\u2013{str(y1)[-2:]})")
-
-    # Venn diagram
+    exclude_precovery, window_days, group_col, color_map = (
+        _comparison_params(precovery, window_days, group_mode))
     survey_select = survey_select or []
     if len(survey_select) < 1:
-        venn_fig = _empty_figure(
+        return _venn_message(
             "Select 1\u20133 surveys for Venn diagram", t, height)
-    elif len(survey_select) == 1:
+
+    survey_sets, eligible = _comparison_data(
+        year_range, size_filter, exclude_precovery, window_days,
+        group_col, neo_source)
+    eligible_total = len(eligible)
+    yr_tag = _comparison_year_tag(year_range)
+
+    if len(survey_select) == 1:
         s = survey_sets.get(survey_select[0], set())
         c = color_map.get(survey_select[0], "#a9a9a9")
-        venn_fig = _make_venn1(s, survey_select[0], c, t, height,
-                               venn_labels, eligible_total, yr_tag)
-    elif len(survey_select) == 2:
+        return _make_venn1(s, survey_select[0], c, t, height,
+                           venn_labels, eligible_total, yr_tag)
+    if len(survey_select) == 2:
         venn_sets = [survey_sets.get(s, set()) for s in survey_select]
         venn_colors = [color_map.get(s, "#a9a9a9")
                        for s in survey_select]
-        venn_fig = _make_venn2(
+        return _make_venn2(
             venn_sets, survey_select, venn_colors, t, height,
             venn_labels, eligible_total, yr_tag)
-    else:
-        sel = survey_select[:3]
-        venn_sets = [survey_sets.get(s, set()) for s in sel]
-        venn_colors = [color_map.get(s, "#a9a9a9") for s in sel]
-        venn_fig = _make_venn3(
-            venn_sets, sel, venn_colors, t, height,
-            venn_labels, eligible_total, yr_tag)
+    sel = survey_select[:3]
+    venn_sets = [survey_sets.get(s, set()) for s in sel]
+    venn_colors = [color_map.get(s, "#a9a9a9") for s in sel]
+    return _make_venn3(
+        venn_sets, sel, venn_colors, t, height,
+        venn_labels, eligible_total, yr_tag)
+
+
+@app.callback(
+    Output("survey-reach", "figure"),
+    Input("comp-year-range", "value"),
+    Input("comp-size-filter", "value"),
+    Input("comp-precovery", "value"),
+    Input("comp-window", "value"),
+    Input("comp-metric", "value"),
+    Input("comp-group-mode", "value"),
+    Input("theme-toggle", "value"),
+    Input("plot-height", "value"),
+    Input("tabs", "value"),
+    Input("neo-source-filter", "value"),
+)
+def update_survey_reach(year_range, size_filter, precovery, window_days,
+                        metric, group_mode, theme_name, plot_height,
+                        active_tab, neo_source):
+    _require_comparison_tab(active_tab)
 
-    reach_fig = _make_survey_reach(
-        survey_sets, t, height, yr_tag, color_map,
-        totals=reach_totals, metric=metric)
-    heatmap_fig = _make_pairwise_heatmap(survey_sets, t, height, yr_tag)
-    summary_fig = _make_comparison_summary(
-        survey_sets, eligible, t, height, yr_tag)
+    t = theme(theme_name)
+    exclude_precovery, window_days, group_col, color_map = (
+        _comparison_params(precovery, window_days, group_mode))
+    metric = metric or "neos"
+    survey_sets, _eligible = _comparison_data(
+        year_range, size_filter, exclude_precovery, window_days,
+        group_col, neo_source)
+    reach_totals = None
+    if metric != "neos":
+        reach_totals = _comparison_reach_totals(
+            year_range, size_filter, exclude_precovery, window_days,
+            group_col, metric, neo_source)
+        if not reach_totals:
+            # Fallback: pre-agg cols missing (cache pre-Phase-2A) →
+            # render the chart at NEO counts and fall through.
+            metric = "neos"
+    return _make_survey_reach(
+        survey_sets, t, int(plot_height), _comparison_year_tag(year_range),
+        color_map, totals=reach_totals, metric=metric)
+
+
+@app.callback(
+    Output("pairwise-heatmap", "figure"),
+    Input("comp-year-range", "value"),
+    Input("comp-size-filter", "value"),
+    Input("comp-precovery", "value"),
+    Input("comp-window", "value"),
+    Input("comp-group-mode", "value"),
+    Input("theme-toggle", "value"),
+    Input("plot-height", "value"),
+    Input("tabs", "value"),
+    Input("neo-source-filter", "value"),
+)
+def update_pairwise_heatmap(year_range, size_filter, precovery,
+                            window_days, group_mode, theme_name,
+                            plot_height, active_tab, neo_source):
+    _require_comparison_tab(active_tab)
+
+    exclude_precovery, window_days, group_col, _colors = (
+        _comparison_params(precovery, window_days, group_mode))
+    survey_sets, _eligible = _comparison_data(
+        year_range, size_filter, exclude_precovery, window_days,
+        group_col, neo_source)
+    return _make_pairwise_heatmap(
+        survey_sets, theme(theme_name), int(plot_height),
+        _comparison_year_tag(year_range))
+
+
+@app.callback(
+    Output("comparison-summary", "figure"),
+    Input("comp-year-range", "value"),
+    Input("comp-size-filter", "value"),
+    Input("comp-precovery", "value"),
+    Input("comp-window", "value"),
+    Input("comp-group-mode", "value"),
+    Input("theme-toggle", "value"),
+    Input("plot-height", "value"),
+    Input("tabs", "value"),
+    Input("neo-source-filter", "value"),
+)
+def update_comparison_summary(year_range, size_filter, precovery,
+                              window_days, group_mode, theme_name,
+                              plot_height, active_tab, neo_source):
+    _require_comparison_tab(active_tab)
+
+    exclude_precovery, window_days, group_col, _colors = (
+        _comparison_params(precovery, window_days, group_mode))
+    survey_sets, eligible = _comparison_data(
+        year_range, size_filter, exclude_precovery, window_days,
+        group_col, neo_source)
+    return _make_comparison_summary(
+        survey_sets, eligible, theme(theme_name), int(plot_height),
+        _comparison_year_tag(year_range))
+
+
+@app.callback(
+    Output("annual-overlap", "figure"),
+    Input("comp-year-range", "value"),
+    Input("comp-size-filter", "value"),
+    Input("comp-survey-select", "value"),
+    Input("comp-precovery", "value"),
+    Input("comp-window", "value"),
+    Input("comp-group-mode", "value"),
+    Input("comp-venn-labels", "value"),
+    Input("theme-toggle", "value"),
+    Input("plot-height", "value"),
+    Input("tabs", "value"),
+    Input("neo-source-filter", "value"),
+    Input("visible-annual-overlap", "data"),
+)
+def update_annual_overlap(year_range, size_filter, survey_select,
+                          precovery, window_days, group_mode, venn_labels,
+                          theme_name, plot_height, active_tab, neo_source,
+                          visible):
+    _require_comparison_tab(active_tab)
+    if not visible:
+        raise PreventUpdate
+
+    exclude_precovery, window_days, group_col, color_map = (
+        _comparison_params(precovery, window_days, group_mode))
+    survey_sets, _eligible = _comparison_data(
+        year_range, size_filter, exclude_precovery, window_days,
+        group_col, neo_source)
 
     # Annual overlap: show all surveys with enough data, not just Venn selection.
     # Selected surveys are visible; others are hidden but toggleable via legend.
@@ -9540,14 +10473,12 @@ def update_comparison(year_range, size_filter, survey_select,
     selected_set = set(survey_select or [])
     ordered_surveys = ([s for s in all_surveys if s in selected_set]
                        + [s for s in all_surveys if s not in selected_set])
-    overlap_fig = _make_annual_overlap(
+    return _make_annual_overlap(
         df, df_apparition, ordered_surveys, year_range,
-        size_filter, exclude_precovery, venn_labels, t, height,
-        window_days, group_col, color_map,
+        size_filter, exclude_precovery, venn_labels, theme(theme_name),
+        int(plot_height), window_days, group_col, color_map,
         visible_surveys=selected_set)
 
-    return venn_fig, reach_fig, heatmap_fig, summary_fig, overlap_fig
-
 
 # ---------------------------------------------------------------------------
 # Station-level annual overlap — dropdown + chart
@@ -9564,7 +10495,7 @@ def update_station_dropdown(survey_select, current_value):
     opts = []
     suggested = []
     for proj in (survey_select or []):
-        stns = sorted(PROJECT_STATIONS.get(proj, []))
+        stns = PROJECT_STATIONS.get(proj, [])
         for stn in stns:
             name = STATION_NAMES.get(stn, stn)
             opts.append({"label": f"{stn} ({name})", "value": stn})
@@ -9635,6 +10566,38 @@ def update_station_overlap(station_select, year_range, size_filter,
 # Follow-up timing callback
 # ---------------------------------------------------------------------------
 
+# Finished follow-up figures per control state, and the follow-up
+# frames behind them per data selection (so theme, height and max-days
+# changes skip build_followup_data).  The network and trend figures do
+# not depend on max days, so they are cached apart from the response
+# curve and box plot and a max-days slider drag rebuilds only those two.
+# The data is loaded once per process, so entries never go stale.
+# Cleared when they fill up.
+_FOLLOWUP_FIG_CACHE = {}
+_FOLLOWUP_DATA_CACHE = {}
+_FOLLOWUP_FIG_CACHE_MAX = 128
+
+
+def _followup_data(year_range, size_filter, neo_source):
+    """(fu_data, total, first_fu) for the follow-up tab, cached per data
+    selection."""
+    data_key = (tuple(year_range), size_filter, neo_source)
+    fu_result = _FOLLOWUP_DATA_CACHE.get(data_key)
+    if fu_result is None:
+        df_view = _apply_source_filter(df, neo_source)
+        df_app_view = _apply_source_filter(df_apparition, neo_source)
+        fu_data, total = build_followup_data(
+            df_view, df_app_view, year_range, size_filter)
+        # The network and trend figures only use each NEO's first
+        # outside follow-up; select it once per data selection
+        first_fu = fu_data[fu_data["fu_rank"] == 1]
+        fu_result = (fu_data, total, first_fu)
+        if len(_FOLLOWUP_DATA_CACHE) >= _FOLLOWUP_FIG_CACHE_MAX:
+            _FOLLOWUP_DATA_CACHE.clear()
+        _FOLLOWUP_DATA_CACHE[data_key] = fu_result
+    return fu_result
+
+
 @app.callback(
     Output("response-curve", "figure"),
     Output("survey-response", "figure"),
@@ -9653,31 +10616,54 @@ def update_followup(year_range, size_filter, max_days, theme_name,
     if active_tab != "tab-followup" or df is None or df_apparition is None:
         raise PreventUpdate
 
+    state = (tuple(year_range), size_filter, theme_name, plot_height,
+             neo_source)
+    days_key = ("days", max_days) + state
+    first_key = ("first",) + state
+    days_figs = _FOLLOWUP_FIG_CACHE.get(days_key)
+    first_figs = _FOLLOWUP_FIG_CACHE.get(first_key)
+    if days_figs is not None and first_figs is not None:
+        return days_figs + first_figs
+
     t = theme(theme_name)
     height = int(plot_height)
-
-    df_view = _apply_source_filter(df, neo_source)
-    df_app_view = _apply_source_filter(df_apparition, neo_source)
-    fu_data, total = build_followup_data(
-        df_view, df_app_view, year_range, size_filter)
+    fu_data, total, first_fu = _followup_data(year_range, size_filter,
+                                              neo_source)
 
     if total == 0 or len(fu_data) == 0:
         empty = _empty_figure(
             "No follow-up data for selection", t, height)
-        return empty, empty, empty, empty
-
-    curve = _make_response_curve(fu_data, total, max_days, t, height)
-    boxes = _make_survey_response_box(fu_data, max_days, t, height)
-    network = _make_followup_network(fu_data, t, height)
-    trend = _make_followup_trend(fu_data, t, height)
+        days_figs = first_figs = (empty, empty)
+    else:
+        if days_figs is None:
+            days_figs = (
+                _make_response_curve(fu_data, total, max_days, t, height),
+                _make_survey_response_box(fu_data, max_days, t, height),
+            )
+        if first_figs is None:
+            first_figs = (
+                _make_followup_network(first_fu, t, height),
+                _make_followup_trend(first_fu, t, height),
+            )
 
-    return curve, boxes, network, trend
+    if len(_FOLLOWUP_FIG_CACHE) >= _FOLLOWUP_FIG_CACHE_MAX - 1:
+        _FOLLOWUP_FIG_CACHE.clear()
+    _FOLLOWUP_FIG_CACHE[days_key] = days_figs
+    _FOLLOWUP_FIG_CACHE[first_key] = first_figs
+    return days_figs + first_figs
 
 
 # ---------------------------------------------------------------------------
 # Discovery circumstances callback
 # ---------------------------------------------------------------------------
 
+# Finished circumstance figures per control state, as for the follow-up
+# tab: revisiting a selection (or toggling back to a theme) skips the
+# filtering and all five figure builds.  Cleared when it fills up.
+_CIRCUMSTANCES_FIG_CACHE = {}
+_CIRCUMSTANCES_FIG_CACHE_MAX = 64
+
+
 @app.callback(
     Output("sky-map", "figure"),
     Output("mag-distribution", "figure"),
@@ -9698,12 +10684,18 @@ def update_circumstances(year_range, size_filter, color_by, group_by,
     if active_tab != "tab-circumstances" or df is None:
         raise PreventUpdate
 
+    key = (tuple(year_range), size_filter, color_by, group_by,
+           theme_name, plot_height, neo_source)
+    cached = _CIRCUMSTANCES_FIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     t = theme(theme_name)
     height = int(plot_height)
     y0, y1 = year_range
 
     df_view = _apply_source_filter(df, neo_source)
-    filtered = df_view[(df_view["disc_year"] >= y0) & (df_view["disc_year"] <= y1)]
+    filtered = _year_slice(df_view, y0, y1)
     if size_filter != "all":
         filtered = filtered[filtered["size_class"] == size_filter]
 
@@ -9713,7 +10705,11 @@ def update_circumstances(year_range, size_filter, color_by, group_by,
     rate = _make_rate_plot(filtered, color_by, group_by, t, height)
     pa = _make_pa_rose(filtered, t, height)
 
-    return sky, mag, elong, rate, pa
+    result = (sky, mag, elong, rate, pa)
+    if len(_CIRCUMSTANCES_FIG_CACHE) >= _CIRCUMSTANCES_FIG_CACHE_MAX:
+        _CIRCUMSTANCES_FIG_CACHE.clear()
+    _CIRCUMSTANCES_FIG_CACHE[key] = result
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -11118,17 +12114,11 @@ def _build_obs_section(obs_text, open_default=False, section_id=None,
 
     props = {
         "open": open_default,
-        "style": {"marginBottom": "12px",
-                  "border": "1px solid var(--hr-color, #ccc)",
-                  "borderRadius": "6px"},
+        "style": SECTION_DETAILS_STYLE,
         "children": [
             html.Summary(
                 label,
-                style={"padding": "10px 14px", "cursor": "pointer",
-                       "fontFamily": "sans-serif", "fontWeight": "600",
-                       "fontSize": "14px",
-                       "backgroundColor": "var(--paper-bg, white)",
-                       "borderRadius": "6px"},
+                style=SECTION_SUMMARY_STYLE,
             ),
             html.Div(children=children, style=content_style),
         ],
@@ -11232,17 +12222,11 @@ def _build_observer_sections(observers_text, disc_stn, followup_stn=None,
     )
     props = {
         "open": open_default,
-        "style": {"marginBottom": "12px",
-                  "border": "1px solid var(--hr-color, #ccc)",
-                  "borderRadius": "6px"},
+        "style": SECTION_DETAILS_STYLE,
         "children": [
             html.Summary(
                 "Observer details",
-                style={"padding": "10px 14px", "cursor": "pointer",
-                       "fontFamily": "sans-serif", "fontWeight": "600",
-                       "fontSize": "14px",
-                       "backgroundColor": "var(--paper-bg, white)",
-                       "borderRadius": "6px"},
+                style=SECTION_SUMMARY_STYLE,
             ),
             content_div,
         ],
@@ -11325,17 +12309,11 @@ def _build_residuals_section(residuals_text, disc_stn, obs_text,
     )
     props = {
         "open": open_default,
-        "style": {"marginBottom": "12px",
-                  "border": "1px solid var(--hr-color, #ccc)",
-                  "borderRadius": "6px"},
+        "style": SECTION_DETAILS_STYLE,
         "children": [
             html.Summary(
                 "Residuals",
-                style={"padding": "10px 14px", "cursor": "pointer",
-                       "fontFamily": "sans-serif", "fontWeight": "600",
-                       "fontSize": "14px",
-                       "backgroundColor": "var(--paper-bg, white)",
-                       "borderRadius": "6px"},
+                style=SECTION_SUMMARY_STYLE,
             ),
             content_div,
         ],
@@ -11366,17 +12344,11 @@ def _mpec_section(title, content, open_default=False, mono=True,
 
     props = {
         "open": open_default,
-        "style": {"marginBottom": "12px",
-                  "border": "1px solid var(--hr-color, #ccc)",
-                  "borderRadius": "6px"},
+        "style": SECTION_DETAILS_STYLE,
         "children": [
             html.Summary(
                 title,
-                style={"padding": "10px 14px", "cursor": "pointer",
-                       "fontFamily": "sans-serif", "fontWeight": "600",
-                       "fontSize": "14px",
-                       "backgroundColor": "var(--paper-bg, white)",
-                       "borderRadius": "6px"},
+                style=SECTION_SUMMARY_STYLE,
             ),
             html.Div(content, style=content_style),
         ],
@@ -11677,17 +12649,11 @@ def _build_obs_timeline(ades_data, designation, chart_height=250):
     if not tracklets:
         return html.Details(
             open=False,
-            style={"marginBottom": "12px",
-                   "border": "1px solid var(--hr-color, #ccc)",
-                   "borderRadius": "6px"},
+            style=SECTION_DETAILS_STYLE,
             children=[
                 html.Summary(
                     f"Observation history — {designation}",
-                    style={"padding": "10px 14px", "cursor": "pointer",
-                           "fontFamily": "sans-serif", "fontWeight": "600",
-                           "fontSize": "14px",
-                           "backgroundColor": "var(--paper-bg, white)",
-                           "borderRadius": "6px"},
+                    style=SECTION_SUMMARY_STYLE,
                 ),
                 html.Div("No observation data available.",
                          style={"padding": "10px", "fontFamily": "sans-serif",
@@ -11861,17 +12827,11 @@ def _build_obs_timeline(ades_data, designation, chart_height=250):
 
     return html.Details(
         open=True,
-        style={"marginBottom": "12px",
-               "border": "1px solid var(--hr-color, #ccc)",
-               "borderRadius": "6px"},
+        style=SECTION_DETAILS_STYLE,
         children=[
             html.Summary(
                 f"Observation history — {designation}",
-                style={"padding": "10px 14px", "cursor": "pointer",
-                       "fontFamily": "sans-serif", "fontWeight": "600",
-                       "fontSize": "14px",
-                       "backgroundColor": "var(--paper-bg, white)",
-                       "borderRadius": "6px"},
+                style=SECTION_SUMMARY_STYLE,
             ),
             dcc.Graph(id="obs-timeline-graph", figure=fig,
                       config={"displayModeBar": "hover",
@@ -11970,17 +12930,11 @@ def update_obs_timeline(path, plot_height):
         # Non-NEO or fetch failed — collapsed section
         return html.Details(
             open=False,
-            style={"marginBottom": "12px",
-                   "border": "1px solid var(--hr-color, #ccc)",
-                   "borderRadius": "6px"},
+            style=SECTION_DETAILS_STYLE,
             children=[
                 html.Summary(
                     f"Observation history — {designation}",
-                    style={"padding": "10px 14px", "cursor": "pointer",
-                           "fontFamily": "sans-serif", "fontWeight": "600",
-                           "fontSize": "14px",
-                           "backgroundColor": "var(--paper-bg, white)",
-                           "borderRadius": "6px"},
+                    style=SECTION_SUMMARY_STYLE,
                 ),
                 html.Div("Not available (NEOs only, via NEOfixer).",
                          style={"padding": "10px", "fontFamily": "sans-serif",
@@ -12004,17 +12958,11 @@ def _obs_details_wrapper(site, designation, content, open_default=True):
     """Wrap observability content in a Details/Summary accordion."""
     return html.Details(
         open=open_default,
-        style={"marginBottom": "12px",
-               "border": "1px solid var(--hr-color, #ccc)",
-               "borderRadius": "6px"},
+        style=SECTION_DETAILS_STYLE,
         children=[
             html.Summary(
                 f"Current observability \u2014 {site} ({designation})",
-                style={"padding": "10px 14px", "cursor": "pointer",
-                       "fontFamily": "sans-serif", "fontWeight": "600",
-                       "fontSize": "14px",
-                       "backgroundColor": "var(--paper-bg, white)",
-                       "borderRadius": "6px"},
+                style=SECTION_SUMMARY_STYLE,
             ),
             content,
         ],
@@ -12314,8 +13262,8 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
     card_style = {
         "padding": "12px 18px",
         "borderRadius": "6px",
-        "backgroundColor": t["paper"],
-        "border": f"1px solid {t['hr_color']}",
+        "backgroundColor": t.paper,
+        "border": f"1px solid {t.hr_color}",
         "textAlign": "center",
         "minWidth": "120px",
     }
@@ -12332,7 +13280,7 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
                       style={"fontSize": "22px", "fontWeight": "700",
                              "lineHeight": "1.2"}),
             html.Div(label,
-                      style={"fontSize": "12px", "color": t["subtext"],
+                      style={"fontSize": "12px", "color": t.subtext,
                              "marginTop": "2px"}),
         ]))
 
@@ -12371,8 +13319,8 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
     tbl_fig = go.Figure(data=[go.Table(
         header=dict(
             values=[f"<b>{h}</b>" for h in header_vals],
-            fill_color=t["table_header"],
-            font=dict(color=t["table_font"], size=12,
+            fill_color=t.table_header,
+            font=dict(color=t.table_font, size=12,
                       family="sans-serif"),
             align=["left"] + ["right"] * 5,
             height=28,
@@ -12381,10 +13329,10 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
             values=cell_vals,
             fill_color=[
                 class_colors,
-                t["table_cell"], t["table_cell"],
-                t["table_cell"], t["table_cell"], t["table_cell"],
+                t.table_cell, t.table_cell,
+                t.table_cell, t.table_cell, t.table_cell,
             ],
-            font=dict(color=t["table_font"], size=11,
+            font=dict(color=t.table_font, size=11,
                       family="sans-serif"),
             align=["left"] + ["right"] * 5,
             height=24,
@@ -12393,8 +13341,8 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
     n_rows = len(counts)
     tbl_height = max(200, 28 + n_rows * 24 + 30)
     tbl_fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
+        template=t.template,
+        paper_bgcolor=t.paper,
         margin=dict(l=10, r=10, t=30, b=10),
         height=tbl_height,
         title=dict(
@@ -12430,9 +13378,9 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
             opacity=0.85,
         ))
     h_fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
-        plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper,
+        plot_bgcolor=t.plot,
         barmode="stack",
         xaxis_title="H magnitude",
         yaxis_title="Objects",
@@ -12459,9 +13407,9 @@ def update_boxscore(grouping, filters, h_range, theme_name, active_tab):
             opacity=0.85,
         ))
     a_fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"],
-        plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper,
+        plot_bgcolor=t.plot,
         barmode="stack",
         xaxis_title="Semi-major axis (AU)",
         yaxis_title="Objects",
@@ -12902,7 +13850,7 @@ def update_obshist_plot(selected_rows, theme_name, active_tab,
         return (go.Figure(), f"No obs_sbn rows for {label}.",
                 no_update, details, vslider_hidden, vslider_reset)
 
-    theme_dict = theme(theme_name)
+    theme_dict = asdict(theme(theme_name))
     fig = build_history_figure(
         df, name=label, height=900, theme=theme_dict,
         with_controls=False)
@@ -12981,7 +13929,7 @@ def reorder_obshist_sites_on_range(relayout_data, plot_state,
     label = " — ".join(label_bits) if label_bits else "?"
 
     from lib.observation_history import build_history_figure
-    theme_dict = theme(theme_name)
+    theme_dict = asdict(theme(theme_name))
     fig = build_history_figure(
         df_win, name=label, height=900, theme=theme_dict,
         with_controls=False)
@@ -13036,7 +13984,7 @@ def reset_obshist_plot(n_clicks, plot_state, theme_name, active_tab):
         label_bits.append(f"permid {permid}")
     label = " — ".join(label_bits) if label_bits else "?"
     from lib.observation_history import build_history_figure
-    theme_dict = theme(theme_name)
+    theme_dict = asdict(theme(theme_name))
     fig = build_history_figure(
         df, name=label, height=900, theme=theme_dict,
         with_controls=False)
@@ -13459,7 +14407,7 @@ def update_finding_chart(plot_state, projection, overlays, vmag_value,
     t = theme(theme_name)
     if theme_name == "dark":
         theme_dict = {
-            "fg": t["text"], "plot": t["plot"],
+            "fg": t.text, "plot": t.plot,
             "grid": "rgba(180,190,220,0.45)",
             "boundary": "rgba(220,225,240,0.85)",
             "constellation": "rgba(130,150,210,0.50)",
@@ -13467,7 +14415,7 @@ def update_finding_chart(plot_state, projection, overlays, vmag_value,
         }
     else:
         theme_dict = {
-            "fg": t["text"], "plot": t["plot"],
+            "fg": t.text, "plot": t.plot,
             "grid": "rgba(60,70,110,0.40)",
             "boundary": "rgba(40,50,80,0.85)",
             "constellation": "rgba(60,90,170,0.55)",
@@ -13797,7 +14745,7 @@ def tool_pack(value):
         ])
     except Exception as exc:
         return html.Span(f"Error: {exc}",
-                          style={"color": "#c0392b", "fontSize": "12px"})
+                          style=ERROR_TEXT_STYLE)
 
 
 @app.callback(
@@ -13815,7 +14763,7 @@ def tool_unpack(value):
                          style={"fontSize": "14px", "fontWeight": "600"})
     except Exception as exc:
         return html.Span(f"Error: {exc}",
-                          style={"color": "#c0392b", "fontSize": "12px"})
+                          style=ERROR_TEXT_STYLE)
 
 
 @app.callback(
@@ -13832,7 +14780,7 @@ def tool_validate(value):
         fmt = detect_format(s)
     except Exception as exc:
         return html.Span(f"Not recognized: {exc}",
-                          style={"color": "#c0392b", "fontSize": "12px"})
+                          style=ERROR_TEXT_STYLE)
     valid = is_valid_designation(s)
     items = []
     items.append(html.Span(
@@ -14022,7 +14970,7 @@ def tool_tisserand(a, e, i_deg):
         return ""
     if a <= 0 or e < 0 or e >= 1:
         return html.Span("Invalid elements (need a > 0, 0 \u2264 e < 1)",
-                          style={"color": "#c0392b", "fontSize": "12px"})
+                          style=ERROR_TEXT_STYLE)
     from lib.orbit_classes import tisserand_jupiter
     tj = tisserand_jupiter(a, e, i_deg)
     # Classify based on Tisserand
@@ -14099,7 +15047,7 @@ def tool_orbit_class(a, e, i_deg, q):
     if e < 0:
         return html.Span(
             "Invalid eccentricity (need e \u2265 0)",
-            style={"color": "#c0392b", "fontSize": "12px"},
+            style=ERROR_TEXT_STYLE,
         ), clear_a, clear_e, clear_q
 
     # Hyperbolic/parabolic: only need q and e
@@ -14151,10 +15099,10 @@ def tool_obs80(value):
         fields = parse_obs80(value)
     except Exception as exc:
         return html.Span(f"Parse error: {exc}",
-                          style={"color": "#c0392b", "fontSize": "12px"})
+                          style=ERROR_TEXT_STYLE)
     if not fields:
         return html.Span("Could not parse line",
-                          style={"color": "#c0392b", "fontSize": "12px"})
+                          style=ERROR_TEXT_STYLE)
     # Format as key-value pairs
     _kv_style = {"fontSize": "12px", "marginRight": "12px",
                  "whiteSpace": "nowrap"}
@@ -14211,7 +15159,7 @@ def tool_date(value):
             ])
         except Exception as exc:
             return html.Span(f"Error: {exc}",
-                              style={"color": "#c0392b", "fontSize": "12px"})
+                              style=ERROR_TEXT_STYLE)
 
     # --- Pure numeric: MJD or JD ---
     try:
@@ -14301,8 +15249,7 @@ def tool_airmass(x_val, alt_val):
             x = float(x_val)
             if x < 1.0:
                 return html.Span("Airmass must be \u2265 1.0",
-                                  style={"color": "#c0392b",
-                                         "fontSize": "12px"}), \
+                                  style=ERROR_TEXT_STYLE), \
                     no_update, no_update
             alt_deg = math.degrees(math.asin(1.0 / x))
             msg = html.Span([
@@ -14313,8 +15260,7 @@ def tool_airmass(x_val, alt_val):
             return msg, no_update, None
         except (ValueError, ZeroDivisionError):
             return html.Span("Invalid airmass",
-                              style={"color": "#c0392b",
-                                     "fontSize": "12px"}), \
+                              style=ERROR_TEXT_STYLE), \
                 no_update, no_update
 
     if "tool-airmass-alt" in triggered:
@@ -14324,8 +15270,7 @@ def tool_airmass(x_val, alt_val):
             alt = float(alt_val)
             if alt <= 0 or alt > 90:
                 return html.Span("Altitude must be 0\u00b0 < alt \u2264 90\u00b0",
-                                  style={"color": "#c0392b",
-                                         "fontSize": "12px"}), \
+                                  style=ERROR_TEXT_STYLE), \
                     no_update, no_update
             alt_rad = math.radians(alt)
             if alt >= 10:
@@ -14346,8 +15291,7 @@ def tool_airmass(x_val, alt_val):
             return msg, None, no_update
         except ValueError:
             return html.Span("Invalid altitude",
-                              style={"color": "#c0392b",
-                                     "fontSize": "12px"}), \
+                              style=ERROR_TEXT_STYLE), \
                 no_update, no_update
 
     raise PreventUpdate
@@ -14457,23 +15401,113 @@ _DISCOVERY_EXPORT_COLS = [
 ]
 
 
-@app.callback(
-    Output("download-discovery", "data"),
-    Input("btn-download-discovery", "n_clicks"),
-    State("year-range", "value"),
-    State("size-filter", "value"),
-    prevent_initial_call=True,
-)
-def download_discovery(n_clicks, year_range, size_filter):
-    if not n_clicks or df is None:
-        raise PreventUpdate
-    y0, y1 = year_range
-    filtered = df[(df["disc_year"] >= y0) & (df["disc_year"] <= y1)]
-    if size_filter not in ("all", "split"):
+# The per-NEO exports run to tens of thousands of rows.  Through
+# dcc.Download they were built as one CSV string, embedded in the
+# callback response and decoded again in the browser; these Flask routes
+# stream them instead, _CSV_CHUNK_ROWS rows at a time, and the buttons
+# simply navigate to them (clientside, below).
+_CSV_CHUNK_ROWS = 10_000
+_DOWNLOAD_ROUTE = app.config.routes_pathname_prefix + "download/"
+
+
+def _csv_stream(frame):
+    """Yield *frame* as CSV text: the header, then chunks of rows."""
+    yield frame.iloc[:0].to_csv(index=False)
+    for start in range(0, len(frame), _CSV_CHUNK_ROWS):
+        yield frame.iloc[start:start + _CSV_CHUNK_ROWS].to_csv(
+            index=False, header=False)
+
+
+def _gzip_stream(chunks):
+    """Gzip-compress a stream of text chunks as they are produced."""
+    # wbits=31 writes the gzip header and trailer around the deflate data
+    z = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = z.compress(chunk.encode())
+        if data:
+            yield data
+    yield z.flush()
+
+
+def _csv_download_response(frame, filename):
+    """Stream *frame* as a CSV attachment, gzip-encoded for clients that
+    accept it: the repetitive designation and station columns compress
+    several-fold, which is most of the transfer time."""
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"',
+               "Vary": "Accept-Encoding"}
+    body = _csv_stream(frame)
+    if request.accept_encodings["gzip"] > 0:
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_stream(body)
+    return Response(body, mimetype="text/csv", headers=headers)
+
+
+def _export_selection(unfiltered_sizes):
+    """Discoveries selected by the y0/y1/size query arguments.  Size
+    values in *unfiltered_sizes* mean no size filtering."""
+    y0 = request.args.get("y0", year_min, type=int)
+    y1 = request.args.get("y1", year_max, type=int)
+    size_filter = request.args.get("size", "all")
+    filtered = _year_slice(df, y0, y1)
+    if size_filter not in unfiltered_sizes:
         filtered = filtered[filtered["size_class"] == size_filter]
     cols = [c for c in _DISCOVERY_EXPORT_COLS if c in filtered.columns]
-    return send_data_frame(
-        filtered[cols].to_csv, "neo_discoveries.csv", index=False)
+    return filtered[cols]
+
+
+def _data_loading_response():
+    return Response("Data is still loading; try again shortly.",
+                    status=503, mimetype="text/plain")
+
+
+@server.route(_DOWNLOAD_ROUTE + "neo_discoveries.csv")
+def download_discovery():
+    if df is None:
+        return _data_loading_response()
+    return _csv_download_response(
+        _export_selection(("all", "split")), "neo_discoveries.csv")
+
+
+@server.route(_DOWNLOAD_ROUTE + "neo_discovery_circumstances.csv")
+def download_circumstances():
+    if df is None:
+        return _data_loading_response()
+    return _csv_download_response(
+        _export_selection(("all",)), "neo_discovery_circumstances.csv")
+
+
+def _register_csv_link(button_id, filename, year_range_id, size_filter_id):
+    """Point *button_id* at the streamed export for the current year
+    range and size filter."""
+    app.clientside_callback(
+        """
+        function(nClicks, yearRange, sizeFilter) {
+            if (!nClicks) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            var query = new URLSearchParams({
+                y0: yearRange[0], y1: yearRange[1], size: sizeFilter});
+            var link = document.createElement("a");
+            link.href = %s + "?" + query.toString();
+            link.download = %s;
+            document.body.appendChild(link);
+            link.click();
+            link.remove();
+        }
+        """ % (json.dumps(app.get_relative_path("/download/" + filename)),
+               json.dumps(filename)),
+        Input(button_id, "n_clicks"),
+        State(year_range_id, "value"),
+        State(size_filter_id, "value"),
+        prevent_initial_call=True,
+    )
+
+
+_register_csv_link("btn-download-discovery", "neo_discoveries.csv",
+                   "year-range", "size-filter")
+_register_csv_link("btn-download-circumstances",
+                   "neo_discovery_circumstances.csv",
+                   "circ-year-range", "circ-size-filter")
 
 
 @app.callback(
@@ -14486,29 +15520,18 @@ def download_discovery(n_clicks, year_range, size_filter):
 def download_neomod(n_clicks, h_year_range, h_range):
     if not n_clicks or df is None:
         raise PreventUpdate
-    hy0, hy1 = h_year_range
     h_lo = round(h_range[0] * 4) / 4
     h_hi = round(h_range[1] * 4) / 4
-    filtered = df[(df["disc_year"] >= hy0) & (df["disc_year"] <= hy1)]
-    valid = filtered[
-        (filtered["h_bin_idx"] >= 0)
-        & (filtered["h_bin_idx"] < len(H_BIN_CENTERS))
-    ].copy()
-    valid["h_bin_center"] = H_BIN_CENTERS[valid["h_bin_idx"]]
-    valid = valid[
-        (valid["h_bin_center"] >= h_lo) & (valid["h_bin_center"] <= h_hi)]
     # Build per-bin summary with NEOMOD3 comparison
-    bin_counts = valid.groupby("h_bin_idx").size()
+    bin_counts = _h_bin_counts(df, h_year_range)
+    bins = _h_bin_slice(h_lo, h_hi)
     rows = []
-    for idx in range(len(H_BIN_CENTERS)):
-        center = H_BIN_CENTERS[idx]
-        if center < h_lo or center > h_hi:
-            continue
-        discovered = int(bin_counts.get(idx, 0))
-        neomod_row = NEOMOD3_DF[
-            (NEOMOD3_DF["h_center"] - center).abs() < 0.01]
-        if len(neomod_row):
-            nr = neomod_row.iloc[0]
+    for idx in range(bins.start, bins.stop):
+        nm_pos = _H_TO_NM.get(idx)
+        if nm_pos is not None:
+            center = H_BIN_CENTERS[idx]
+            discovered = int(bin_counts[idx])
+            nr = NEOMOD3_DF.iloc[nm_pos]
             rows.append({
                 "h_bin": f"{nr['h1']:.2f}-{nr['h2']:.2f}",
                 "h_center": center,
@@ -14587,25 +15610,6 @@ def download_followup(n_clicks, year_range, size_filter):
         fu_data.to_csv, "neo_followup_timing.csv", index=False)
 
 
-@app.callback(
-    Output("download-circumstances", "data"),
-    Input("btn-download-circumstances", "n_clicks"),
-    State("circ-year-range", "value"),
-    State("circ-size-filter", "value"),
-    prevent_initial_call=True,
-)
-def download_circumstances(n_clicks, year_range, size_filter):
-    if not n_clicks or df is None:
-        raise PreventUpdate
-    y0, y1 = year_range
-    filtered = df[(df["disc_year"] >= y0) & (df["disc_year"] <= y1)]
-    if size_filter != "all":
-        filtered = filtered[filtered["size_class"] == size_filter]
-    cols = [c for c in _DISCOVERY_EXPORT_COLS if c in filtered.columns]
-    return send_data_frame(
-        filtered[cols].to_csv, "neo_discovery_circumstances.csv", index=False)
-
-
 # ---------------------------------------------------------------------------
 # Enforce max 3 surveys for Venn
 # ---------------------------------------------------------------------------
@@ -14635,7 +15639,7 @@ def _station_dropdown_options():
                  "disabled": True})
     # Follow-up and grouped categories
     for proj in ("Catalina Follow-up",):
-        for stn in sorted(PROJECT_STATIONS.get(proj, [])):
+        for stn in PROJECT_STATIONS.get(proj, []):
             name = STATION_NAMES.get(stn, stn)
             opts.append({"label": f"{stn} ({name} \u2014 {proj})",
                          "value": stn})
@@ -16874,18 +17878,17 @@ def _fuc_counts_apparition(year_range, window_days, precovery_mode,
     """Discovery-apparition counts from the apparition cache."""
     if df_apparition is None:
         return pd.DataFrame(columns=["station_code", "n_followup"])
-    y0, y1 = year_range
-    eligible = df[(df["disc_year"] >= y0) & (df["disc_year"] <= y1)]
-    disc_station = eligible.set_index("designation")["station_code"]
+    mask = _eligible_mask(df, year_range)
+    disc_station = _disc_info_index(df)["station_code"][mask]
     app = df_apparition[
-        df_apparition["designation"].isin(disc_station.index)].copy()
+        _designation_mask(df_apparition, df, mask)].copy()
     app["disc_station"] = app["designation"].map(disc_station)
     fu = app[app["station_code"] != app["disc_station"]]
 
     if metric in ("tracklets", "observations"):
         col = _fuc_metric_column(window_days, precovery_mode, metric)
         if col in fu.columns:
-            counts = (fu.groupby("station_code")[col].sum()
+            counts = (fu.groupby("station_code", observed=True)[col].sum()
                       .reset_index(name="n_followup"))
             return counts[counts["n_followup"] > 0]
 
@@ -16898,8 +17901,8 @@ def _fuc_counts_apparition(year_range, window_days, precovery_mode,
     else:
         fu = fu[fu["post_disc_days"].between(0, w)]
 
-    return (fu.groupby("station_code")["designation"].nunique()
-            .reset_index(name="n_followup"))
+    return (fu.groupby("station_code", observed=True)["designation"]
+            .nunique().reset_index(name="n_followup"))
 
 
 def _fuc_counts_lifetime(year_range, metric, recovery_only):
@@ -16912,9 +17915,8 @@ def _fuc_counts_lifetime(year_range, metric, recovery_only):
     last_obs > disc + 200d."""
     if df_lifetime is None:
         return pd.DataFrame(columns=["station_code", "n_followup"])
-    y0, y1 = year_range
-    eligible = df[(df["disc_year"] >= y0) & (df["disc_year"] <= y1)]
-    disc_station = eligible.set_index("designation")["station_code"]
+    disc_station = _disc_info_index(df)["station_code"][
+        _eligible_mask(df, year_range)]
     life = df_lifetime[
         df_lifetime["designation"].isin(disc_station.index)].copy()
     life["disc_station"] = life["designation"].map(disc_station)
@@ -16940,26 +17942,28 @@ def _fuc_counts_lifetime(year_range, metric, recovery_only):
                 fu[ap_col] = fu[ap_col].fillna(0)
                 fu["recovery_metric"] = fu[tot_col] - fu[ap_col]
                 fu = fu[fu["recovery_metric"] > 0]
-                counts = (fu.groupby("station_code")["recovery_metric"]
-                          .sum().reset_index(name="n_followup"))
+                counts = (fu.groupby("station_code", observed=True)
+                          ["recovery_metric"].sum()
+                          .reset_index(name="n_followup"))
                 return counts
             # Fallback: use total (over-counts apparition contributions)
-            counts = (fu.groupby("station_code")[tot_col]
+            counts = (fu.groupby("station_code", observed=True)[tot_col]
                       .sum().reset_index(name="n_followup"))
             return counts
         # NEOs in recovery-only: distinct designations per station
-        return (fu.groupby("station_code")["designation"].nunique()
-                .reset_index(name="n_followup"))
+        return (fu.groupby("station_code", observed=True)["designation"]
+                .nunique().reset_index(name="n_followup"))
 
     # All time
     if metric == "tracklets":
-        return (fu.groupby("station_code")["n_tracklets_total"]
-                .sum().reset_index(name="n_followup"))
+        return (fu.groupby("station_code", observed=True)
+                ["n_tracklets_total"].sum()
+                .reset_index(name="n_followup"))
     if metric == "observations":
-        return (fu.groupby("station_code")["n_obs_total"]
+        return (fu.groupby("station_code", observed=True)["n_obs_total"]
                 .sum().reset_index(name="n_followup"))
-    return (fu.groupby("station_code")["designation"].nunique()
-            .reset_index(name="n_followup"))
+    return (fu.groupby("station_code", observed=True)["designation"]
+            .nunique().reset_index(name="n_followup"))
 
 
 @app.callback(
@@ -17056,7 +18060,7 @@ def _fuc_render_map(year_range, window_days, precovery_mode, metric,
     }.get(time_scope or "apparition",
           f"window {_window_label(window_days)}")
 
-    bg = t["plot"]
+    bg = t.plot
     land = "#2a2a2a" if theme_name == "dark" else "#f0f0f0"
     coast = "#666" if theme_name == "dark" else "#999"
 
@@ -17153,8 +18157,8 @@ def _fuc_render_map(year_range, window_days, precovery_mode, metric,
     pmode_label = ("post-discovery" if precovery_mode == "post_only"
                    else "post + precoveries")
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=bg,
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=bg,
         height=height,
         # uirevision tied to projection only — changing year/window/
         # precovery/type/scale preserves zoom & pan; changing
@@ -17278,7 +18282,7 @@ def _fuc_render_stats(year_range, window_days, precovery_mode, metric,
         viewport_obs[["obscode"]], left_on="station_code",
         right_on="obscode", how="inner")
     y0, y1 = year_range
-    eligible = df[(df["disc_year"] >= y0) & (df["disc_year"] <= y1)]
+    eligible = _year_slice(df, y0, y1)
     n_neos = int(len(eligible))
 
     if not counts_typed.empty:
@@ -17416,12 +18420,8 @@ def _fuc_default_plot_height(active_tab):
 )
 def _fuc_scope_gates(time_scope):
     is_apparition = (time_scope or "apparition") == "apparition"
-    pre_opts = [
-        {"label": " Post-discovery", "value": "post_only",
-         "disabled": not is_apparition},
-        {"label": " Include precoveries", "value": "include",
-         "disabled": not is_apparition},
-    ]
+    pre_opts = [{**opt, "disabled": not is_apparition}
+                for opt in _PRECOVERY_OPTIONS]
     return (not is_apparition), pre_opts
 
 
@@ -17582,8 +18582,8 @@ def _fuc_render_bar(year_range, window_days, precovery_mode, metric,
         hovertemplate="%{text}<extra></extra>",
     ))
     fig.update_layout(
-        template=t["template"],
-        paper_bgcolor=t["paper"], plot_bgcolor=t["plot"],
+        template=t.template,
+        paper_bgcolor=t.paper, plot_bgcolor=t.plot,
         height=height,
         # Generous left margin minimum for ~32-char labels; right
         # margin matches the map's so the two charts visually align
@@ -17645,6 +18645,42 @@ def _fuc_download(_n, year_range, window_days, precovery_mode, metric,
     return send_data_frame(merged.to_csv, fname, index=False)
 
 
+# ---------------------------------------------------------------------------
+# Cache warming — default-view aggregates, built once the data is loaded
+# ---------------------------------------------------------------------------
+
+def _warm_default_caches():
+    """Build the theme-independent aggregates behind each tab's default
+    view as soon as the background load finishes, so a visitor's first
+    callbacks on those tabs hit the caches instead of paying for the
+    groupbys.  Figures themselves still depend on theme and height and
+    are left to the callbacks."""
+    _data_ready.wait()
+    if _data_error or df is None or df_apparition is None:
+        return
+    d = _get_defaults()
+    source = d["neo-source-filter"]
+    try:
+        _discovery_bar_traces(d["year-range"], d["group-by"],
+                              d["size-filter"], d["cumulative-toggle"],
+                              source)
+        _station_year_counts(source, d["size-filter"])
+        _year_h_hist(df, source)
+        exclude_precovery, window_days, group_col, _ = _comparison_params(
+            d["comp-precovery"], d["comp-window"], d["comp-group-mode"])
+        _comparison_data(d["comp-year-range"], d["comp-size-filter"],
+                         exclude_precovery, window_days, group_col, source)
+        _followup_data(d["fu-year-range"], d["fu-size-filter"], source)
+    except Exception as e:
+        print(f"Warning: cache warming stopped: {e}")
+    else:
+        print("Default-view caches warm.")
+
+
+# Started here, after every function it calls is defined
+threading.Thread(target=_warm_default_caches, daemon=True).start()
+
+
 # ---------------------------------------------------------------------------
 # Run
 # ---------------------------------------------------------------------------
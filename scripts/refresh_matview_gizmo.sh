@@ -232,7 +232,8 @@ fi
 #
 # Match pattern is .*_????????.parquet — eight chars between `_` and
 # `.parquet` enforces the 8-hex-char hash suffix that every cache
-# produced by _load_cached_query() carries (md5(...).hexdigest()[:8]).
+# produced by _load_cached_query() carries (_sql_hash(): a BLAKE2b
+# digest of the SQL with digest_size=4).
 # That intentionally excludes hashless one-off analysis outputs like
 # `.sbdb_classification.parquet`, which must not be swept.
 if [[ -n "$TOUCHFILE" ]] && [[ -e "$TOUCHFILE" ]]; then
@@ -0,0 +1,129 @@
+"""Tests for COPY-based query loading (lib/db.py timed_copy_query).
+
+Uses a fake connection whose cursor reports PostgreSQL column type OIDs
+through `description` and writes CSV the way COPY ... TO STDOUT does:
+NULL as an unquoted empty field, an empty string as "", booleans as
+t/f.  No database is needed.
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.db import query_log, timed_copy_query
+
+
+# PostgreSQL type OIDs used in the fake result descriptions
+BOOL, INT4, FLOAT8, TEXT, VARCHAR = 16, 23, 701, 25, 1043
+
+
+class FakeCursor:
+    def __init__(self, columns, csv_text):
+        self._columns = columns
+        self._csv_text = csv_text
+        self.description = None
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        self.description = [(name, oid) + (None,) * 5
+                            for name, oid in self._columns]
+
+    def copy_expert(self, sql, file):
+        self.statements.append(sql)
+        file.write(self._csv_text.encode())
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, columns, csv_text):
+        self.cur = FakeCursor(columns, csv_text)
+
+    def cursor(self):
+        return self.cur
+
+
+def _run(columns, csv_text, sql="SELECT 1", label="test"):
+    conn = FakeConnection(columns, csv_text)
+    return timed_copy_query(conn, sql, label=label), conn.cur
+
+
+# ============================================================================
+# Column types
+# ============================================================================
+
+class TestColumnTypes:
+    """Text OIDs stay strings; other columns are inferred by pyarrow."""
+
+    def test_numeric_looking_text_stays_string(self):
+        df, _ = _run([("desig", TEXT), ("code", VARCHAR)],
+                     "desig,code\n12345,095\n2024 AB,703\n")
+        assert df["desig"].tolist() == ["12345", "2024 AB"]
+        assert df["code"].tolist() == ["095", "703"]
+
+    def test_numeric_columns_inferred(self):
+        df, _ = _run([("n", INT4), ("h", FLOAT8)],
+                     "n,h\n1,17.5\n2,22.25\n")
+        assert df["n"].tolist() == [1, 2]
+        assert df["h"].tolist() == [17.5, 22.25]
+
+    def test_booleans_from_t_f(self):
+        df, _ = _run([("flag", BOOL)], "flag\nt\nf\nt\n")
+        assert df["flag"].dtype == bool
+        assert df["flag"].tolist() == [True, False, True]
+
+    def test_boolean_null(self):
+        df, _ = _run([("flag", BOOL)], "flag\nt\n\nf\n")
+        assert df["flag"].iloc[0] == True  # noqa: E712
+        assert df["flag"].isna().tolist() == [False, True, False]
+        assert df["flag"].iloc[2] == False  # noqa: E712
+
+
+# ============================================================================
+# NULL vs empty string
+# ============================================================================
+
+class TestNulls:
+    """COPY distinguishes NULL (unquoted empty) from '' (quoted)."""
+
+    def test_quoted_empty_string_preserved(self):
+        df, _ = _run([("s", TEXT)], 's\n""\n\nx\n')
+        assert df["s"].iloc[0] == ""
+        assert df["s"].isna().tolist() == [False, True, False]
+        assert df["s"].iloc[2] == "x"
+
+    def test_text_null_beside_other_columns(self):
+        df, _ = _run([("s", TEXT), ("n", INT4)], 's,n\n"",1\n,2\nx,3\n')
+        assert df["s"].iloc[0] == ""
+        assert df["s"].isna().tolist() == [False, True, False]
+        assert df["n"].tolist() == [1, 2, 3]
+
+    def test_numeric_null(self):
+        df, _ = _run([("h", FLOAT8)], "h\n17.5\n\n")
+        assert df["h"].isna().tolist() == [False, True]
+
+
+# ============================================================================
+# Statements and logging
+# ============================================================================
+
+class TestStatements:
+
+    def test_copy_wraps_query_without_semicolon(self):
+        _, cur = _run([("n", INT4)], "n\n1\n", sql="SELECT 1 AS n;\n")
+        assert cur.statements[0].endswith("LIMIT 0")
+        assert cur.statements[1].startswith("COPY (\nSELECT 1 AS n\n)")
+        assert ";" not in cur.statements[1]
+
+    def test_logged_with_row_count(self):
+        n_before = len(query_log.records)
+        _run([("n", INT4)], "n\n1\n2\n3\n", label="copy-test")
+        rec = query_log.records[-1]
+        assert len(query_log.records) == n_before + 1
+        assert rec.label == "copy-test"
+        assert rec.row_count == 3
+        assert rec.params is None